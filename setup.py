@@ -83,6 +83,7 @@ extras_require = {
         "mkdocstrings[python]",
         "pymdown-extensions",
     ],
+    "highlight": ["Pygments"],
 }
 extras_require["all"] = list(
     {rq for target in extras_require.keys() for rq in extras_require[target]}
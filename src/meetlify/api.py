@@ -35,16 +35,26 @@ SOFTWARE.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import io
+import os
+import json
 import shutil
+import asyncio
 import logging
+from functools import partial
+from threading import Event
+from time import perf_counter
+from typing import AsyncIterator, Callable, Self
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from datetime import datetime, timedelta
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # 3rd PARTY LIBRARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemLoader
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -52,14 +62,39 @@ from jinja2 import Environment, FileSystemLoader
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from .configs import Configs
+from .context import SiteContext
 from .posts import Posts
 from .categories import Categories
 from .pages import Pages
 from .meetups import Meetups
 from .sitemaps import Sitemaps
-from .redirects import Redirects
+from .redirects import Redirects, FORMATS
 from .robots import Robots
-from .constants import STATUS
+from .feeds import Feeds
+from .calendars import Calendars
+from .search import SearchIndex
+from .related import RelatedIndex
+from .pagination import Paginator
+from .store import ContentStore
+from .manifest import Manifest, fingerprint
+from .shards import Shard
+from .changes import ChangeSet
+from .plan import Plan
+from .writer import OutputWriter
+from .highlight import CodeHighlighter
+from .snippets import SnippetLibrary
+from .slugs import SlugRegistry
+from .progress import Progress
+from .targets import DirectoryTarget, OutputTarget
+from .templates import TemplateAnalyzer
+from .reproducible import (
+    DATES,
+    build_time,
+    content_dates,
+    git_dates,
+)
+from .constants import STATUS, CACHE_FOLDER
+from .utils import MarkdownConvertor
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -68,25 +103,147 @@ from .constants import STATUS
 logging.getLogger("meetlify").addHandler(logging.NullHandler())
 
 
+class BuildCancelled(Exception):
+    """Raised in a build thread once its build was cancelled"""
+
+
 class Meetlify:
     """Meetlify Static Site Generator for Meetups"""
 
-    def __init__(self, dest_: Path) -> None:
+    def __init__(
+        self,
+        dest_: Path,
+        jobs_: int | None = None,
+        store_: bool | None = None,
+        bytecode_cache_: BytecodeCache | None = None,
+        shard_: Shard | None = None,
+        since_: str | None = None,
+        dates_: str | None = None,
+        target_: OutputTarget | None = None,
+        plan_: bool = False,
+    ) -> None:
         assert isinstance(dest_, Path)
 
         self.dest = dest_
+        # only plan a build, nothing is saved (caches, store, manifest, redirects)
+        self.dry_run = plan_
+        self.jobs = jobs_ or os.cpu_count()
+        self.timings = {}
+        self.shard = shard_
+        self.rendered = set()
+        self.skipped = []
+        self.plan = None
+        self.listeners: list[Callable[[dict], None]] = []  # build event callbacks
+        self.cancelled = Event()
+        self.progress = Progress(emit_=self.emit)
         self.src = Path(__file__).resolve().parent
         self.configs = Configs.from_json(Path(self.dest, "configs.json"))
 
-        self.renderer = Environment(
-            loader=FileSystemLoader(
-                Path(
-                    self.dest,
-                    self.configs.folders.themes,
-                    self.configs.theme,
-                    "templates",
-                )
+        content = self.configs.folders.content
+        theme = f"{self.configs.folders.themes}/{self.configs.theme}"
+        snippets = f"{content}/{self.configs.folders.snippets}"
+        # inputs of build phases which are skipped if none of them changed
+        self.phase_inputs = {
+            "render_meetup_pages": [
+                f"{content}/{self.configs.folders.meetups}",
+                snippets,
+            ],
+            "render_post_pages": [f"{content}/{self.configs.folders.posts}", snippets],
+            "render_pages": [f"{content}/{self.configs.folders.pages}", snippets],
+            "render_search": [content],
+            "copy_assests": [f"{content}/{self.configs.folders.images}", theme],
+        }
+
+        # files changed since a git revision drive re-parsing and re-rendering
+        self.changes = (
+            ChangeSet.from_git(
+                self.dest,
+                since_,
+                [content, theme, "configs.json", "redirects.json", "robots.json"],
             )
+            if since_
+            else None
+        )
+        if self.changes is not None:
+            logging.info("... %d files changed since %s", len(self.changes), since_)
+            if self.changes.touches(f"{theme}/templates", "configs.json"):
+                self.phase_inputs = {}
+
+        # stable last modified dates instead of file modification times
+        dates = dates_ or self.configs.dates
+        assert dates in DATES, f"unknown dates source '{dates}'"
+        self.dates = {}  # absolute file path -> last modified date
+        if dates == "git":
+            self.dates = git_dates(self.dest, content)
+        elif dates == "content":
+            self.dates = content_dates(
+                self.dest,
+                content,
+                Path(self.dest, CACHE_FOLDER, "dates.json"),
+                save_=not self.dry_run,
+            )
+
+        # highlighted code blocks are cached across documents and builds
+        self.highlighter = CodeHighlighter(
+            style_=self.configs.highlight,
+            json_file_=Path(self.dest, CACHE_FOLDER, "highlight.json"),
+        )
+        # snippets included into content files with shortcodes
+        self.snippets = SnippetLibrary(folder_=Path(self.dest, snippets))
+        self.convertor = MarkdownConvertor(
+            highlighter_=self.highlighter, snippets_=self.snippets
+        )
+
+        # optional SQLite backend for the content collections
+        self.store = (
+            ContentStore(
+                db_file_=Path(self.dest, CACHE_FOLDER, "content.db"),
+                changed_=(
+                    {Path(self.dest, path) for path in self.changes.present}
+                    if self.changes is not None
+                    else None
+                ),
+                convertor_=self.convertor,
+                dry_run_=self.dry_run,
+            )
+            if (
+                (self.configs.store or self.changes is not None)
+                if store_ is None
+                else store_
+            )
+            else None
+        )
+
+        templates_folder = Path(
+            self.dest,
+            self.configs.folders.themes,
+            self.configs.theme,
+            "templates",
+        )
+        self.renderer = Environment(
+            loader=FileSystemLoader(templates_folder), bytecode_cache=bytecode_cache_
+        )
+
+        # template graph, digests of templates and render statistics
+        self.templates = TemplateAnalyzer(self.renderer)
+
+        # any change in configs or theme invalidates all rendered html pages
+        self.configs_digest = fingerprint(self.configs)
+
+        # shards render their detail pages into an own output subtree
+        if self.shard is not None:
+            self.configs.folders.output = self.shard.output_folder
+            Path(self.dest, self.shard.output_folder).mkdir(parents=True, exist_ok=True)
+
+        # published records by collection and slug, e.g. for url_for()
+        self.slugs = SlugRegistry(
+            url_=self.configs.URL,
+            folders_={
+                "meetups": self.configs.folders.meetups,
+                "posts": self.configs.folders.posts,
+                "categories": self.configs.folders.categories,
+                "pages": self.configs.folders.pages,
+            },
         )
 
         self.meetups = Meetups(
@@ -96,13 +253,24 @@ class Meetlify:
                 self.configs.folders.meetups,
             ),
             reverse_=True,
+            store_=self.store,
+            slugs_=self.slugs,
+            convertor_=self.convertor,
+            dates_=self.dates,
         )
 
+        self.renderer.globals["meetup_index"] = self.meetups
+        self.renderer.globals["url_for"] = self.slugs.url_for
+
         self.posts = Posts(
             path_=Path(
                 self.dest, self.configs.folders.content, self.configs.folders.posts
             ),
             reverse_=True,
+            store_=self.store,
+            slugs_=self.slugs,
+            convertor_=self.convertor,
+            dates_=self.dates,
         )
 
         self.categories = Categories(
@@ -110,6 +278,10 @@ class Meetlify:
                 self.dest, self.configs.folders.content, self.configs.folders.categories
             ),
             reverse_=True,
+            store_=self.store,
+            slugs_=self.slugs,
+            convertor_=self.convertor,
+            dates_=self.dates,
         )
 
         self.pages = Pages(
@@ -117,8 +289,23 @@ class Meetlify:
                 self.dest, self.configs.folders.content, self.configs.folders.pages
             ),
             reverse_=True,
+            store_=self.store,
+            slugs_=self.slugs,
+            convertor_=self.convertor,
+            dates_=self.dates,
         )
 
+        if not self.dry_run:
+            self.highlighter.save()
+
+        # site wide template data (meta, latest items, banners, partials)
+        self.site = SiteContext.from_site(
+            self.configs, self.meetups, self.posts, self.categories
+        )
+        self.site.register(self.renderer)
+
+        # news sitemap (and its robots.txt entry) only if there are recent posts
+        news = self.recent_posts() if self.configs.news_days else []
         self.sitemaps = Sitemaps(
             sitemap_items_=[
                 {
@@ -142,11 +329,130 @@ class Meetlify:
                     "robots_txt": True,
                 },
             ]
+            + (
+                [
+                    {
+                        "name": "news",
+                        "slug": f"/{self.configs.folders.posts}/",
+                        "items": news,
+                        "news": news,
+                        "robots_txt": True,
+                    }
+                ]
+                if news
+                else []
+            ),
+            URL_=self.configs.URL,
+            images_folder_=self.configs.folders.images,
+        )
+
+        self.feeds = Feeds(
+            feed_items_=[
+                {
+                    "name": self.configs.folders.posts,
+                    "slug": self.configs.folders.posts,
+                    "folder": self.configs.folders.posts,
+                    "title": f"{self.configs.name} - Posts",
+                    "author": self.configs.author,
+                    "items": self.posts[STATUS.PUBLISHED, STATUS.DONE],
+                },
+                {
+                    "name": self.configs.folders.meetups,
+                    "slug": self.configs.folders.meetups,
+                    "folder": self.configs.folders.meetups,
+                    "title": f"{self.configs.name} - Meetups",
+                    "author": self.configs.author,
+                    "items": self.meetups[STATUS.PUBLISHED, STATUS.DONE],
+                },
+            ]
+            + [
+                {
+                    "name": category.slug,
+                    "slug": f"{self.configs.folders.categories}/{category.slug}",
+                    "folder": self.configs.folders.posts,
+                    "title": f"{self.configs.name} - {category.title}",
+                    "author": self.configs.author,
+                    "items": self.posts.by_categories().get(category.slug, []),
+                }
+                for category in self.categories[STATUS.PUBLISHED, STATUS.DONE]
+            ],
+            limit_=self.configs.feeds_limit,
+            URL_=self.configs.URL,
+        )
+
+        self.calendars = Calendars(
+            meetups_=self.meetups[STATUS.PUBLISHED, STATUS.DONE],
+            upcoming_=[
+                meetup
+                for meetup in self.meetups.upcoming()
+                if meetup.status == STATUS.PUBLISHED.value
+            ],
+            name_=self.configs.name,
+            URL_=self.configs.URL,
+            folder_=self.configs.folders.meetups,
         )
 
         self.redirects = Redirects.from_json(Path(self.dest, "redirects.json"))
+        self.redirected = False  # new redirects, saved to redirects.json by flush
+
+        # redirect old urls of content whose slug changed since the last build
+        if self.store and self.configs.slug_redirects:
+            for kind, old_slug, new_slug in self.store.slug_changes:
+                folder, collection = {
+                    "meetups": (self.configs.folders.meetups, self.meetups),
+                    "posts": (self.configs.folders.posts, self.posts),
+                    "pages": (self.configs.folders.pages, self.pages),
+                    "categories": (self.configs.folders.categories, self.categories),
+                }[kind]
+                published = collection[STATUS.PUBLISHED, STATUS.DONE]
+                if new_slug in {content.slug for content in published}:
+                    self.redirect_slug(folder, old_slug, new_slug)
         self.robots = Robots.from_json(Path(self.dest, "robots.json"))
 
+        # output folder, memory or archive, see targets.py
+        self.target = target_ or DirectoryTarget(
+            root_=Path(self.dest, self.configs.folders.output),
+            fsync_=self.configs.fsync,
+        )
+        assert self.shard is None or self.target.persistent
+
+        # only outputs kept between builds are built incrementally
+        self.manifest = (
+            Manifest.from_json(
+                Path(
+                    self.dest,
+                    (
+                        self.shard.manifest_file
+                        if self.shard
+                        else f"{CACHE_FOLDER}/manifest.json"
+                    ),
+                )
+            )
+            if self.target.persistent
+            else Manifest(json_file_=None, entries_={})
+        )
+        # rendered outputs are written behind by a pool of writer threads
+        self.writer = OutputWriter(
+            target_=self.target,
+            workers_=self.configs.writers,
+            queue_size_=16 * self.configs.writers,
+        )
+        self.search = SearchIndex.from_json(
+            Path(self.dest, CACHE_FOLDER, "search.json")
+        )
+        self.related = RelatedIndex.from_json(
+            Path(self.dest, CACHE_FOLDER, "related.json")
+        )
+
+    def recent_posts(self) -> list:
+        """Posts of the last ``news_days`` days for the news sitemap (max 1000)"""
+        since = build_time() - timedelta(days=self.configs.news_days)
+        return [
+            post
+            for post in self.posts[STATUS.PUBLISHED, STATUS.DONE]
+            if post.create_date >= since
+        ][:1000]
+
     def setup(self) -> None:
         """Setup Current Folder for Meetlify Website."""
         Path(self.dest, self.configs.folders.output).mkdir(parents=True, exist_ok=True)
@@ -178,268 +484,331 @@ class Meetlify:
                     shutil.rmtree(path)
 
     def render_home(self):
-        with open(
-            Path(self.dest, self.configs.folders.output, "index.html"),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("index.html").render(
-                    meta=self.configs,
-                    about_us_paragraphs=self.configs.about_us,
-                    meetups=self.meetups[STATUS.PUBLISHED, STATUS.DONE][0:3],
-                    posts=self.posts[STATUS.PUBLISHED, STATUS.DONE][0:3],
-                    categories=self.categories[STATUS.PUBLISHED, STATUS.DONE][0:8],
-                )
-            )
-            logging.info("... wrote output/home")
+        self.write(
+            "index.html",
+            self.templates.render(
+                "index.html",
+                about_us_paragraphs=self.configs.about_us,
+                meetups=self.site.meetups,
+                posts=self.site.posts,
+                categories=self.site.categories[0:8],
+            ),
+        )
 
     def render_404_page(self):
-        with open(
-            Path(self.dest, self.configs.folders.output, "404.html"),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("404.html").render(
-                    meta=self.configs,
-                    meetups=self.meetups[STATUS.PUBLISHED, STATUS.DONE][0:3],
-                    posts=self.posts[STATUS.PUBLISHED, STATUS.DONE][0:3],
-                    categories=self.categories[STATUS.PUBLISHED, STATUS.DONE][0:3],
-                )
-            )
-            logging.info("... wrote output/404")
+        self.write(
+            "404.html",
+            self.templates.render(
+                "404.html",
+                meetups=self.site.meetups,
+                posts=self.site.posts,
+                categories=self.site.categories[0:3],
+            ),
+        )
 
     def render_meetups(self):
         """Render meetup pages and Meetup index page"""
 
+        self.render_meetup_pages()
+        self.render_meetup_index()
+
+    def render_meetup_pages(self):
+        """Render meetup pages (only the ones of this shard in sharded builds)"""
+
         # TODO: Check if there are less than 3 meetups and runs without error? make 3 config variable
-        for meetup in self.meetups[STATUS.PUBLISHED, STATUS.DONE]:
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.meetups,
-                meetup.slug,
-            ).mkdir(parents=True, exist_ok=True)
+        related = self.related.related(
+            self.configs.folders.meetups, self.meetups[STATUS.PUBLISHED, STATUS.DONE]
+        )
+        if self.plan is None:
+            self.related.save()
 
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    self.configs.folders.meetups,
-                    meetup.slug,
-                    "index.html",
-                ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(
-                    self.renderer.get_template("meetup.html").render(
-                        meta=self.configs,
-                        meetup=meetup,
-                        meetups=self.meetups[STATUS.PUBLISHED, STATUS.DONE][1:4],
-                    )
-                )
-                logging.info(f"...... wrote output/meetups/{meetup.slug}")
+        meetups = self.sharded(self.meetups[STATUS.PUBLISHED, STATUS.DONE])
+        self.progress.expect(len(meetups))
+        for meetup in meetups:
+            self.render_detail(
+                "meetup.html",
+                f"{self.configs.folders.meetups}/{meetup.slug}/index.html",
+                meetup=meetup,
+                related=related[meetup.slug],
+            )
 
-        # save meetup index page
-        with open(
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.meetups,
-                "index.html",
+    def render_meetup_index(self):
+        """Render paginated Meetup index pages"""
+
+        # save meetup index pages
+        self.render_pagination(
+            "meetups.html",
+            Paginator(
+                items_=self.meetups.past(),
+                slug_=self.configs.folders.meetups,
+                per_page_=self.configs.page_size,
             ),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("meetups.html").render(
-                    meta=self.configs,
-                    meetups=self.meetups[STATUS.PUBLISHED, STATUS.DONE],
+            "meetups",
+            upcoming=self.meetups.upcoming(),
+        )
+
+    def render_archives(self):
+        """Render yearly and monthly meetup archive pages"""
+
+        archive_folder = f"{self.configs.folders.meetups}/archive"
+
+        archives = [("", "Meetup Archive", [])]
+        for year in self.meetups.years():
+            archives.append(
+                (f"{year}", f"Meetups in {year}", self.meetups.by_year(year))
+            )
+            for month in self.meetups.months(year):
+                archives.append(
+                    (
+                        f"{year}/{month:02d}",
+                        f"Meetups in {datetime(year, month, 1).strftime('%B %Y')}",
+                        self.meetups.by_month(year, month),
+                    )
                 )
+
+        for slug, title, meetups in archives:
+            self.write(
+                Path(archive_folder, slug, "index.html").as_posix(),
+                self.templates.render(
+                    "archive.html",
+                    title=title,
+                    slug=slug,
+                    meetups=meetups,
+                    years=self.meetups.years(),
+                ),
             )
-            logging.info("... wrote output/meetups")
 
     def render_posts(self):
         """Render posts and Meetup index page"""
 
+        self.render_post_pages()
+        self.render_post_index()
+
+    def render_post_pages(self):
+        """Render post pages (only the ones of this shard in sharded builds)"""
+
         # TODO: Check if there are less than 3 posts  and runs without error? make 3 config variable
-        for post in self.posts[STATUS.PUBLISHED, STATUS.DONE]:
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.posts,
-                post.slug,
-            ).mkdir(parents=True, exist_ok=True)
+        related = self.related.related(
+            self.configs.folders.posts, self.posts[STATUS.PUBLISHED, STATUS.DONE]
+        )
+        if self.plan is None:
+            self.related.save()
 
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    self.configs.folders.posts,
-                    post.slug,
-                    "index.html",
-                ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(
-                    self.renderer.get_template("post.html").render(
-                        meta=self.configs,
-                        post=post,
-                        posts=self.posts[STATUS.PUBLISHED, STATUS.DONE][1:4],
-                        banner=self.configs.get_banner(banner_name=post.banner),
-                    )
-                )
-                logging.info(f"...... wrote output/posts/{post.slug}")
+        posts = self.sharded(self.posts[STATUS.PUBLISHED, STATUS.DONE])
+        self.progress.expect(len(posts))
+        for post in posts:
+            self.render_detail(
+                "post.html",
+                f"{self.configs.folders.posts}/{post.slug}/index.html",
+                post=post,
+                related=related[post.slug],
+                banner=self.site.banner(post.banner),
+            )
 
-        # save meetup index page
-        with open(
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.posts,
-                "index.html",
+    def render_post_index(self):
+        """Render paginated post index pages"""
+
+        # save post index pages
+        self.render_pagination(
+            "posts.html",
+            Paginator(
+                items_=self.posts[STATUS.PUBLISHED, STATUS.DONE],
+                slug_=self.configs.folders.posts,
+                per_page_=self.configs.page_size,
             ),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("posts.html").render(
-                    meta=self.configs, posts=self.posts[STATUS.PUBLISHED, STATUS.DONE]
-                )
-            )
-            logging.info("... wrote output/posts")
+            "posts",
+        )
 
     def render_categories(self):
         """Render categoires and categoires index page"""
 
-        # TODO: Check if there are less than 3 posts  and runs without error? make 3 config variable
+        by_categories = self.posts.by_categories()
         for category in self.categories[STATUS.PUBLISHED, STATUS.DONE]:
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.categories,
-                category.slug,
-            ).mkdir(parents=True, exist_ok=True)
-
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    self.configs.folders.categories,
-                    category.slug,
-                    "index.html",
+            self.render_pagination(
+                "category.html",
+                Paginator(
+                    items_=by_categories.get(category.slug, []),
+                    slug_=f"{self.configs.folders.categories}/{category.slug}",
+                    per_page_=self.configs.page_size,
                 ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(
-                    self.renderer.get_template("category.html").render(
-                        meta=self.configs,
-                        category=category,
-                        posts=self.posts.by_categories()[category.slug][0:3],
-                    )
-                )
-                logging.info(f"...... wrote output/categories/{category.slug}")
+                "posts",
+                category=category,
+            )
 
-        # save meetup index page
-        with open(
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.categories,
-                "index.html",
+        # save category index pages
+        self.render_pagination(
+            "categories.html",
+            Paginator(
+                items_=self.categories[STATUS.PUBLISHED, STATUS.DONE],
+                slug_=self.configs.folders.categories,
+                per_page_=self.configs.page_size,
             ),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("categories.html").render(
-                    meta=self.configs,
-                    categories=self.categories[STATUS.PUBLISHED, STATUS.DONE],
-                )
+            "categories",
+        )
+
+    def sharded(self, contents_: list) -> list:
+        """Contents whose detail pages are rendered by this build (or shard)"""
+        if self.shard is None:
+            return contents_
+        return [content for content in contents_ if self.shard.owns(content.slug)]
+
+    def page_inputs(self, template_: str, **context_) -> dict[str, str]:
+        """Digests of used templates, configs and context of a html page"""
+        return {
+            "theme": self.templates.digest(template_),
+            "configs": self.configs_digest,
+            "template": template_,
+            **{name: fingerprint(value) for name, value in context_.items()},
+        }
+
+    def stale(self, output_: str, inputs_: dict[str, str]) -> str | None:
+        """Digest to record if ``output_`` has to be written, None if fresh.
+
+        In plan mode the output is only added to the plan and never written.
+        """
+        if self.cancelled.is_set():
+            raise BuildCancelled(self.dest)
+
+        digest = fingerprint(inputs_)
+        self.rendered.add(output_)
+        output_folder = Path(self.dest, self.configs.folders.output)
+        fresh = self.manifest.is_fresh(output_, digest, output_folder)
+
+        if self.plan is not None:
+            self.plan.add(
+                output_,
+                inputs_,
+                self.manifest.entries.get(output_),
+                fresh,
+                self.target.exists(output_),
             )
-            logging.info("... wrote output/categories")
+            return None
 
-    def render_pages(self):
-        """Render permanent pages"""
+        if fresh:
+            self.progress.advance(output_, "unchanged")
+            return None
+        return digest
 
-        for page in self.pages[STATUS.PUBLISHED, STATUS.DONE]:
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.pages,
-                page.slug,
-            ).mkdir(parents=True, exist_ok=True)
+    def remove(self, output_: str, reason_: str) -> None:
+        """Remove an output of a previous build and its empty folders"""
+        if self.plan is not None:
+            self.plan.remove(output_, reason_)
+            return
 
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    self.configs.folders.pages,
-                    page.slug,
-                    "index.html",
+        self.target.remove(output_)
+        self.manifest.forget(output_)
+        self.progress.advance(output_, "removed", f"({reason_})")
+
+    def prune(self) -> None:
+        """Remove outputs of the previous build which are no longer produced"""
+        for output in self.manifest.outputs():
+            if output not in self.rendered:
+                self.remove(output, "no longer produced")
+
+    def write(self, output_: str, data_: str | bytes) -> None:
+        """Queue an output for the writer threads and count it as written"""
+        self.writer.write(output_, data_)
+        self.progress.advance(output_)
+
+    def render_detail(self, template_: str, output_: str, **context_) -> None:
+        """Render a single detail page unless its inputs did not change."""
+
+        inputs = self.page_inputs(template_, **context_)
+        digest = self.stale(output_, inputs)
+        if digest is None:
+            return
+
+        self.write(output_, self.templates.render(template_, **context_))
+
+        self.manifest.record(output_, digest, inputs)
+
+    def render_pagination(
+        self, template_: str, paginator_: Paginator, items_name_: str, **context_
+    ) -> None:
+        """Render all pages of a paginated collection in parallel.
+
+        Pages whose items, context, configuration and theme did not change
+        since the last build are not rendered again.
+        """
+
+        def render(pagination):
+            inputs = self.page_inputs(template_, pagination=pagination, **context_)
+            digest = self.stale(pagination.output, inputs)
+            if digest is None:
+                return None
+
+            self.write(
+                pagination.output,
+                self.templates.render(
+                    template_,
+                    pagination=pagination,
+                    **{items_name_: pagination.items},
+                    **context_,
                 ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(
-                    self.renderer.get_template("page.html").render(
-                        meta=self.configs, page=page
-                    )
-                )
-                logging.info(f"...... wrote output/pages/{page.slug}")
+            )
+
+            return pagination.output, digest, inputs
+
+        self.progress.expect(len(paginator_))
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for written in executor.map(render, paginator_):
+                if written:
+                    self.manifest.record(*written)
+
+        # remove pages beyond the last page, left over from bigger collections
+        outputs = {pagination.output for pagination in paginator_}
+        for output in self.manifest.outputs(f"{paginator_.slug}/page/"):
+            if output not in outputs:
+                self.remove(output, "page beyond last page")
+
+    def render_pages(self):
+        """Render permanent pages"""
+
+        pages = self.sharded(self.pages[STATUS.PUBLISHED, STATUS.DONE])
+        self.progress.expect(len(pages))
+        for page in pages:
+            self.render_detail(
+                "page.html",
+                f"{self.configs.folders.pages}/{page.slug}/index.html",
+                page=page,
+            )
 
     def render_sitemaps(self):
         """Render Sitemaps"""
 
         for sitemap in self.sitemaps[STATUS.PUBLISHED]:
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    f"sitemap-{sitemap.name}.xml",
-                ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(
-                    self.renderer.get_template("sitemap.xml").render(
-                        meta=self.configs, sitemap=sitemap
-                    )
-                )
-                logging.info(f"... wrote output/sitemap/{sitemap.name}")
+            self.write(
+                f"sitemap-{sitemap.name}.xml",
+                self.templates.render("sitemap.xml", sitemap=sitemap),
+            )
 
-        with open(
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                "sitemap-index.xml",
+        self.write(
+            "sitemap-index.xml",
+            self.templates.render(
+                "sitemap-index.xml", sitemaps=self.sitemaps[STATUS.PUBLISHED]
             ),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(
-                self.renderer.get_template("sitemap-index.xml").render(
-                    meta=self.configs, sitemaps=self.sitemaps[STATUS.PUBLISHED]
-                )
-            )
-            logging.info("... wrote output/sitemap-index")
+        )
 
     def render_redirects(self):
-        with open(
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                "_redirects",
-            ),
-            mode="w",
-            encoding="utf-8",
-        ) as file:
-            file.write(str(self.redirects))
-            logging.info("... wrote output/redirects file")
+        """Render compiled redirects in all configured server formats"""
+
+        for redirects_format in self.configs.redirects:
+            file_name, writer = FORMATS[redirects_format]
+            self.write(file_name, getattr(self.redirects, writer)())
+
+    def redirect_slug(self, kind_: str, old_slug_: str, new_slug_: str) -> bool:
+        """Redirect the old url of content whose slug changed to its new url"""
+
+        old_url, new_url = f"/{kind_}/{old_slug_}/", f"/{kind_}/{new_slug_}/"
+        if old_url in self.redirects:
+            return False
+
+        # the new url may have been redirected before, but is a live page again
+        self.redirects.discard(new_url)
+        self.redirects.add(old_url, new_url)
+        self.redirected = True
+        self.progress.advance(old_url.strip("/"), "redirected", f"to {new_url}")
+        return True
 
     def render_robots_txt(self):
         # Add additional sitemaps to Robots.txt if not added in robots.json
@@ -452,51 +821,401 @@ class Meetlify:
         )
 
         if self.configs.robots:
-            with open(
-                Path(
-                    self.dest,
-                    self.configs.folders.output,
-                    "robots.txt",
-                ),
-                mode="w",
-                encoding="utf-8",
-            ) as file:
-                file.write(str(self.robots))
-                logging.info("... wrote output/robots.txt file")
+            self.write("robots.txt", str(self.robots))
+
+    def render_feeds(self):
+        """Render Atom and JSON feeds, skipping feeds whose items did not change"""
+
+        if not self.configs.feeds:
+            return
+
+        for feed in self.feeds:
+            inputs = {"feed": fingerprint(feed)}
+
+            for file_name, writer in (
+                ("feed.xml", feed.write_atom),
+                ("feed.json", feed.write_json),
+            ):
+                output = f"{feed.slug}/{file_name}"
+                digest = self.stale(output, inputs)
+                if digest is None:
+                    continue
+
+                with io.StringIO() as file:
+                    writer(file)
+                    self.write(output, file.getvalue())
+
+                self.manifest.record(output, digest, inputs)
+
+    def render_calendars(self):
+        """Render iCalendar file per meetup and one for all upcoming meetups"""
+
+        if not self.configs.calendars:
+            return
+
+        for calendar in self.calendars:
+            inputs = {"calendar": fingerprint(calendar)}
+            digest = self.stale(calendar.slug, inputs)
+            if digest is None:
+                continue
+
+            with io.StringIO(newline="") as file:
+                calendar.write_ics(file)
+                self.write(calendar.slug, file.getvalue())
+
+            self.manifest.record(calendar.slug, digest, inputs)
+
+    def render_search(self):
+        """Render sharded search index and search page"""
+
+        if not self.configs.search:
+            return
+
+        tokenized = self.search.update(
+            [
+                (folder, f"/{folder}/{content.slug}/", content)
+                for folder, contents in (
+                    (self.configs.folders.posts, self.posts),
+                    (self.configs.folders.meetups, self.meetups),
+                    (self.configs.folders.pages, self.pages),
+                )
+                for content in contents[STATUS.PUBLISHED, STATUS.DONE]
+            ]
+        )
+        logging.info("... tokenized %d documents for search", tokenized)
+
+        shards = self.search.shards()
+        outputs = {f"search/{name}.json": terms for name, terms in shards.items()}
+        outputs["search/index.json"] = self.search.catalog(list(shards))
+
+        for output, data in outputs.items():
+            inputs = {"terms": fingerprint(data)}
+            digest = self.stale(output, inputs)
+            if digest is None:
+                continue
+
+            self.write(
+                output, json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            )
+
+            self.manifest.record(output, digest, inputs)
+
+        # remove shards of terms which are no longer in any document
+        for output in self.manifest.outputs("search/"):
+            if output.endswith(".json") and output not in outputs:
+                self.remove(output, "no document contains its terms")
+
+        if self.plan is not None:
+            return
+
+        self.search.save()
+        self.write("search/index.html", self.templates.render("search.html"))
 
     def copy_assests(self):
         # copy static folders
-        shutil.copytree(
+        copied = self.target.sync(
             Path(self.dest, self.configs.folders.themes, self.configs.theme, "static"),
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                "static",
-            ),
-            dirs_exist_ok=True,
+            "static",
         )
-        logging.info("... copied output/themes static folder")
+        logging.info("... copied output/themes static folder (%d changed)", copied)
 
         # copy images folder
-        shutil.copytree(
+        copied = self.target.sync(
             Path(self.dest, self.configs.folders.content, self.configs.folders.images),
-            Path(
-                self.dest,
-                self.configs.folders.output,
-                self.configs.folders.images,
-            ),
-            dirs_exist_ok=True,
+            self.configs.folders.images,
+        )
+        logging.info("... copied output/images folder (%d changed)", copied)
+
+        # stylesheet of highlighted code blocks, only written if its style changed
+        if self.configs.highlight:
+            inputs = {"highlight": self.highlighter.version}
+            digest = self.stale("static/css/highlight.css", inputs)
+            if digest is not None:
+                self.write("static/css/highlight.css", self.highlighter.stylesheet())
+                self.manifest.record("static/css/highlight.css", digest, inputs)
+
+    def emit(self, event_: str, **data_) -> None:
+        """Pass a build event to all listeners, e.g. progress of build phases"""
+        for listener in self.listeners:
+            listener({"event": event_, "dest": str(self.dest), **data_})
+
+    def run(self, *phases_) -> None:
+        """Run build phases in order and record how long each one took"""
+        for phase in phases_:
+            if self.cancelled.is_set():
+                raise BuildCancelled(self.dest)
+
+            inputs = self.phase_inputs.get(phase.__name__)
+            incremental = self.changes is not None and inputs
+            if incremental and not self.changes.touches(*inputs):
+                logging.info("... skipped %s (unchanged)", phase.__name__)
+                self.skipped.append(phase.__name__)
+                self.emit("phase", phase=phase.__name__, state="skipped")
+                continue
+
+            self.emit("phase", phase=phase.__name__, state="started")
+            self.progress.start(phase.__name__)
+            started = perf_counter()
+            phase()
+            self.timings[phase.__name__] = perf_counter() - started
+            self.progress.finish()
+            self.emit(
+                "phase",
+                phase=phase.__name__,
+                state="finished",
+                seconds=self.timings[phase.__name__],
+            )
+
+    def apply_changes(self, redirects_: bool = False) -> None:
+        """Remove outputs of deleted, renamed or re-slugged content.
+
+        With ``redirects_`` the old urls of renamed content are redirected to
+        their new urls, these redirects are saved to redirects.json by flush.
+        """
+        assert self.changes is not None
+
+        collections = {
+            self.configs.folders.meetups: self.meetups,
+            self.configs.folders.posts: self.posts,
+            self.configs.folders.pages: self.pages,
+            self.configs.folders.categories: self.categories,
+        }
+
+        for change in self.changes:
+            old_path = Path(change.old_path or change.path)
+            kind = old_path.parent.name
+            if (
+                change.status not in "DMR"
+                or old_path.suffix != ".md"
+                or kind not in collections
+                or old_path.parent.parent.as_posix() != self.configs.folders.content
+            ):
+                continue
+
+            slugs = {
+                content.slug
+                for content in collections[kind][STATUS.PUBLISHED, STATUS.DONE]
+            }
+            old_slug = self.changes.old_slug(old_path.as_posix())
+            if old_slug is None or old_slug in slugs:
+                continue
+
+            self.target.remove_folder(f"{kind}/{old_slug}")
+            for output in self.manifest.outputs(f"{kind}/{old_slug}/"):
+                self.manifest.forget(output)
+            self.progress.advance(f"{kind}/{old_slug}", "removed", "(slug changed)")
+
+            if not redirects_ or change.status == "D":
+                continue
+
+            new_slug = self.changes.new_slug(change.path)
+            if new_slug in slugs:
+                self.redirect_slug(kind, old_slug, new_slug)
+
+    def flush(self) -> None:
+        """Write queued outputs, close the target, save manifest and redirects"""
+        self.writer.close()
+        self.target.close()
+        self.manifest.save()
+        if self.redirected:
+            self.redirects.to_json(Path(self.dest, "redirects.json"))
+            self.redirected = False
+
+    def make(self, redirects_: bool = False):
+        if self.changes is not None:
+            self.progress.start("apply_changes")
+            self.apply_changes(redirects_=redirects_)
+            self.progress.finish()
+
+        try:
+            self.run(
+                self.render_home,
+                self.render_404_page,
+                self.render_meetup_pages,
+                self.render_meetup_index,
+                self.render_archives,
+                self.render_post_pages,
+                self.render_post_index,
+                self.render_categories,
+                self.render_pages,
+                self.render_redirects,
+                self.render_sitemaps,
+                self.render_robots_txt,
+                self.render_feeds,
+                self.render_calendars,
+                self.render_search,
+                self.copy_assests,
+            )
+        except BuildCancelled:
+            # outputs rendered so far are written and kept in the manifest,
+            # nothing is pruned, so the next build picks up from there
+            self.flush()
+            self.emit("build", state="cancelled")
+            raise
+
+        if not self.skipped:
+            self.progress.start("prune")
+            self.prune()
+            self.progress.finish()
+        self.flush()
+        self.emit("build", state="finished", timings=dict(self.timings))
+
+    @classmethod
+    async def load_async(cls, dest_: Path, **kwargs_) -> Self:
+        """Load configs and parse content in an executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(cls, dest_=dest_, **kwargs_))
+
+    async def events_async(
+        self, jobs_: int | None = None, redirects_: bool = False
+    ) -> AsyncIterator[dict]:
+        """Run ``make`` in an executor and yield its build events.
+
+        Cancelling the consuming task (or closing the iterator) cancels the
+        build at the next page or phase and waits until the outputs rendered
+        so far and their manifest entries are written.
+        """
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def listener(event_: dict) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, event_)
+
+        self.jobs = jobs_ or self.jobs
+        self.cancelled.clear()
+        self.listeners.append(listener)
+        build = loop.run_in_executor(None, partial(self.make, redirects_=redirects_))
+        build.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            await build
+        finally:
+            if not build.done():
+                self.cancelled.set()
+                try:
+                    await build
+                except BuildCancelled:
+                    pass
+            self.listeners.remove(listener)
+
+    async def make_async(
+        self, jobs_: int | None = None, redirects_: bool = False
+    ) -> dict[str, float]:
+        """Build without blocking the event loop, returns timings per phase"""
+        async for _ in self.events_async(jobs_=jobs_, redirects_=redirects_):
+            pass
+        return dict(self.timings)
+
+    def make_plan(self) -> Plan:
+        """Plan a full build against the previous build manifest.
+
+        Runs the manifest tracked phases without writing any output, so only
+        parsing (see content store) and fingerprinting of pages is paid for.
+        Sites loaded with ``plan_`` neither save their caches, content store
+        nor redirects, their content store is closed after planning.
+        """
+        self.plan = Plan()
+        if self.store:
+            self.plan.parsed = dict(self.store.parsed)
+        else:
+            # without content store every markdown file is parsed again
+            for kind in (
+                self.configs.folders.meetups,
+                self.configs.folders.posts,
+                self.configs.folders.categories,
+                self.configs.folders.pages,
+            ):
+                folder = Path(self.dest, self.configs.folders.content, kind)
+                total = len(list(folder.glob("*.md")))
+                self.plan.parsed[kind] = (total, total)
+
+        self.plan.untracked = [
+            phase.__name__
+            for phase in (
+                self.render_home,
+                self.render_404_page,
+                self.render_archives,
+                self.render_redirects,
+                self.render_sitemaps,
+                self.render_robots_txt,
+                self.copy_assests,
+            )
+        ]
+
+        self.run(
+            self.render_meetup_pages,
+            self.render_meetup_index,
+            self.render_post_pages,
+            self.render_post_index,
+            self.render_categories,
+            self.render_pages,
+            self.render_feeds,
+            self.render_calendars,
+            self.render_search,
         )
-        logging.info("... copied output/images folder")
+        if not self.skipped:
+            # outputs of untracked phases are produced, though never planned
+            if self.configs.highlight:
+                self.rendered.add("static/css/highlight.css")
+            self.prune()
+        if self.dry_run and self.store:
+            self.store.close()
+
+        plan, self.plan = self.plan, None
+        return plan
 
-    def make(self):
-        self.render_home()
-        self.render_404_page()
-        self.render_meetups()
-        self.render_posts()
-        self.render_categories()
+    def make_shard(self):
+        """Render the detail pages of this shard and its manifest."""
+        assert self.shard is not None
+
+        self.render_meetup_pages()
+        self.render_post_pages()
         self.render_pages()
-        self.render_redirects()
-        self.render_sitemaps()
-        self.render_robots_txt()
-        self.copy_assests()
+
+        # remove pages which are no longer part of this shard
+        self.prune()
+        self.flush()
+        logging.info(
+            "... wrote shard %s (%d pages)", self.shard.name, len(self.rendered)
+        )
+
+    def merge(self):
+        """Combine the outputs of all shards and render the global pages."""
+        assert self.shard is None
+
+        output_folder = Path(self.dest, self.configs.folders.output)
+        owners = {}
+        for shard in Shard.discover(self.dest):
+            manifest = Manifest.from_json(Path(self.dest, shard.manifest_file))
+            for output, entry in sorted(manifest.entries.items()):
+                if output in owners:
+                    raise ValueError(
+                        f"{output} rendered by shards {owners[output]} and {shard.name}"
+                    )
+                owners[output] = shard.name
+
+                if not self.manifest.is_fresh(output, entry.digest, output_folder):
+                    source = Path(self.dest, shard.output_folder, output)
+                    self.write(output, source.read_bytes())
+                    self.manifest.record(output, entry.digest, entry.inputs)
+                self.rendered.add(output)
+            logging.info("... merged shard %s", shard.name)
+
+        self.run(
+            self.render_home,
+            self.render_404_page,
+            self.render_meetup_index,
+            self.render_archives,
+            self.render_post_index,
+            self.render_categories,
+            self.render_redirects,
+            self.render_sitemaps,
+            self.render_robots_txt,
+            self.render_feeds,
+            self.render_calendars,
+            self.render_search,
+            self.copy_assests,
+        )
+        self.prune()
+        self.flush()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\batch.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import math
+import logging
+import hashlib
+import traceback
+from time import perf_counter
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import BytecodeCache
+from jinja2.bccache import Bucket
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .api import Meetlify
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class SharedBytecodeCache(BytecodeCache):
+    """In memory Jinja bytecode cache keyed by template name and source.
+
+    Jinja keys buckets by file name, which differs for every site. Keying by
+    template name and source checksum instead lets all sites of one process
+    using an identical theme share the compiled templates.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = {}
+
+    def get_bucket(self, environment, name, filename, source) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(f"{name}|{checksum}".encode("utf-8")).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        if bucket.key in self.buckets:
+            bucket.bytecode_from_string(self.buckets[bucket.key])
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self.buckets[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        self.buckets.clear()
+
+
+# compiled templates shared by all builds in this (worker) process
+BYTECODE_CACHE = SharedBytecodeCache()
+
+
+@dataclass
+class SiteReport:
+    """Site Report Data Class to hold timings of a single site build"""
+
+    dest: str
+    seconds: float = 0.0
+    timings: dict = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass
+class BatchReport:
+    """Batch Report Data Class to hold combined timings of all site builds"""
+
+    sites: list[SiteReport]
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[SiteReport]:
+        return [site for site in self.sites if site.error]
+
+    def __str__(self) -> str:
+        phases = sorted({phase for site in self.sites for phase in site.timings})
+        lines = [f"{'site':<32} {'seconds':>9}  status"]
+        for site in self.sites:
+            status = "failed" if site.error else "ok"
+            lines.append(f"{Path(site.dest).name:<32} {site.seconds:>9.3f}  {status}")
+        lines.append(f"{'total':<32} {self.seconds:>9.3f}")
+        if phases:
+            lines.append("")
+            lines.append(f"{'phase':<32} {'seconds':>9}")
+            for phase in phases:
+                seconds = sum(site.timings.get(phase, 0.0) for site in self.sites)
+                lines.append(f"{phase:<32} {seconds:>9.3f}")
+        return "\n".join(lines)
+
+
+def build_site(dest_: str, jobs_: int | None = None) -> SiteReport:
+    """Build a single site, sharing compiled templates and caches of the process.
+
+    The site itself is loaded for every build, see BuildDaemon.
+    """
+    report = SiteReport(dest=str(dest_))
+    started = perf_counter()
+    try:
+        mtlfy = Meetlify(dest_=Path(dest_), jobs_=jobs_, bytecode_cache_=BYTECODE_CACHE)
+        mtlfy.make()
+        report.timings = dict(mtlfy.timings)
+    except Exception:
+        report.error = traceback.format_exc()
+        logging.error("... failed to build %s\n%s", dest_, report.error)
+    report.seconds = perf_counter() - started
+    return report
+
+
+def build_all(
+    dests_: list[Path], workers_: int = 1, jobs_: int | None = None
+) -> BatchReport:
+    """Build all sites either in this process or in a pool of worker processes.
+
+    Sites are handed to the workers in contiguous chunks, so every worker is
+    warmed up once and then reuses its template, markdown and asset caches for
+    the rest of its sites.
+    """
+    assert workers_ >= 1
+
+    dests = [str(dest) for dest in dests_]
+    started = perf_counter()
+    if workers_ == 1 or len(dests) < 2:
+        sites = [build_site(dest, jobs_) for dest in dests]
+    else:
+        workers = min(workers_, len(dests))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sites = list(
+                executor.map(
+                    build_site,
+                    dests,
+                    [jobs_] * len(dests),
+                    chunksize=math.ceil(len(dests) / workers),
+                )
+            )
+
+    return BatchReport(sites=sites, seconds=perf_counter() - started)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\calendars.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Self, TextIO
+from urllib.parse import urlparse
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def ics_escape(text_: str) -> str:
+    """Escape TEXT values as per RFC 5545 section 3.3.11"""
+    return (
+        (text_ or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def ics_line(name_: str, value_: str) -> str:
+    """Content line folded at 75 octets as per RFC 5545 section 3.1"""
+    line = f"{name_}:{value_}".encode("utf-8")
+    folded = []
+    while len(line) > 75:
+        cut = 75 if not folded else 74
+        # never split a multi-byte utf-8 character
+        while cut > 0 and (line[cut] & 0xC0) == 0x80:
+            cut -= 1
+        folded.append(line[:cut])
+        line = line[cut:]
+    folded.append(line)
+    return "\r\n ".join(part.decode("utf-8") for part in folded) + "\r\n"
+
+
+def ics_datetime(date_: datetime) -> str:
+    """Aware datetimes are written in UTC, naive ones as floating local time"""
+    if date_.tzinfo is None:
+        return date_.strftime("%Y%m%dT%H%M%S")
+    return date_.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+@dataclass
+class CalendarEvent:
+    """Calendar Event Data Class to hold a single VEVENT"""
+
+    uid: str
+    url: str
+    title: str
+    description: str
+    location: str
+    start: datetime
+    last_modified: datetime
+    categories: list[str]
+    status: str
+
+    def write_ics(self, file_: TextIO) -> None:
+        file_.write("BEGIN:VEVENT\r\n")
+        file_.write(ics_line("UID", self.uid))
+        file_.write(ics_line("DTSTAMP", ics_datetime(self.last_modified)))
+        file_.write(ics_line("LAST-MODIFIED", ics_datetime(self.last_modified)))
+        file_.write(ics_line("DTSTART", ics_datetime(self.start)))
+        file_.write(ics_line("SUMMARY", ics_escape(self.title)))
+        file_.write(ics_line("DESCRIPTION", ics_escape(self.description)))
+        file_.write(ics_line("LOCATION", ics_escape(self.location)))
+        if self.categories:
+            file_.write(
+                ics_line(
+                    "CATEGORIES",
+                    ",".join(ics_escape(category) for category in self.categories),
+                )
+            )
+        file_.write(ics_line("STATUS", self.status))
+        file_.write(ics_line("URL", self.url))
+        file_.write("END:VEVENT\r\n")
+
+    @classmethod
+    def from_meetup(cls, meetup_, URL_: str, folder_: str) -> Self:
+        domain = urlparse(URL_).netloc or "meetlify"
+        return cls(
+            uid=f"{folder_}-{meetup_.slug}@{domain}",
+            url=f"{URL_}/{folder_}/{meetup_.slug}/",
+            title=meetup_.title,
+            description=meetup_.description,
+            location=meetup_.address,
+            start=meetup_.event_datetime,
+            last_modified=meetup_.last_modified,
+            categories=meetup_.categories,
+            status="CONFIRMED",
+        )
+
+
+@dataclass
+class Calendar:
+    """Calendar Data Class to hold a VCALENDAR with one or more events"""
+
+    name: str
+    slug: str
+    events: list[CalendarEvent]
+
+    def write_ics(self, file_: TextIO) -> None:
+        """Stream calendar as iCalendar into an opened file"""
+        file_.write("BEGIN:VCALENDAR\r\n")
+        file_.write(ics_line("VERSION", "2.0"))
+        file_.write(ics_line("PRODID", "-//pybodensee//Meetlify//EN"))
+        file_.write(ics_line("CALSCALE", "GREGORIAN"))
+        file_.write(ics_line("METHOD", "PUBLISH"))
+        file_.write(ics_line("X-WR-CALNAME", ics_escape(self.name)))
+        for event in self.events:
+            event.write_ics(file_)
+        file_.write("END:VCALENDAR\r\n")
+
+
+class Calendars:
+    def __init__(
+        self, *, meetups_: list, upcoming_: list, name_: str, URL_: str, folder_: str
+    ) -> None:
+        self.events = {
+            meetup.slug: CalendarEvent.from_meetup(meetup, URL_, folder_)
+            for meetup in meetups_
+        }
+
+        self.all_calendars = [
+            Calendar(
+                name=f"{name_} - {event.title}",
+                slug=f"{folder_}/{slug}/event.ics",
+                events=[event],
+            )
+            for slug, event in self.events.items()
+        ] + [
+            Calendar(
+                name=f"{name_} - Meetups",
+                slug=f"{folder_}.ics",
+                events=[
+                    self.events.get(meetup.slug)
+                    or CalendarEvent.from_meetup(meetup, URL_, folder_)
+                    for meetup in upcoming_
+                ],
+            )
+        ]
+
+    def __iter__(self):
+        return iter(self.all_calendars)
+
+    def __len__(self) -> int:
+        return len(self.all_calendars)
@@ -35,21 +35,18 @@ SOFTWARE.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime, timezone
-
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# 3rd PARTY LIBRARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from slugify import slugify
+from dataclasses import dataclass, field
+from datetime import datetime
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from .utils import markdown_convertor
+from .utils import MarkdownConvertor, markdown_convertor, markdown_files, slugify
+from .slugs import SlugRegistry
+from .reproducible import last_modified
 from .constants import STATUS
+from .store import ContentStore
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -69,44 +66,69 @@ class Category:
     content: str
     add_to_sitemap: bool
     status: str
+    images: list[str] = field(default_factory=list)  # sources in content
 
     def __lt__(self, other_):
         return self.create_date < other_.create_date
 
     @classmethod
-    def from_markdown(cls, category_md_: Path):
-        meta, toc, content = markdown_convertor(category_md_)
+    def from_markdown(
+        cls,
+        category_md_: Path,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ):
+        meta, toc, content, images = convertor_(category_md_)
         return cls(
             title=meta.get("title"),
             author=meta.get("author"),
             description=meta.get("description"),
             slug=meta.get("slug") or slugify(meta.get("title")),
             create_date=datetime.strptime(meta.get("create_date"), "%Y-%m-%d::%H:%M"),
-            last_modified=datetime.fromtimestamp(
-                category_md_.stat().st_mtime, tz=timezone.utc
-            ),
+            last_modified=last_modified(category_md_, dates_),
             feature_image=meta.get("feature_image"),
             toc=toc,
             content=content,
             add_to_sitemap=bool(meta.get("add_to_sitemap")),
             status=meta.get("status"),
+            images=images,
         )
 
 
 class Categories:
-    def __init__(self, *, path_: Path, reverse_: bool = True) -> None:
-        self.content = sorted(
-            [
-                Category.from_markdown(category_md)
-                for category_md in path_.iterdir()
-                if category_md.is_file() and category_md.suffix == ".md"
-            ],
-            reverse=reverse_,
+    def __init__(
+        self,
+        *,
+        path_: Path,
+        reverse_: bool = True,
+        store_: ContentStore | None = None,
+        slugs_: SlugRegistry | None = None,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ) -> None:
+        self.store = store_
+        self.reverse = reverse_
+        records = (
+            store_.load("categories", path_, Category, dates_)
+            if store_
+            else [
+                Category.from_markdown(category_md, convertor_, dates_)
+                for category_md in markdown_files(path_)
+            ]
         )
+        if slugs_ is not None:
+            records = slugs_.register("categories", path_, records, store_)
+        self.content = sorted(records, reverse=reverse_)
 
     def __getitem__(self, status_: list[STATUS] | STATUS) -> list[Category]:
         if isinstance(status_, STATUS):
             status_ = [status_]
+
+        if self.store:
+            return self.store.query(
+                "categories", Category, status_=status_, reverse_=self.reverse
+            )
+
         return [
             content
             for content in self.content
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\changes.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Self
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .utils import convert_markdown, slugify
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def git(dest_: Path, *args_: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", "-C", str(dest_), *args_],
+            check=True,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as error:
+        message = getattr(error, "stderr", None) or str(error)
+        raise ValueError(f"git {' '.join(args_)} failed: {message.strip()}")
+
+
+def slug_of(markdown_: str) -> str | None:
+    meta = dict(convert_markdown(markdown_)[0])
+    return meta.get("slug") or slugify(meta.get("title") or "") or None
+
+
+@dataclass
+class Change:
+    """Change Data Class to hold a single changed file (relative to project)"""
+
+    status: str  # A(dded), M(odified), D(eleted) or R(enamed)
+    path: str
+    old_path: str | None = None
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path in (self.old_path, self.path) if path]
+
+
+@dataclass
+class ChangeSet:
+    """Change Set Data Class to hold all files changed since a git revision"""
+
+    dest: Path
+    since: str
+    changes: list[Change]
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    @property
+    def present(self) -> set[str]:
+        """Files which exist now and differ from the revision"""
+        return {change.path for change in self.changes if change.status != "D"}
+
+    def touches(self, *folders_: str) -> bool:
+        """True if any file in (or equal to) one of ``folders_`` changed"""
+        return any(
+            path == folder or path.startswith(f"{folder.rstrip('/')}/")
+            for change in self.changes
+            for path in change.paths
+            for folder in folders_
+        )
+
+    def old_slug(self, path_: str) -> str | None:
+        """Slug of a markdown file as it was at the revision"""
+        return slug_of(git(self.dest, "show", f"{self.since}:./{path_}"))
+
+    def new_slug(self, path_: str) -> str | None:
+        """Slug of a markdown file as it is now"""
+        return slug_of(Path(self.dest, path_).read_text(encoding="utf-8"))
+
+    @classmethod
+    def from_git(cls, dest_: Path, since_: str, paths_: list[str]) -> Self:
+        """Changed, added, renamed and deleted files under ``paths_``.
+
+        Compares the revision against the working tree, so uncommitted and
+        untracked (but not ignored) files are part of the change set as well.
+        """
+        git(dest_, "rev-parse", "--verify", "--quiet", f"{since_}^{{commit}}")
+
+        tokens = git(
+            dest_,
+            "diff",
+            "--name-status",
+            "-z",
+            "-M",
+            "--relative",
+            since_,
+            "--",
+            *paths_,
+        ).split("\0")
+        changes, position = [], 0
+        while position < len(tokens) and tokens[position]:
+            status = tokens[position][0]
+            if status == "R":
+                changes.append(
+                    Change(
+                        status=status,
+                        path=tokens[position + 2],
+                        old_path=tokens[position + 1],
+                    )
+                )
+                position += 3
+            elif status == "C":
+                changes.append(Change(status="A", path=tokens[position + 2]))
+                position += 3
+            else:
+                changes.append(Change(status=status, path=tokens[position + 1]))
+                position += 2
+
+        for path in git(
+            dest_, "ls-files", "--others", "--exclude-standard", "-z", "--", *paths_
+        ).split("\0"):
+            if path:
+                changes.append(Change(status="A", path=path))
+
+        return cls(dest=dest_, since=since_, changes=changes)
@@ -36,6 +36,7 @@ SOFTWARE.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import os
+import json
 import logging
 
 from pathlib import Path
@@ -53,6 +54,13 @@ import click
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from .api import Meetlify
+from .batch import build_all
+from .constants import CACHE_FOLDER
+from .daemon import BuildDaemon, BuildLock, serve, status, trigger
+from .memory import MemoryProfiler
+from .progress import OUTPUTS_LOGGER, EventStream
+from .shards import Shard
+from .targets import archive_target
 from .utils import initialize
 
 
@@ -66,6 +74,15 @@ logging.basicConfig(
 logging.getLogger("meetlify").propagate = True
 
 
+def report_memory(profiler_: MemoryProfiler, mtlfy_: Meetlify) -> None:
+    """Print the memory report and save it next to the phase timings"""
+    json_file = Path(mtlfy_.dest, CACHE_FOLDER, "memory.json")
+    profiler_.save(json_file, mtlfy_.timings)
+    profiler_.stop()
+    click.echo(str(profiler_))
+    click.echo(f"Memory report saved to {json_file}")
+
+
 @click.group()
 def main():
     pass
@@ -96,39 +113,225 @@ def clean():
 @click.option("--posts/--no-posts", default=False)
 @click.option("--assets/--no-assets", default=False)
 @click.option("--sitemap/--no-sitemap", default=False)
-def make(meetups, home, pages, posts, assets, sitemap):
+@click.option("--feeds/--no-feeds", default=False)
+@click.option("--search/--no-search", default=False)
+@click.option("--jobs", type=int, default=None, help="Parallel render jobs")
+@click.option("--store/--no-store", default=None, help="Use SQLite content store")
+@click.option("--shard", default=None, help="Render detail pages of shard i/n only")
+@click.option("--since", default=None, help="Rebuild files changed since git rev")
+@click.option(
+    "--rename-redirects/--no-rename-redirects",
+    default=False,
+    help="Redirect old urls of renamed content (with --since)",
+)
+@click.option(
+    "--dates",
+    type=click.Choice(["mtime", "git", "content"]),
+    default=None,
+    help="Source of last modified dates",
+)
+@click.option("--plan", is_flag=True, help="Report what a build would change")
+@click.option("--plan-json", is_flag=True, help="Report the plan as JSON")
+@click.option("--template-stats", is_flag=True, help="Report render time per template")
+@click.option("--archive", default=None, help="Write outputs to a zip or tar.gz file")
+@click.option("--verbose", is_flag=True, help="Log every written output")
+@click.option(
+    "--events",
+    type=click.File("a"),
+    default=None,
+    help="Append build events as JSON lines to a file (- for stdout)",
+)
+@click.option(
+    "--memory-report", is_flag=True, help="Report memory usage per build phase"
+)
+def make(
+    meetups,
+    home,
+    pages,
+    posts,
+    assets,
+    sitemap,
+    feeds,
+    search,
+    jobs,
+    store,
+    shard,
+    since,
+    rename_redirects,
+    dates,
+    plan,
+    plan_json,
+    template_stats,
+    archive,
+    verbose,
+    events,
+    memory_report,
+):
     click.echo("Make Current Project")
-    mtlfy = Meetlify(dest_=Path(os.getcwd()))
-
+    if verbose:
+        OUTPUTS_LOGGER.setLevel(logging.DEBUG)
+
+    # one build of the project at a time (e.g. next to a daemon), shards render
+    # into their own output folders and plans write nothing
+    if not (shard or plan or plan_json):
+        click.get_current_context().with_resource(BuildLock(Path(os.getcwd())))
+
+    profiler = None
+    if memory_report:
+        profiler = MemoryProfiler()
+        profiler.start()
+
+    mtlfy = Meetlify(
+        dest_=Path(os.getcwd()),
+        jobs_=jobs,
+        store_=store,
+        shard_=Shard.from_string(shard) if shard else None,
+        since_=since,
+        dates_=dates,
+        target_=archive_target(Path(archive)) if archive else None,
+        plan_=plan or plan_json,
+    )
+    if events:
+        mtlfy.listeners.append(EventStream(events))
+
+    if profiler:
+        profiler.measure("load")
+        profiler.measure_collections(
+            exclude_=(mtlfy.store, mtlfy.renderer),
+            meetups=mtlfy.meetups,
+            posts=mtlfy.posts,
+            pages=mtlfy.pages,
+            categories=mtlfy.categories,
+            sitemaps=mtlfy.sitemaps,
+            site=mtlfy.site,
+        )
+        mtlfy.listeners.append(profiler)
+
+    if shard:
+        mtlfy.make_shard()
+        if profiler:
+            report_memory(profiler, mtlfy)
+        return
+
+    if plan or plan_json:
+        build_plan = mtlfy.make_plan()
+        click.echo(
+            json.dumps(build_plan.to_dict(), indent=1) if plan_json else str(build_plan)
+        )
+        # like `terraform plan -detailed-exitcode`: 2 if the build changes outputs
+        raise SystemExit(2 if len(build_plan) else 0)
+
+    phases = []
     if home:
-        mtlfy.render_home()
-        mtlfy.render_404_page()
+        phases += [mtlfy.render_home, mtlfy.render_404_page]
 
     if meetups:
-        mtlfy.render_meetups()
+        phases += [mtlfy.render_meetups, mtlfy.render_archives, mtlfy.render_calendars]
 
     if pages:
-        mtlfy.render_pages()
+        phases.append(mtlfy.render_pages)
 
     if posts:
-        mtlfy.render_posts()
+        phases.append(mtlfy.render_posts)
 
     if sitemap:
-        mtlfy.render_redirects()
-        mtlfy.render_robots_txt()
-        mtlfy.render_sitemaps()
+        phases += [
+            mtlfy.render_redirects,
+            mtlfy.render_robots_txt,
+            mtlfy.render_sitemaps,
+        ]
+
+    if feeds:
+        phases.append(mtlfy.render_feeds)
+
+    if search:
+        phases.append(mtlfy.render_search)
 
     if assets:
-        mtlfy.copy_assests()
-
-    if not any([meetups, home, pages, posts, assets, sitemap]):
-        mtlfy.render_home()
-        mtlfy.render_404_page()
-        mtlfy.render_meetups()
-        mtlfy.render_posts()
-        mtlfy.render_categories()
-        mtlfy.render_pages()
-        mtlfy.render_redirects()
-        mtlfy.render_sitemaps()
-        mtlfy.render_robots_txt()
-        mtlfy.copy_assests()
+        phases.append(mtlfy.copy_assests)
+
+    if phases:
+        mtlfy.run(*phases)
+        mtlfy.flush()
+    else:
+        mtlfy.make(redirects_=rename_redirects)
+
+    if template_stats:
+        click.echo(str(mtlfy.templates))
+
+    if profiler:
+        report_memory(profiler, mtlfy)
+
+
+@main.command("templates", help="Show Template Dependencies")
+@click.option("--changed", default=None, help="List outputs invalidated by template")
+def templates(changed):
+    mtlfy = Meetlify(dest_=Path(os.getcwd()))
+    analyzer = mtlfy.templates
+    if changed:
+        assert changed in analyzer.graph, f"unknown template '{changed}'"
+        for output in analyzer.invalidated(mtlfy.manifest, changed):
+            click.echo(output)
+        return
+
+    for name, references in analyzer.graph.items():
+        dynamic = " (dynamic)" if name in analyzer.dynamic else ""
+        click.echo(f"{name}{dynamic}: {', '.join(sorted(references))}")
+
+
+@main.command("merge", help="Merge Shards and Make Global Pages")
+@click.option("--jobs", type=int, default=None, help="Parallel render jobs")
+@click.option("--store/--no-store", default=None, help="Use SQLite content store")
+def merge(jobs, store):
+    click.echo("Merge Shards")
+    with BuildLock(Path(os.getcwd())):
+        Meetlify(dest_=Path(os.getcwd()), jobs_=jobs, store_=store).merge()
+
+
+@main.command("make-all", help="Make Several Projects In One Run")
+@click.argument("folders", nargs=-1, type=click.Path(exists=True, file_okay=False))
+@click.option("--workers", type=int, default=1, help="Parallel worker processes")
+@click.option("--jobs", type=int, default=None, help="Parallel render jobs per site")
+def make_all(folders, workers, jobs):
+    click.echo("Make All Projects")
+    dests = [Path(folder).resolve() for folder in folders] or sorted(
+        folder
+        for folder in Path(os.getcwd()).iterdir()
+        if Path(folder, "configs.json").exists()
+    )
+    for dest in dests:
+        click.get_current_context().with_resource(BuildLock(dest))
+    report = build_all(dests_=dests, workers_=workers, jobs_=jobs)
+    click.echo(str(report))
+    if report.failed:
+        raise SystemExit(1)
+
+
+@main.command("daemon", help="Rebuild Current Project When Triggered")
+@click.option("--host", default="127.0.0.1", help="Address of the trigger endpoint")
+@click.option("--port", type=int, default=8765, help="Port of the trigger endpoint")
+@click.option("--debounce", type=float, default=2.0, help="Seconds without triggers")
+@click.option("--jobs", type=int, default=None, help="Parallel render jobs")
+def daemon(host, port, debounce, jobs):
+    builder = BuildDaemon(dest_=Path(os.getcwd()), debounce_=debounce, jobs_=jobs)
+    server = serve(builder, host, port)
+    click.echo(f"Rebuild on POST http://{host}:{port}/build, see /status")
+
+    builder.start()
+    builder.trigger("startup")  # warms up template and markdown caches
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        builder.stop()
+
+
+@main.command("trigger", help="Trigger A Rebuild Of A Running Daemon")
+@click.option("--url", default="http://127.0.0.1:8765", help="Address of the daemon")
+@click.option("--reason", default="manual", help="Reason shown in build status")
+@click.option("--status", "show_status", is_flag=True, help="Only show build status")
+def trigger_build(url, reason, show_status):
+    reply = status(url) if show_status else trigger(url, reason)
+    click.echo(json.dumps(reply, indent=1))
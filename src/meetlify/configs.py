@@ -38,7 +38,8 @@ SOFTWARE.
 import json
 import codecs
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -75,6 +76,7 @@ class Folders:
     pages: str
     posts: str
     categories: str
+    snippets: str = "snippets"  # markdown snippets included with shortcodes
 
 
 @dataclass
@@ -100,6 +102,18 @@ class Configs:
     menu: Menu
     about_us: list[str]
     banners: list[Banner]
+    feeds_limit: int = 20
+    calendars: bool = True
+    search: bool = True
+    page_size: int = 12
+    store: bool = False
+    redirects: list[str] = field(default_factory=lambda: ["netlify"])
+    slug_redirects: bool = True
+    news_days: int = 0  # posts of the last days in sitemap-news.xml, 0 for none
+    dates: str = "mtime"  # last modified dates from mtime, git or content
+    writers: int = 4  # threads writing rendered outputs behind rendering
+    fsync: bool = False  # fsync every written output, e.g. on network drives
+    highlight: str = ""  # pygments style of fenced code blocks, e.g. "default"
 
     @classmethod
     def from_json(cls, json_file_: Path):
@@ -128,11 +142,26 @@ class Configs:
                 menu=Menu(**cfgs.get("menu")),
                 about_us=cfgs.get("about_us"),
                 banners=[Banner(**banner) for banner in cfgs.get("banners")],
+                feeds_limit=cfgs.get("feeds_limit", 20),
+                calendars=cfgs.get("calendars", True),
+                search=cfgs.get("search", True),
+                page_size=cfgs.get("page_size", 12),
+                store=cfgs.get("store", False),
+                redirects=cfgs.get("redirects", ["netlify"]),
+                slug_redirects=cfgs.get("slug_redirects", True),
+                news_days=cfgs.get("news_days", 0),
+                dates=cfgs.get("dates", "mtime"),
+                writers=cfgs.get("writers", 4),
+                fsync=cfgs.get("fsync", False),
+                highlight=cfgs.get("highlight", ""),
             )
 
+    @cached_property
+    def banner_index(self) -> dict[str, Banner]:
+        return {banner.name: banner for banner in self.banners}
+
     def get_banner(self, banner_name: str) -> Banner:
 
-        return next(
-            (banner for banner in self.banners if banner.name == banner_name),
-            Banner(name=None, type_="", message=""),
+        return self.banner_index.get(banner_name) or Banner(
+            name=None, type_="", message=""
         )
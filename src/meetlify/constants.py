@@ -47,6 +47,8 @@ VERSION_REVISION = 12
 
 FULL_VERSION = f"{VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_REVISION}"
 
+CACHE_FOLDER = ".meetlify"  # build state kept between runs, relative to project
+
 
 class ExtendedEnum(Enum):
     """An extended enum class to convert list of items in an enumration."""
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\context.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from dataclasses import dataclass, field
+from functools import partial
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .configs import Banner, Configs, Menu
+from .constants import STATUS
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@dataclass
+class SiteContext:
+    """Site wide template data, computed once per build and shared by all pages.
+
+    Registered as jinja globals ``meta``, ``site`` and ``partial``, so render
+    calls only pass page specific data. Partials rendered with ``partial()``
+    only see these globals and are rendered once per build.
+    """
+
+    meta: Configs
+    menu: Menu
+    meetups: list = field(default_factory=list)  # next upcoming meetups
+    posts: list = field(default_factory=list)  # latest published posts
+    categories: list = field(default_factory=list)  # all published categories
+    banners: dict[str, Banner] = field(default_factory=dict)
+    partials: dict[str, Markup] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_site(cls, configs_: Configs, meetups_, posts_, categories_, count_=3):
+        return cls(
+            meta=configs_,
+            menu=configs_.menu,
+            meetups=meetups_.next(count_),
+            posts=posts_[STATUS.PUBLISHED, STATUS.DONE][0:count_],
+            categories=categories_[STATUS.PUBLISHED, STATUS.DONE],
+            banners=configs_.banner_index,
+        )
+
+    def banner(self, name_: str) -> Banner:
+        return self.banners.get(name_) or Banner(name=None, type_="", message="")
+
+    def partial(self, renderer_: Environment, name_: str) -> Markup:
+        if name_ not in self.partials:
+            self.partials[name_] = Markup(renderer_.get_template(name_).render())
+        return self.partials[name_]
+
+    def register(self, renderer_: Environment) -> None:
+        renderer_.globals.update(
+            meta=self.meta, site=self, partial=partial(self.partial, renderer_)
+        )
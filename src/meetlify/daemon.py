@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\daemon.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import json
+import logging
+import urllib.request
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Condition, Thread, get_ident
+from time import monotonic, sleep
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .batch import SiteReport, build_site
+from .constants import CACHE_FOLDER
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class BuildLock:
+    """Lock file serializing builds writing to the output folder of a project.
+
+    The pid is written to a claim file first, which is then linked to the
+    lock file, so a lock file never exists without the pid of its owner.
+    Locks left behind by a process which no longer runs are taken over:
+    the lock file is renamed out of the way first, so only one of several
+    waiting builds can take it over, and put back if its owner still runs.
+    """
+
+    def __init__(self, dest_: Path, timeout_: float = 600.0) -> None:
+        self.lock_file = Path(dest_, CACHE_FOLDER, "build.lock")
+        self.timeout = timeout_
+
+    @staticmethod
+    def alive(pid_: int) -> bool:
+        try:
+            os.kill(pid_, 0)
+        except PermissionError:
+            return True  # runs as another user
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def pid(path_: Path) -> int | None:
+        try:
+            return int(path_.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def owner(self) -> int | None:
+        pid = self.pid(self.lock_file)
+        if pid is None or not self.alive(pid):
+            return None
+        return pid
+
+    def take_over(self, claim_: Path) -> None:
+        """Remove the lock file if its owner no longer runs"""
+        stale = claim_.with_name(f"{claim_.name}.stale")
+        try:
+            os.rename(self.lock_file, stale)
+        except FileNotFoundError:
+            return  # taken over by another build meanwhile
+        pid = self.pid(stale)
+        if pid is not None and self.alive(pid):
+            # a fresh lock of another build, which was linked meanwhile
+            try:
+                os.link(stale, self.lock_file)
+            except FileExistsError:
+                logging.warning("... build lock of %d replaced by another build", pid)
+        stale.unlink()
+
+    def __enter__(self):
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        claim = self.lock_file.with_name(
+            f"{self.lock_file.name}.{os.getpid()}.{get_ident()}"
+        )
+        claim.write_text(str(os.getpid()))
+        try:
+            waited = 0.0
+            while True:
+                try:
+                    os.link(claim, self.lock_file)
+                    return self
+                except FileExistsError:
+                    if self.owner() is None:
+                        self.take_over(claim)
+                        continue
+                    if self.timeout <= waited:
+                        raise TimeoutError(f"{self.lock_file} held by {self.owner()}")
+                    sleep(0.1)
+                    waited += 0.1
+        finally:
+            claim.unlink(missing_ok=True)
+
+    def __exit__(self, *exc_info_) -> None:
+        # never remove a lock which was taken over by another build
+        if self.pid(self.lock_file) == os.getpid():
+            self.lock_file.unlink(missing_ok=True)
+
+
+@dataclass
+class BuildRecord:
+    """Build Record Data Class to hold one build of the daemon"""
+
+    number: int
+    started: str
+    reasons: list[str]  # reasons of all triggers coalesced into this build
+    report: SiteReport
+
+    @property
+    def triggers(self) -> int:
+        return len(self.reasons)
+
+
+class BuildDaemon:
+    """Rebuilds a project whenever it is triggered, keeping caches warm.
+
+    Triggers are debounced: a build starts once no trigger arrived for
+    ``debounce`` seconds, and all triggers up to then (also those arriving
+    during a running build) are coalesced into a single build. Builds run
+    one after another in this process. Every build loads the site again
+    (configs, theme and content may have changed), but compiled templates
+    and converted markdown are memoized per process, so only new or changed
+    files are converted, and pages whose inputs did not change are skipped.
+    """
+
+    def __init__(
+        self,
+        *,
+        dest_: Path,
+        debounce_: float = 2.0,
+        jobs_: int | None = None,
+        history_: int = 20,
+        build_=build_site,
+    ) -> None:
+        assert isinstance(dest_, Path)
+        assert 0 <= debounce_
+
+        self.dest = dest_
+        self.debounce = debounce_
+        self.jobs = jobs_
+        self.build = build_  # (dest, jobs) -> SiteReport
+        self.records = deque(maxlen=history_)  # most recent builds
+        self.pending = []  # reasons of triggers waiting for the next build
+        self.building = False
+        self.stopped = False
+        self.condition = Condition()
+        self.last_trigger = 0.0
+        self.builds = 0
+        self.thread = Thread(target=self.loop, name="meetlify-daemon", daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    def trigger(self, reason_: str = "webhook") -> int:
+        """Request a build, returns number of triggers waiting for it"""
+        with self.condition:
+            self.pending.append(reason_)
+            self.last_trigger = monotonic()
+            self.condition.notify_all()
+            return len(self.pending)
+
+    def quiet(self) -> bool:
+        """Wait until no trigger arrived for debounce seconds, False if stopped"""
+        while not self.stopped:
+            remaining = self.last_trigger + self.debounce - monotonic()
+            if remaining <= 0:
+                return True
+            self.condition.wait(remaining)
+        return False
+
+    def loop(self) -> None:
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                if not self.quiet():
+                    return
+                reasons, self.pending = self.pending, []
+                self.building = True
+
+            self.builds += 1
+            record = BuildRecord(
+                number=self.builds,
+                started=datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+                reasons=reasons,
+                report=SiteReport(dest=str(self.dest)),
+            )
+            logging.info("... build %d (%d triggers)", record.number, record.triggers)
+            try:
+                with BuildLock(self.dest):
+                    record.report = self.build(self.dest, self.jobs)
+            except Exception as error:
+                record.report.error = str(error)
+                logging.error("... build %d failed: %s", record.number, error)
+
+            with self.condition:
+                self.records.append(record)
+                self.building = False
+                self.condition.notify_all()
+
+    def wait(self, timeout_: float | None = None) -> bool:
+        """Wait until all triggers are built, False on timeout"""
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.pending and not self.building, timeout_
+            )
+
+    def status(self) -> dict:
+        with self.condition:
+            return {
+                "dest": str(self.dest),
+                "state": (
+                    "building"
+                    if self.building
+                    else ("pending" if self.pending else "idle")
+                ),
+                "pending": len(self.pending),
+                "builds": [
+                    {**asdict(record), "triggers": record.triggers}
+                    for record in self.records
+                ],
+            }
+
+
+class TriggerHandler(BaseHTTPRequestHandler):
+    """POST /build triggers a build, GET /status reports builds and timings"""
+
+    def reply(self, code_: int, object_: dict) -> None:
+        body = json.dumps(object_, indent=1).encode("utf-8")
+        self.send_response(code_)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/build":
+            self.reply(404, {"error": f"unknown endpoint {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            payload = {}
+        reason = payload.get("reason") if isinstance(payload, dict) else None
+        pending = self.server.builder.trigger(reason or "webhook")
+        self.reply(202, {"queued": True, "pending": pending})
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/status":
+            self.reply(404, {"error": f"unknown endpoint {self.path}"})
+            return
+        self.reply(200, self.server.builder.status())
+
+    def log_message(self, format, *args) -> None:
+        logging.info("... %s %s", self.address_string(), format % args)
+
+
+def serve(builder_: BuildDaemon, host_="127.0.0.1", port_=8765) -> ThreadingHTTPServer:
+    """HTTP server for the trigger and status endpoints of builder_"""
+    server = ThreadingHTTPServer((host_, port_), TriggerHandler)
+    server.builder = builder_
+    return server
+
+
+def trigger(url_: str, reason_: str = "manual") -> dict:
+    """Trigger a build of a running daemon, e.g. from a CMS hook"""
+    request = urllib.request.Request(
+        f"{url_.rstrip('/')}/build",
+        data=json.dumps({"reason": reason_}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def status(url_: str) -> dict:
+    with urllib.request.urlopen(f"{url_.rstrip('/')}/status") as response:
+        return json.load(response)
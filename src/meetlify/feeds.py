@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\feeds.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Self, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def as_utc(date_: datetime) -> datetime:
+    """Front matter dates are naive, file dates are UTC. Feeds need both in UTC."""
+    if date_.tzinfo is None:
+        return date_.replace(tzinfo=timezone.utc)
+    return date_.astimezone(timezone.utc)
+
+
+@dataclass
+class FeedItem:
+    """Feed Item Data Class to hold a single entry of a feed"""
+
+    id: str
+    url: str
+    title: str
+    author: str
+    summary: str
+    content: str
+    categories: list[str]
+    published: datetime
+    updated: datetime
+
+    @classmethod
+    def from_content(cls, content_, url_: str) -> Self:
+        """Create feed item from Post or Meetup"""
+        published = getattr(content_, "create_date", None) or getattr(
+            content_, "event_datetime"
+        )
+
+        return cls(
+            id=url_,
+            url=url_,
+            title=content_.title,
+            author=getattr(content_, "author", None)
+            or getattr(content_, "organizer", None),
+            summary=content_.description,
+            content=content_.content,
+            categories=content_.categories,
+            published=as_utc(published),
+            updated=as_utc(content_.last_modified),
+        )
+
+
+@dataclass
+class Feed:
+    """Feed Data Class to hold a feed for one collection"""
+
+    name: str
+    slug: str
+    title: str
+    URL: str
+    author: str
+    updated: datetime
+    items: list[FeedItem]
+
+    def write_atom(self, file_: TextIO) -> None:
+        """Stream feed as Atom 1.0 into an opened file"""
+        file_.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        file_.write('<feed xmlns="http://www.w3.org/2005/Atom">\n')
+        file_.write(f"  <id>{escape(self.URL)}/{self.slug}/</id>\n")
+        file_.write(f"  <title>{escape(self.title)}</title>\n")
+        file_.write(f"  <updated>{self.updated.isoformat()}</updated>\n")
+        file_.write(f"  <author><name>{escape(self.author or '')}</name></author>\n")
+        file_.write(f"  <link href={quoteattr(self.URL + '/')} />\n")
+        file_.write(
+            f"  <link rel=\"self\" href={quoteattr(f'{self.URL}/{self.slug}/feed.xml')} />\n"
+        )
+        file_.write(
+            '  <generator uri="https://github.com/pybodensee/meetlify">Meetlify</generator>\n'
+        )
+
+        for item in self.items:
+            file_.write("  <entry>\n")
+            file_.write(f"    <id>{escape(item.id)}</id>\n")
+            file_.write(f"    <title>{escape(item.title or '')}</title>\n")
+            file_.write(f"    <link href={quoteattr(item.url)} />\n")
+            file_.write(f"    <published>{item.published.isoformat()}</published>\n")
+            file_.write(f"    <updated>{item.updated.isoformat()}</updated>\n")
+            if item.author:
+                file_.write(
+                    f"    <author><name>{escape(item.author)}</name></author>\n"
+                )
+            for category in item.categories:
+                file_.write(f"    <category term={quoteattr(category)} />\n")
+            file_.write(f"    <summary>{escape(item.summary or '')}</summary>\n")
+            file_.write(
+                f'    <content type="html">{escape(item.content or "")}</content>\n'
+            )
+            file_.write("  </entry>\n")
+
+        file_.write("</feed>\n")
+
+    def write_json(self, file_: TextIO) -> None:
+        """Stream feed as JSON Feed 1.1 into an opened file"""
+        file_.write("{\n")
+        file_.write('  "version": "https://jsonfeed.org/version/1.1",\n')
+        file_.write(f'  "title": {json.dumps(self.title)},\n')
+        file_.write(f'  "home_page_url": {json.dumps(self.URL + "/")},\n')
+        file_.write(
+            f'  "feed_url": {json.dumps(f"{self.URL}/{self.slug}/feed.json")},\n'
+        )
+        file_.write(f'  "authors": [{{"name": {json.dumps(self.author)}}}],\n')
+        file_.write('  "items": [')
+
+        for index, item in enumerate(self.items):
+            file_.write("," if index else "")
+            file_.write("\n    ")
+            file_.write(
+                json.dumps(
+                    {
+                        "id": item.id,
+                        "url": item.url,
+                        "title": item.title,
+                        "summary": item.summary,
+                        "content_html": item.content,
+                        "tags": item.categories,
+                        "authors": [{"name": item.author}] if item.author else [],
+                        "date_published": item.published.isoformat(),
+                        "date_modified": item.updated.isoformat(),
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+        file_.write("\n  ]\n}\n")
+
+    @classmethod
+    def from_dict(cls, object_: dict) -> Self:
+        return cls(
+            name=object_.get("name"),
+            slug=object_.get("slug"),
+            title=object_.get("title"),
+            URL=object_.get("URL"),
+            author=object_.get("author"),
+            updated=object_.get("updated"),
+            items=object_.get("items"),
+        )
+
+
+class Feeds:
+    def __init__(self, *, feed_items_: list[dict], limit_: int, URL_: str) -> None:
+        self.all_feeds = []
+
+        for feed_item in feed_items_:
+            items = [
+                FeedItem.from_content(
+                    content, f"{URL_}/{feed_item.get('folder')}/{content.slug}/"
+                )
+                for content in feed_item.get("items")[0:limit_]
+            ]
+
+            self.all_feeds.append(
+                Feed.from_dict(
+                    {
+                        "name": feed_item.get("name"),
+                        "slug": feed_item.get("slug"),
+                        "title": feed_item.get("title"),
+                        "URL": URL_,
+                        "author": feed_item.get("author"),
+                        "updated": max((item.updated for item in items), default=EPOCH),
+                        "items": items,
+                    }
+                )
+            )
+
+    def __iter__(self):
+        return iter(self.all_feeds)
+
+    def __len__(self) -> int:
+        return len(self.all_feeds)
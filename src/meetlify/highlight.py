@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\highlight.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import html
+import json
+import codecs
+import hashlib
+import logging
+from pathlib import Path
+from threading import Lock
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from markdown.extensions import Extension
+from markdown.preprocessors import Preprocessor
+
+try:
+    import pygments
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.lexers.special import TextLexer
+    from pygments.util import ClassNotFound
+except ImportError:  # optional, pip install meetlify[highlight]
+    pygments = None
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+FENCED_BLOCK_RE = re.compile(
+    r"^(?P<fence>`{3,}|~{3,})[ ]*\{?\.?(?P<lang>[\w#.+-]*)\}?[ ]*\n"
+    r"(?P<code>.*?)(?<=\n)(?P=fence)[ ]*$",
+    re.MULTILINE | re.DOTALL,
+)
+
+CSS_CLASS = "highlight"
+
+
+class CodeHighlighter:
+    """Highlighted html of code blocks, cached by code, language and style.
+
+    Every site has its own highlighter. Highlighted blocks are shared by all
+    documents of the site and, with a cache file, by all its builds, so every
+    distinct code block is only highlighted once. Without Pygments code
+    blocks are escaped but not highlighted.
+
+    Highlighters with the same settings compare equal, so converted markdown
+    is memoized by the settings and not by the site (see convert_markdown).
+    """
+
+    def __init__(self, *, style_: str | None, json_file_: Path | None = None) -> None:
+        if style_ and pygments is None:
+            logging.warning("... install pygments to highlight code blocks")
+        self.style = style_ or None  # pygments style, None disables highlighting
+        self.cache = {}  # digest -> html of highlighted code block
+        self.json_file = json_file_
+        self.highlighted = 0  # code blocks highlighted (not found in cache)
+        self.changed = False
+        self.lock = Lock()
+
+        if json_file_ is not None and json_file_.exists():
+            with codecs.open(json_file_, "r", encoding="utf-8") as f:
+                self.cache.update(json.load(f))
+
+    def __eq__(self, other_) -> bool:
+        return isinstance(other_, CodeHighlighter) and self.version == other_.version
+
+    def __hash__(self) -> int:
+        return hash(self.version)
+
+    @property
+    def version(self) -> str:
+        """Highlighting settings, parsed content depends on them"""
+        if self.style is None:
+            return ""
+        return f"{self.style}:{pygments.__version__ if pygments else 'plain'}"
+
+    def highlight(self, code_: str, lang_: str) -> str:
+        digest = hashlib.sha1(f"{self.version}\0{lang_}\0{code_}".encode()).hexdigest()
+        with self.lock:
+            if digest in self.cache:
+                return self.cache[digest]
+
+        if pygments is None:
+            language = f' class="language-{lang_}"' if lang_ else ""
+            block = f"<pre><code{language}>{html.escape(code_)}</code></pre>"
+        else:
+            try:
+                lexer = get_lexer_by_name(lang_) if lang_ else TextLexer()
+            except ClassNotFound:
+                lexer = TextLexer()
+            block = pygments.highlight(
+                code_, lexer, HtmlFormatter(cssclass=CSS_CLASS, wrapcode=True)
+            )
+
+        with self.lock:
+            self.cache[digest] = block
+            self.highlighted += 1
+            self.changed = True
+        return block
+
+    def stylesheet(self) -> str:
+        """Stylesheet of the configured style for all highlighted blocks"""
+        if pygments is None or self.style is None:
+            return ""
+        return HtmlFormatter(style=self.style).get_style_defs(f".{CSS_CLASS}")
+
+    def save(self) -> None:
+        if self.json_file is None or not self.changed:
+            return
+
+        with self.lock:
+            self.json_file.parent.mkdir(parents=True, exist_ok=True)
+            with codecs.open(self.json_file, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f, sort_keys=True)
+            self.changed = False
+        logging.info("... highlighted %d code blocks", self.highlighted)
+
+
+class FencedCodePreprocessor(Preprocessor):
+    """Replace fenced code blocks by their (cached) highlighted html"""
+
+    def __init__(self, md, highlighter_: CodeHighlighter) -> None:
+        super().__init__(md)
+        self.highlighter = highlighter_
+
+    def run(self, lines):
+        text = "\n".join(lines)
+        while match := FENCED_BLOCK_RE.search(text):
+            block = self.highlighter.highlight(match.group("code"), match.group("lang"))
+            placeholder = self.md.htmlStash.store(block)
+            text = f"{text[: match.start()]}\n{placeholder}\n{text[match.end():]}"
+        return text.split("\n")
+
+
+class HighlightExtension(Extension):
+    def __init__(self, highlighter_: CodeHighlighter, **kwargs) -> None:
+        self.highlighter = highlighter_
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md):
+        # after meta data was removed, before raw html blocks, like fenced_code
+        md.preprocessors.register(
+            FencedCodePreprocessor(md, self.highlighter), "highlight", 25
+        )
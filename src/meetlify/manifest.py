@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\manifest.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import codecs
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Self
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def fingerprint(*objects_) -> str:
+    """Stable digest for any number of (data class) objects.
+
+    Uses ``repr`` so that data classes, datetimes, lists and dicts of them all
+    hash to the same value between runs as long as their content is identical.
+    """
+    digest = hashlib.sha1()
+    for object_ in objects_:
+        digest.update(repr(object_).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Manifest Entry Data Class to hold fingerprint of a single output file"""
+
+    digest: str
+    inputs: dict[str, str] | None = None  # digest per input, to explain changes
+
+    @classmethod
+    def from_dict(cls, object_: dict) -> Self:
+        return cls(digest=object_.get("digest"), inputs=object_.get("inputs"))
+
+
+class Manifest:
+    """Outputs written by previous build, keyed by path relative to output folder"""
+
+    def __init__(self, *, json_file_: Path, entries_: dict) -> None:
+        self.json_file = json_file_
+        self.entries = {
+            output: ManifestEntry.from_dict(entry) for output, entry in entries_.items()
+        }
+
+    def __contains__(self, output_: str) -> bool:
+        return output_ in self.entries
+
+    def is_fresh(self, output_: str, digest_: str, root_: Path) -> bool:
+        """True if ``output_`` exists and was written from identical inputs."""
+        entry = self.entries.get(output_)
+        return (
+            entry is not None
+            and entry.digest == digest_
+            and Path(root_, output_).exists()
+        )
+
+    def record(
+        self, output_: str, digest_: str, inputs_: dict[str, str] | None = None
+    ) -> None:
+        self.entries[output_] = ManifestEntry(digest=digest_, inputs=inputs_)
+
+    def forget(self, output_: str) -> None:
+        self.entries.pop(output_, None)
+
+    def outputs(self, prefix_: str = "") -> list[str]:
+        return [output for output in self.entries if output.startswith(prefix_)]
+
+    def save(self) -> None:
+        if self.json_file is None:
+            return  # manifest of a build without persistent outputs
+
+        self.json_file.parent.mkdir(parents=True, exist_ok=True)
+        with codecs.open(self.json_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    output: {
+                        key: value
+                        for key, value in asdict(entry).items()
+                        if value is not None
+                    }
+                    for output, entry in self.entries.items()
+                },
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+
+    @classmethod
+    def from_json(cls, json_file_: Path) -> Self:
+        assert isinstance(json_file_, Path)
+        if not json_file_.exists():
+            return cls(json_file_=json_file_, entries_={})
+
+        with codecs.open(json_file_, "r", encoding="utf-8") as f:
+            return cls(json_file_=json_file_, entries_=json.load(f))
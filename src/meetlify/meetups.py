@@ -35,24 +35,22 @@ SOFTWARE.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+from bisect import bisect_left
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Self
 
 
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# 3rd PARTY LIBRARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from slugify import slugify
-
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from .constants import STATUS
-from .utils import markdown_convertor
+from .store import ContentStore
+from .utils import MarkdownConvertor, markdown_convertor, markdown_files, slugify
+from .slugs import SlugRegistry
+from .reproducible import build_time, last_modified
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -74,13 +72,19 @@ class Meetup:
     content: str
     add_to_sitemap: bool
     status: str  # TODO: replace with STATUS ENUM
+    images: list[str] = field(default_factory=list)  # sources in content
 
     def __lt__(self, other_: Self) -> bool:
         return self.event_datetime < other_.event_datetime
 
     @classmethod
-    def from_markdown(cls, meetup_md_: Path) -> Self:
-        meta, toc, content = markdown_convertor(meetup_md_)
+    def from_markdown(
+        cls,
+        meetup_md_: Path,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ) -> Self:
+        meta, toc, content, images = convertor_(meetup_md_)
         return cls(
             title=meta.get("title"),
             description=meta.get("description"),
@@ -89,9 +93,7 @@ class Meetup:
             event_datetime=datetime.strptime(
                 meta.get("event_datetime"), "%Y-%m-%d::%H:%M"
             ),
-            last_modified=datetime.fromtimestamp(
-                meetup_md_.stat().st_mtime, tz=timezone.utc
-            ),
+            last_modified=last_modified(meetup_md_, dates_),
             categories=[
                 category.strip() for category in meta.get("categories").split(",")
             ],
@@ -101,24 +103,99 @@ class Meetup:
             content=content,
             add_to_sitemap=bool(meta.get("add_to_sitemap")),
             status=meta.get("status"),
+            images=images,
         )
 
 
 class Meetups:
-    def __init__(self, *, path_: Path, reverse_: bool = True) -> None:
-        self.events = sorted(
-            [
-                Meetup.from_markdown(meetup_md)
-                for meetup_md in path_.iterdir()
-                if meetup_md.is_file() and meetup_md.suffix == ".md"
-            ],
-            reverse=reverse_,
+    def __init__(
+        self,
+        *,
+        path_: Path,
+        reverse_: bool = True,
+        store_: ContentStore | None = None,
+        slugs_: SlugRegistry | None = None,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ) -> None:
+        self.store = store_
+        self.reverse = reverse_
+        records = (
+            store_.load("meetups", path_, Meetup, dates_)
+            if store_
+            else [
+                Meetup.from_markdown(meetup_md, convertor_, dates_)
+                for meetup_md in markdown_files(path_)
+            ]
         )
+        if slugs_ is not None:
+            records = slugs_.register("meetups", path_, records, store_)
+        self.events = sorted(records, reverse=reverse_)
+
+        # published meetups in ascending order of event_datetime for bisection
+        self.timeline = sorted(
+            self[STATUS.PUBLISHED, STATUS.DONE],
+            key=lambda event: event.event_datetime,
+        )
+        self.timeline_keys = [event.event_datetime for event in self.timeline]
+
+    def _index(self, date_: datetime | None) -> int:
+        return bisect_left(self.timeline_keys, date_ or build_time())
+
+    def upcoming(self, now_: datetime | None = None) -> list[Meetup]:
+        """Published meetups from now on, next meetup first."""
+        return self.timeline[self._index(now_) :]
+
+    def past(self, now_: datetime | None = None) -> list[Meetup]:
+        """Published meetups before now, most recent meetup first."""
+        return self.timeline[: self._index(now_)][::-1]
+
+    def next(self, count_: int = 1, now_: datetime | None = None) -> list[Meetup]:
+        """Next ``count_`` published meetups from now on."""
+        start = self._index(now_)
+        return self.timeline[start : start + count_]
+
+    def between(self, start_: datetime, end_: datetime) -> list[Meetup]:
+        """Published meetups with start_ <= event_datetime < end_, ascending."""
+        return self.timeline[self._index(start_) : self._index(end_)]
+
+    def years(self) -> list[int]:
+        """Years with at least one published meetup, most recent year first."""
+        if not self.timeline:
+            return []
+
+        return [
+            year
+            for year in range(
+                self.timeline_keys[-1].year, self.timeline_keys[0].year - 1, -1
+            )
+            if self.by_year(year)
+        ]
+
+    def months(self, year_: int) -> list[int]:
+        """Months of ``year_`` with at least one published meetup, latest first."""
+        return [month for month in range(12, 0, -1) if self.by_month(year_, month)]
+
+    def by_year(self, year_: int) -> list[Meetup]:
+        return self.between(datetime(year_, 1, 1), datetime(year_ + 1, 1, 1))
+
+    def by_month(self, year_: int, month_: int) -> list[Meetup]:
+        end = (
+            datetime(year_ + 1, 1, 1)
+            if month_ == 12
+            else datetime(year_, month_ + 1, 1)
+        )
+        return self.between(datetime(year_, month_, 1), end)
 
     def __getitem__(self, status_: list[STATUS] | STATUS) -> list[Meetup]:
         if isinstance(status_, STATUS):
             status_ = [status_]
 
+        if self.store:
+            return self.store.query(
+                "meetups", Meetup, status_=status_, reverse_=self.reverse
+            )
+
         return [
             event
             for event in self.events
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\memory.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import sys
+import json
+import logging
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import FunctionType, ModuleType
+
+try:
+    import resource  # not available on windows
+except ImportError:
+    resource = None
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# objects shared by the whole process, not owned by a collection
+SHARED_TYPES = (type, ModuleType, FunctionType)
+
+
+def rss() -> tuple[int | None, int | None]:
+    """Current and peak resident set size of this process in bytes"""
+    current = peak = None
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on linux, bytes on macos
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    return current, peak
+
+
+def megabytes(size_: int | None) -> str:
+    return "-" if size_ is None else f"{size_ / 2**20:.1f}"
+
+
+def deep_size(object_, exclude_: tuple = ()) -> int:
+    """Approximate size of an object and everything it references in bytes"""
+    seen = {id(excluded) for excluded in exclude_}
+    size, stack = 0, [object_]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return size
+
+
+@dataclass
+class PhaseMemory:
+    """Phase Memory Data Class to hold memory readings at the end of a phase"""
+
+    phase: str
+    current: int  # bytes traced by tracemalloc
+    peak: int  # highest traced bytes during the phase
+    rss: int | None
+    rss_peak: int | None
+    top: list[dict] = field(default_factory=list)  # allocation sites of the phase
+
+
+class MemoryProfiler:
+    """Memory usage of a build, measured at the boundaries of its phases.
+
+    Tracing starts before the site is loaded, so the first ``load`` reading
+    covers the content collections. Used as build event listener, a reading
+    with the ``top`` allocation sites grown since the previous reading is
+    taken whenever a phase finished.
+    """
+
+    def __init__(self, *, top_: int = 10, frames_: int = 1) -> None:
+        self.top = top_
+        self.frames = frames_
+        self.phases: list[PhaseMemory] = []
+        self.collections: dict[str, int] = {}
+        self.snapshot = None
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        self.snapshot = None
+        tracemalloc.stop()
+
+    def measure(self, phase_: str) -> PhaseMemory:
+        """Record traced memory, RSS and top allocation sites since last reading"""
+        assert self.snapshot is not None, "memory profiler was not started"
+
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        top = [
+            {
+                "site": str(stat.traceback[0]),
+                "size": stat.size_diff,
+                "count": stat.count_diff,
+            }
+            for stat in snapshot.compare_to(self.snapshot, "lineno")[: self.top]
+            if stat.size_diff > 0
+        ]
+        self.snapshot = snapshot
+
+        reading = PhaseMemory(phase_, current, peak, *rss(), top=top)
+        self.phases.append(reading)
+        logging.info(
+            "... memory after %s: %.1f MB traced, %.1f MB peak",
+            phase_,
+            current / 2**20,
+            peak / 2**20,
+        )
+        return reading
+
+    def measure_collections(self, exclude_: tuple = (), **collections_) -> None:
+        """Sizes of the given collections, excluding objects shared by them"""
+        for name, collection in collections_.items():
+            self.collections[name] = deep_size(collection, exclude_)
+
+    def __call__(self, event_: dict) -> None:
+        if event_["event"] == "phase" and event_["state"] == "finished":
+            self.measure(event_["phase"])
+
+    def to_dict(self, timings_: dict | None = None) -> dict:
+        return {
+            "phases": [asdict(reading) for reading in self.phases],
+            "collections": dict(self.collections),
+            "timings": dict(timings_ or {}),
+        }
+
+    def save(self, json_file_: Path, timings_: dict | None = None) -> None:
+        json_file_.parent.mkdir(parents=True, exist_ok=True)
+        with open(json_file_, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(timings_), f, indent=1)
+
+    def __str__(self) -> str:
+        lines = [f"{'phase':<24} {'traced MB':>10} {'peak MB':>10} {'RSS MB':>10}"]
+        for reading in self.phases:
+            lines.append(
+                f"{reading.phase:<24} {megabytes(reading.current):>10}"
+                f" {megabytes(reading.peak):>10} {megabytes(reading.rss):>10}"
+            )
+
+        if self.collections:
+            lines += ["", f"{'collection':<24} {'kB':>10}"]
+            for name, size in sorted(self.collections.items(), key=lambda x: -x[1]):
+                lines.append(f"{name:<24} {size / 1024:>10.1f}")
+
+        lines += ["", "top allocation sites"]
+        for reading in self.phases:
+            for top in reading.top[:3]:
+                lines.append(
+                    f"{reading.phase:<24} {top['size'] / 1024:>9.1f}kB  {top['site']}"
+                )
+        return "\n".join(lines)
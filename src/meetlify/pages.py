@@ -35,21 +35,18 @@ SOFTWARE.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime, timezone
-
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# 3rd PARTY LIBRARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from slugify import slugify
+from dataclasses import dataclass, field
+from datetime import datetime
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from .utils import markdown_convertor
+from .utils import MarkdownConvertor, markdown_convertor, markdown_files, slugify
+from .slugs import SlugRegistry
+from .reproducible import last_modified
 from .constants import STATUS
+from .store import ContentStore
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -69,44 +66,69 @@ class Page:
     content: str
     add_to_sitemap: bool
     status: str
+    images: list[str] = field(default_factory=list)  # sources in content
 
     def __lt__(self, other_):
         return self.create_date < other_.create_date
 
     @classmethod
-    def from_markdown(cls, page_md_: Path):
-        meta, toc, content = markdown_convertor(page_md_)
+    def from_markdown(
+        cls,
+        page_md_: Path,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ):
+        meta, toc, content, images = convertor_(page_md_)
         return cls(
             title=meta.get("title"),
             author=meta.get("author"),
             description=meta.get("description"),
             slug=meta.get("slug") or slugify(meta.get("title")),
             create_date=datetime.strptime(meta.get("create_date"), "%Y-%m-%d::%H:%M"),
-            last_modified=datetime.fromtimestamp(
-                page_md_.stat().st_mtime, tz=timezone.utc
-            ),
+            last_modified=last_modified(page_md_, dates_),
             feature_image=meta.get("feature_image"),
             toc=toc,
             content=content,
             add_to_sitemap=bool(meta.get("add_to_sitemap")),
             status=meta.get("status"),
+            images=images,
         )
 
 
 class Pages:
-    def __init__(self, *, path_: Path, reverse_: bool = True) -> None:
-        self.content = sorted(
-            [
-                Page.from_markdown(page_md)
-                for page_md in path_.iterdir()
-                if page_md.is_file() and page_md.suffix == ".md"
-            ],
-            reverse=reverse_,
+    def __init__(
+        self,
+        *,
+        path_: Path,
+        reverse_: bool = True,
+        store_: ContentStore | None = None,
+        slugs_: SlugRegistry | None = None,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ) -> None:
+        self.store = store_
+        self.reverse = reverse_
+        records = (
+            store_.load("pages", path_, Page, dates_)
+            if store_
+            else [
+                Page.from_markdown(page_md, convertor_, dates_)
+                for page_md in markdown_files(path_)
+            ]
         )
+        if slugs_ is not None:
+            records = slugs_.register("pages", path_, records, store_)
+        self.content = sorted(records, reverse=reverse_)
 
     def __getitem__(self, status_: list[STATUS] | STATUS) -> list[Page]:
         if isinstance(status_, STATUS):
             status_ = [status_]
+
+        if self.store:
+            return self.store.query(
+                "pages", Page, status_=status_, reverse_=self.reverse
+            )
+
         return [
             content
             for content in self.content
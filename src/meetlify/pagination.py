@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\pagination.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from dataclasses import dataclass
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@dataclass
+class Pagination:
+    """Pagination Data Class to hold one page of a paginated collection"""
+
+    slug: str
+    number: int
+    total: int
+    items: list
+
+    @property
+    def output(self) -> str:
+        """Output file relative to output folder"""
+        return f"{self.url(self.number).strip('/')}/index.html"
+
+    @property
+    def previous(self) -> int | None:
+        return self.number - 1 if 1 < self.number else None
+
+    @property
+    def next(self) -> int | None:
+        return self.number + 1 if self.number < self.total else None
+
+    def url(self, number_: int) -> str:
+        """URL path of page ``number_``, first page lives at the collection root"""
+        if number_ == 1:
+            return f"/{self.slug}/"
+        return f"/{self.slug}/page/{number_}/"
+
+
+class Paginator:
+    def __init__(self, *, items_: list, slug_: str, per_page_: int) -> None:
+        assert 0 < per_page_
+
+        total = max((len(items_) + per_page_ - 1) // per_page_, 1)
+        self.slug = slug_
+        self.all_pages = [
+            Pagination(
+                slug=slug_,
+                number=number,
+                total=total,
+                items=items_[(number - 1) * per_page_ : number * per_page_],
+            )
+            for number in range(1, total + 1)
+        ]
+
+    def __getitem__(self, number_: int) -> Pagination:
+        return self.all_pages[number_ - 1]
+
+    def __iter__(self):
+        return iter(self.all_pages)
+
+    def __len__(self) -> int:
+        return len(self.all_pages)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\plan.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from dataclasses import dataclass, asdict
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .manifest import ManifestEntry
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+ACTIONS = ("create", "update", "remove")
+
+
+@dataclass
+class PlanItem:
+    """Plan Item Data Class to hold a single output a build would touch"""
+
+    output: str
+    action: str
+    reason: str
+
+
+class Plan:
+    """Outputs a build would create, update or remove and why, without writing.
+
+    Filled by a dry run of the manifest tracked build phases: every output is
+    compared against its entry of the previous build manifest and the digests
+    of its individual inputs tell which of them changed.
+    """
+
+    def __init__(self) -> None:
+        self.items = {}  # output -> PlanItem
+        self.unchanged = 0
+        self.parsed = {}  # kind -> (parsed, total) markdown files
+        self.untracked = []  # phases which always write their outputs
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(sorted(self.items.values(), key=lambda item: item.output))
+
+    def add(
+        self,
+        output_: str,
+        inputs_: dict[str, str],
+        entry_: ManifestEntry | None,
+        fresh_: bool,
+        exists_: bool,
+    ) -> None:
+        if fresh_:
+            self.unchanged += 1
+        elif entry_ is None:
+            self.items[output_] = PlanItem(output_, "create", "new output")
+        elif not exists_:
+            self.items[output_] = PlanItem(output_, "create", "output file missing")
+        else:
+            changed = [
+                name
+                for name, digest in inputs_.items()
+                if (entry_.inputs or {}).get(name) != digest
+            ]
+            reason = (
+                f"{', '.join(changed)} changed"
+                if entry_.inputs and changed
+                else "inputs changed"
+            )
+            self.items[output_] = PlanItem(output_, "update", reason)
+
+    def remove(self, output_: str, reason_: str) -> None:
+        self.items[output_] = PlanItem(output_, "remove", reason_)
+
+    def count(self, action_: str) -> int:
+        return sum(item.action == action_ for item in self.items.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "summary": {
+                **{action: self.count(action) for action in ACTIONS},
+                "unchanged": self.unchanged,
+                "parse": {
+                    kind: {"parsed": parsed, "total": total}
+                    for kind, (parsed, total) in self.parsed.items()
+                },
+                "untracked": self.untracked,
+            },
+            "outputs": [asdict(item) for item in self],
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            "Build Plan",
+            *(f"  {action:<10} {self.count(action):>6}" for action in ACTIONS),
+            f"  {'unchanged':<10} {self.unchanged:>6}",
+        ]
+        if self.parsed:
+            parse = ", ".join(
+                f"{parsed} of {total} {kind}"
+                for kind, (parsed, total) in self.parsed.items()
+            )
+            lines.append(f"  {'parse':<10} {parse}")
+        if self.untracked:
+            lines.append(f"  {'always':<10} {', '.join(self.untracked)}")
+        if self.items:
+            lines.append("")
+            lines.extend(
+                f"{item.action:<7} {item.output}  ({item.reason})" for item in self
+            )
+        return "\n".join(lines)
@@ -34,23 +34,19 @@ SOFTWARE.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-# 3rd PARTY LIBRARY IMPORTS
-# +++++++++++++++++++++++++++++++++++++++++++++++++++++
-
-from slugify import slugify
-
-
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from .constants import STATUS
-from .utils import markdown_convertor
+from .store import ContentStore
+from .utils import MarkdownConvertor, markdown_convertor, markdown_files, slugify
+from .slugs import SlugRegistry
+from .reproducible import last_modified
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -72,21 +68,25 @@ class Post:
     banner: str
     add_to_sitemap: bool
     status: STATUS
+    images: list[str] = field(default_factory=list)  # sources in content
 
     def __lt__(self, other_):
         return self.create_date < other_.create_date
 
     @classmethod
-    def from_markdown(cls, post_md_: Path):
-        meta, toc, content = markdown_convertor(post_md_)
+    def from_markdown(
+        cls,
+        post_md_: Path,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ):
+        meta, toc, content, images = convertor_(post_md_)
         return cls(
             title=meta.get("title"),
             author=meta.get("author"),
             description=meta.get("description"),
             create_date=datetime.strptime(meta.get("create_date"), "%Y-%m-%d::%H:%M"),
-            last_modified=datetime.fromtimestamp(
-                post_md_.stat().st_mtime, tz=timezone.utc
-            ),
+            last_modified=last_modified(post_md_, dates_),
             feature_image=meta.get("feature_image"),
             slug=meta.get("slug") or slugify(meta.get("title")),
             categories=[
@@ -97,23 +97,44 @@ class Post:
             banner=meta.get("banner"),
             add_to_sitemap=bool(meta.get("add_to_sitemap")),
             status=meta.get("status"),
+            images=images,
         )
 
 
 class Posts:
-    def __init__(self, *, path_: Path, reverse_: bool = True) -> None:
-        self.content = sorted(
-            [
-                Post.from_markdown(post_md)
-                for post_md in path_.iterdir()
-                if post_md.is_file() and post_md.suffix == ".md"
-            ],
-            reverse=reverse_,
+    def __init__(
+        self,
+        *,
+        path_: Path,
+        reverse_: bool = True,
+        store_: ContentStore | None = None,
+        slugs_: SlugRegistry | None = None,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dates_: dict[str, datetime] | None = None,
+    ) -> None:
+        self.store = store_
+        self.reverse = reverse_
+        records = (
+            store_.load("posts", path_, Post, dates_)
+            if store_
+            else [
+                Post.from_markdown(post_md, convertor_, dates_)
+                for post_md in markdown_files(path_)
+            ]
         )
+        if slugs_ is not None:
+            records = slugs_.register("posts", path_, records, store_)
+        self.content = sorted(records, reverse=reverse_)
 
     def __getitem__(self, status_: list[STATUS] | STATUS) -> list[Post]:
         if isinstance(status_, STATUS):
             status_ = [status_]
+
+        if self.store:
+            return self.store.query(
+                "posts", Post, status_=status_, reverse_=self.reverse
+            )
+
         return [
             content
             for content in self.content
@@ -121,6 +142,14 @@ class Posts:
         ]
 
     def by_categories(self) -> dict:
+        if self.store:
+            return self.store.by_categories(
+                "posts",
+                Post,
+                status_=[STATUS.PUBLISHED, STATUS.DONE],
+                reverse_=self.reverse,
+            )
+
         category_order = dict()
         for content in self.content:
             for category in content.categories:
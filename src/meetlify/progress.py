@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\progress.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import logging
+from threading import Lock
+from time import perf_counter
+from typing import Callable
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# per output lines, only shown with ``meetlify make --verbose``
+OUTPUTS_LOGGER = logging.getLogger("meetlify.outputs")
+
+
+class Progress:
+    """Aggregated progress of the running build phase.
+
+    Outputs are counted per action (written, unchanged) instead of logged one
+    by one. A progress line with rate and ETA (if the number of outputs is
+    known) is logged every ``interval`` seconds and when the phase finishes,
+    and each line is also emitted as ``progress`` build event.
+    """
+
+    def __init__(self, *, emit_: Callable[..., None], interval_: float = 5.0) -> None:
+        self.emit = emit_
+        self.interval = interval_
+        self.lock = Lock()
+        self.start("build")
+
+    def start(self, phase_: str) -> None:
+        with self.lock:
+            self.phase = phase_
+            self.counts = {}  # action -> number of outputs
+            self.total = None  # expected outputs, if known
+            self.started = self.reported = perf_counter()
+
+    def expect(self, count_: int) -> None:
+        """Announce count_ more outputs of this phase, enables the ETA"""
+        with self.lock:
+            self.total = (self.total or 0) + count_
+
+    def advance(self, output_: str, action_: str = "wrote", detail_: str = "") -> None:
+        if detail_:
+            OUTPUTS_LOGGER.debug("...... %s output/%s %s", action_, output_, detail_)
+        else:
+            OUTPUTS_LOGGER.debug("...... %s output/%s", action_, output_)
+        with self.lock:
+            self.counts[action_] = self.counts.get(action_, 0) + 1
+            if perf_counter() - self.reported < self.interval:
+                return
+            self.reported = perf_counter()
+        self.report(final_=False)
+
+    def finish(self) -> None:
+        if self.counts:
+            self.report(final_=True)
+
+    def report(self, final_: bool) -> None:
+        with self.lock:
+            done = sum(self.counts.values())
+            seconds = perf_counter() - self.started
+            rate = done / seconds if seconds else 0.0
+            eta = (
+                max(self.total - done, 0) / rate
+                if not final_ and self.total and rate
+                else None
+            )
+            phase, total, counts = self.phase, self.total, dict(self.counts)
+
+        actions = ", ".join(f"{action} {count}" for action, count in counts.items())
+        if final_:
+            logging.info(
+                "... %s: %s outputs in %.2fs (%s)", phase, done, seconds, actions
+            )
+        else:
+            logging.info(
+                "... %s: %s%s outputs, %.0f/s%s",
+                phase,
+                done,
+                f"/{total}" if total else "",
+                rate,
+                f", ETA {eta:.0f}s" if eta is not None else "",
+            )
+        self.emit(
+            "progress",
+            phase=phase,
+            done=done,
+            total=total,
+            counts=counts,
+            seconds=round(seconds, 3),
+            rate=round(rate, 1),
+            eta=None if eta is None else round(eta, 1),
+            final=final_,
+        )
+
+
+class EventStream:
+    """Build events as JSON lines, e.g. for CI and other tooling"""
+
+    def __init__(self, file_) -> None:
+        self.file = file_
+        self.lock = Lock()
+
+    def __call__(self, event_: dict) -> None:
+        line = json.dumps(event_, default=str)
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
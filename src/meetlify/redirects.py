@@ -35,6 +35,7 @@ SOFTWARE.
 # STANDARD LIBARY IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import re
 import json
 import codecs
 from pathlib import Path
@@ -65,19 +66,51 @@ class Redirect:
         )
 
 
+# permanent redirects, a chain of them can be cached as one by clients
+PERMANENT = (301, 308)
+
+# output file and writer method per redirect format
+FORMATS = {
+    "netlify": ("_redirects", "to_netlify"),
+    "nginx": ("redirects.nginx.conf", "to_nginx"),
+    "apache": (".htaccess", "to_apache"),
+}
+
+
+def is_redirect(status_code_: int) -> bool:
+    return 300 <= (status_code_ or 0) < 400
+
+
+def chain_status(first_: int, then_: int) -> int:
+    """Status of a collapsed chain, temporary if any of its hops is temporary"""
+    return first_ if then_ in PERMANENT else then_
+
+
 class Redirects:
+    """Redirect rules indexed by their source path.
+
+    Duplicates are merged and conflicting rules for the same source path are
+    rejected when added. ``compile`` collapses chains (A -> B -> C becomes
+    A -> C) and rejects loops. Paths are matched exactly, placeholders and
+    splats of Netlify rules are not expanded while following chains.
+    """
+
     def __init__(self, *, redirect_items_: list[dict]) -> None:
-        self.all_redirects = [
-            Redirect.from_dict(
-                {
-                    "from_": redirect_item.get("from"),
-                    "to": redirect_item.get("to"),
-                    "force": redirect_item.get("force"),
-                    "status_code": redirect_item.get("status_code"),
-                }
+        self.all_redirects = []
+        self.index = {}  # from_ -> Redirect
+        for redirect_item in redirect_items_:
+            self.add(
+                redirect_item.get("from"),
+                redirect_item.get("to"),
+                redirect_item.get("status_code"),
+                redirect_item.get("force"),
             )
-            for redirect_item in redirect_items_
-        ]
+
+    def __contains__(self, from_: str) -> bool:
+        return from_ in self.index
+
+    def __len__(self) -> int:
+        return len(self.all_redirects)
 
     def __getitem__(self, status_code_: list[int] | int) -> list[Redirect]:
         if not isinstance(status_code_, list):
@@ -90,7 +123,134 @@ class Redirects:
         ]
 
     def __str__(self) -> str:
-        return "\n".join([str(redirect) for redirect in self.all_redirects])
+        return self.to_netlify()
+
+    def add(
+        self, from_: str, to_: str, status_code_: int = 301, force_: bool = True
+    ) -> bool:
+        """Add a redirect, False if an identical one exists already"""
+        existing = self.index.get(from_)
+        if existing is not None:
+            if (existing.to, existing.status_code) == (to_, status_code_):
+                return False
+            raise ValueError(
+                f"conflicting redirects for {from_}: "
+                f"{existing.to} ({existing.status_code}) and {to_} ({status_code_})"
+            )
+
+        redirect = Redirect(from_=from_, to=to_, force=force_, status_code=status_code_)
+        self.all_redirects.append(redirect)
+        self.index[from_] = redirect
+        return True
+
+    def discard(self, from_: str) -> bool:
+        """Remove the redirect of ``from_`` e.g. if it is a live page again"""
+        redirect = self.index.pop(from_, None)
+        if redirect is not None:
+            self.all_redirects.remove(redirect)
+        return redirect is not None
+
+    def resolve(self, from_: str, resolved_: dict | None = None) -> tuple | None:
+        """Final target and status of ``from_`` after following its chain"""
+        if from_ not in self.index:
+            return None
+
+        resolved = {} if resolved_ is None else resolved_
+        chain, seen, key = [], set(), from_
+        while key not in resolved:
+            if key in seen:
+                loop = " -> ".join(chain[chain.index(key) :] + [key])
+                raise ValueError(f"redirect loop: {loop}")
+            seen.add(key)
+
+            redirect = self.index[key]
+            target = self.index.get(redirect.to)
+            if (
+                is_redirect(redirect.status_code)
+                and target is not None
+                and is_redirect(target.status_code)
+            ):
+                chain.append(key)
+                key = redirect.to
+            else:
+                resolved[key] = (redirect.to, redirect.status_code)
+
+        for key in reversed(chain):
+            to, status_code = resolved[self.index[key].to]
+            resolved[key] = (
+                to,
+                chain_status(self.index[key].status_code, status_code),
+            )
+
+        return resolved[from_]
+
+    def compile(self) -> list[Redirect]:
+        """All redirects with chains collapsed to their final target"""
+        resolved = {}
+        compiled = []
+        for redirect in self.all_redirects:
+            to, status_code = self.resolve(redirect.from_, resolved)
+            compiled.append(
+                Redirect(
+                    from_=redirect.from_,
+                    to=to,
+                    force=redirect.force,
+                    status_code=status_code,
+                )
+            )
+        return compiled
+
+    def to_netlify(self) -> str:
+        return "\n".join([str(redirect) for redirect in self.compile()])
+
+    def to_nginx(self) -> str:
+        """nginx ``map`` blocks (http context), one variable per status code.
+
+        Use them in a server block e.g. with
+        ``if ($redirect_301) { return 301 $redirect_301; }``
+        """
+        by_status = {}
+        for redirect in self.compile():
+            if is_redirect(redirect.status_code):
+                by_status.setdefault(redirect.status_code, []).append(redirect)
+
+        blocks = []
+        for status_code, redirects in sorted(by_status.items()):
+            lines = [f"map $uri $redirect_{status_code} {{"]
+            lines.extend(
+                f'    "{redirect.from_}" "{redirect.to}";' for redirect in redirects
+            )
+            lines.append("}")
+            blocks.append("\n".join(lines))
+        return "\n\n".join(blocks)
+
+    def to_apache(self) -> str:
+        """Apache mod_rewrite rules e.g. for a ``.htaccess`` file"""
+        lines = ["RewriteEngine On"]
+        for redirect in self.compile():
+            if is_redirect(redirect.status_code):
+                pattern = re.escape(redirect.from_.lstrip("/"))
+                lines.append(
+                    f"RewriteRule ^/?{pattern}$ {redirect.to} "
+                    f"[R={redirect.status_code},L]"
+                )
+        return "\n".join(lines)
+
+    def to_json(self, json_file_: Path) -> None:
+        with codecs.open(json_file_, "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    {
+                        "from": redirect.from_,
+                        "to": redirect.to,
+                        "force": redirect.force,
+                        "status_code": redirect.status_code,
+                    }
+                    for redirect in self.all_redirects
+                ],
+                f,
+                indent=4,
+            )
 
     @classmethod
     def from_json(cls, json_file_: Path):
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\related.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import zlib
+import codecs
+import random
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Self
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .manifest import fingerprint
+from .search import tokenize
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+PRIME = (1 << 61) - 1
+PERMUTATIONS = 64
+BANDS = 16  # 16 bands of 4 rows, pairs with ~40% similarity become candidates
+ROWS = PERMUTATIONS // BANDS
+MAX_TERMS = 100  # most frequent terms per document used for its signature
+
+# fixed seed, signatures have to be identical between builds to be cached
+_random = random.Random(20240521)
+COEFFICIENTS = [
+    (_random.randrange(1, PRIME), _random.randrange(0, PRIME))
+    for _ in range(PERMUTATIONS)
+]
+
+
+def features(content_) -> list[str]:
+    """Most frequent terms of a document plus its categories"""
+    terms = Counter(
+        tokenize(content_.title)
+        + tokenize(content_.description)
+        + tokenize(content_.content)
+    )
+    return [term for term, _ in terms.most_common(MAX_TERMS)] + [
+        f"#{category.strip().lower()}" for category in content_.categories
+    ]
+
+
+def minhash(features_: list[str]) -> list[int]:
+    """MinHash signature of a set of features"""
+    hashes = {zlib.crc32(feature.encode("utf-8")) for feature in features_}
+    if not hashes:
+        return [PRIME] * PERMUTATIONS
+
+    return [min((a * h + b) % PRIME for h in hashes) for a, b in COEFFICIENTS]
+
+
+def similarity(
+    signature_: list[int],
+    other_signature_: list[int],
+    categories_: list[str],
+    other_categories_: list[str],
+) -> float:
+    """Estimated Jaccard similarity of text plus half the category overlap"""
+    categories, other_categories = set(categories_), set(other_categories_)
+    return sum(map(int.__eq__, signature_, other_signature_)) / PERMUTATIONS + 0.5 * (
+        len(categories & other_categories) / max(len(categories | other_categories), 1)
+    )
+
+
+def neighbours(contents_: list, position_: int):
+    """Items following ``position_`` in listing order, then items before it"""
+    yield from (contents_[index] for index in range(position_ + 1, len(contents_)))
+    yield from (contents_[index] for index in range(position_ - 1, -1, -1))
+
+
+class RelatedIndex:
+    """Related content based on MinHash signatures and locality sensitive hashing.
+
+    Signatures are cached by content fingerprint so only new or changed
+    documents are hashed again. Candidates come from LSH buckets instead of
+    comparing every pair of documents.
+    """
+
+    def __init__(self, *, json_file_: Path, signatures_: dict) -> None:
+        self.json_file = json_file_
+        self.signatures = signatures_
+
+    def signature(self, key_: str, content_) -> list[int]:
+        digest = fingerprint(
+            content_.title, content_.description, content_.content, content_.categories
+        )
+        cached = self.signatures.get(key_)
+        if cached is None or cached.get("digest") != digest:
+            cached = {"digest": digest, "signature": minhash(features(content_))}
+            self.signatures[key_] = cached
+
+        return cached.get("signature")
+
+    def related(self, kind_: str, contents_: list, count_: int = 3) -> dict[str, list]:
+        """Map slug of every content item to its ``count_`` most related items"""
+
+        signatures = {
+            content.slug: self.signature(f"{kind_}/{content.slug}", content)
+            for content in contents_
+        }
+        by_slug = {content.slug: content for content in contents_}
+
+        # drop signatures of removed content
+        for key in [
+            key
+            for key in self.signatures
+            if key.startswith(f"{kind_}/") and key[len(kind_) + 1 :] not in by_slug
+        ]:
+            del self.signatures[key]
+
+        buckets = defaultdict(list)
+        for slug, signature in signatures.items():
+            for band in range(BANDS):
+                buckets[(band, *signature[band * ROWS : (band + 1) * ROWS])].append(
+                    slug
+                )
+
+        candidates = defaultdict(set)
+        for slugs in buckets.values():
+            if 1 < len(slugs):
+                for slug in slugs:
+                    candidates[slug].update(slugs)
+
+        related = {}
+        for position, content in enumerate(contents_):
+            scored = sorted(
+                (
+                    (
+                        -similarity(
+                            signatures[content.slug],
+                            signatures[other],
+                            content.categories,
+                            by_slug[other].categories,
+                        ),
+                        other,
+                    )
+                    for other in candidates[content.slug] - {content.slug}
+                ),
+            )
+            slugs = [other for _, other in scored[0:count_]]
+
+            # not enough similar content, fill up with neighbours in listing order
+            for other in neighbours(contents_, position):
+                if count_ <= len(slugs):
+                    break
+                if other.slug not in slugs:
+                    slugs.append(other.slug)
+
+            related[content.slug] = [by_slug[slug] for slug in slugs]
+
+        return related
+
+    def save(self) -> None:
+        self.json_file.parent.mkdir(parents=True, exist_ok=True)
+        with codecs.open(self.json_file, "w", encoding="utf-8") as f:
+            json.dump(self.signatures, f)
+
+    @classmethod
+    def from_json(cls, json_file_: Path) -> Self:
+        assert isinstance(json_file_, Path)
+        if not json_file_.exists():
+            return cls(json_file_=json_file_, signatures_={})
+
+        with codecs.open(json_file_, "r", encoding="utf-8") as f:
+            return cls(json_file_=json_file_, signatures_=json.load(f))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\reproducible.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+import json
+import codecs
+import hashlib
+from pathlib import Path
+from datetime import datetime, timezone
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .changes import git
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# sources of last modified dates of content files
+DATES = ("mtime", "git", "content")
+
+def build_time(utc_: bool = False) -> datetime:
+    """Current time, fixed to ``SOURCE_DATE_EPOCH`` if it is set.
+
+    Naive like the event dates of the content, or timezone aware with ``utc_``.
+    See https://reproducible-builds.org/specs/source-date-epoch/
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        now = datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+        return now if utc_ else now.replace(tzinfo=None)
+    return datetime.now(tz=timezone.utc) if utc_ else datetime.now()
+
+
+def last_modified(path_: Path, dates_: dict[str, datetime] | None = None) -> datetime:
+    """Last modified date of a content file (UTC), see git_dates and content_dates"""
+    date = (dates_ or {}).get(path_.as_posix())
+    if date is not None:
+        return date
+    return datetime.fromtimestamp(path_.stat().st_mtime, tz=timezone.utc)
+
+
+def git_dates(dest_: Path, folder_: str) -> dict[str, datetime]:
+    """Date of the last commit of every file in ``folder_``"""
+    dates, date = {}, None
+    for line in git(
+        dest_, "log", "--format=@%ct", "--name-only", "--relative", "--", folder_
+    ).splitlines():
+        if line.startswith("@"):
+            date = datetime.fromtimestamp(int(line[1:]), tz=timezone.utc)
+        elif line:
+            # newest commits come first, keep the first date of every file
+            dates.setdefault(Path(dest_, line).as_posix(), date)
+    return dates
+
+
+def content_dates(
+    dest_: Path, folder_: str, json_file_: Path, save_: bool = True
+) -> dict[str, datetime]:
+    """Date every markdown file in ``folder_`` got its current content.
+
+    Dates are kept in ``json_file_`` with the hash of the content, files with
+    new or changed content get the build time. Without ``save_`` the dates
+    are only read, e.g. while planning a build.
+    """
+    previous = {}
+    if json_file_.exists():
+        with codecs.open(json_file_, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    now = build_time(utc_=True)
+    current, dates = {}, {}
+    for md_file in sorted(Path(dest_, folder_).rglob("*.md")):
+        source = md_file.relative_to(dest_).as_posix()
+        digest = hashlib.sha1(md_file.read_bytes()).hexdigest()
+        previous_digest, date = previous.get(source, (None, None))
+        if previous_digest != digest:
+            date = now.isoformat()
+        current[source] = (digest, date)
+        dates[md_file.as_posix()] = datetime.fromisoformat(date)
+
+    if not save_:
+        return dates
+
+    json_file_.parent.mkdir(parents=True, exist_ok=True)
+    with codecs.open(json_file_, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=1, sort_keys=True)
+
+    return dates
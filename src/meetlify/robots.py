@@ -83,7 +83,8 @@ class Robots:
 
     def __str__(self) -> str:
         sitemap_as_str = "\nSitemap: " if self.sitemaps else ""
-        sitemap_as_str += "\nSitemap: ".join(set(self.sitemaps)) # Get Uniqe Sitemaps
+        # Get Unique Sitemaps, in a stable order
+        sitemap_as_str += "\nSitemap: ".join(dict.fromkeys(self.sitemaps))
 
         return (
             "\n".join([str(robot_agent) for robot_agent in self.all_robots])
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\search.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import json
+import codecs
+from collections import Counter, defaultdict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Self
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .manifest import fingerprint
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+TAGS = re.compile(r"<[^>]+>")
+WORDS = re.compile(r"\w+", re.UNICODE)
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with we you our your".split()
+)
+
+# Fields and their weight in the index, title matches rank highest
+WEIGHTS = (("title", 5), ("description", 2), ("content", 1))
+
+
+def tokenize(text_: str) -> list[str]:
+    """Lower case words of a text or html snippet, without stop words"""
+    return [
+        word
+        for word in WORDS.findall(TAGS.sub(" ", text_ or "").lower())
+        if len(word) > 1 and word not in STOP_WORDS and not word.isdigit()
+    ]
+
+
+@dataclass
+class SearchDocument:
+    """Search Document Data Class to hold a tokenized Post, Meetup or Page"""
+
+    id: str
+    kind: str
+    title: str
+    description: str
+    url: str
+    digest: str
+    terms: dict[str, int]
+
+    @classmethod
+    def from_content(cls, content_, kind_: str, url_: str, digest_: str) -> Self:
+        terms = Counter()
+        for field, weight in WEIGHTS:
+            for term in tokenize(getattr(content_, field)):
+                terms[term] += weight
+
+        return cls(
+            id=url_,
+            kind=kind_,
+            title=content_.title,
+            description=content_.description,
+            url=url_,
+            digest=digest_,
+            terms=dict(terms),
+        )
+
+    @classmethod
+    def from_dict(cls, object_: dict) -> Self:
+        return cls(**object_)
+
+
+class SearchIndex:
+    """Inverted index of all documents, split in shards by term prefix"""
+
+    def __init__(self, *, json_file_: Path, documents_: list[dict], prefix_: int = 2):
+        self.json_file = json_file_
+        self.prefix = prefix_
+        self.documents = {
+            document.get("id"): SearchDocument.from_dict(document)
+            for document in documents_
+        }
+
+    def update(self, contents_: list[tuple]) -> int:
+        """Synchronize index with (kind, url, content) tuples.
+
+        Only documents whose content changed since the last build are
+        tokenized again. Returns number of tokenized documents.
+        """
+        documents, tokenized = {}, 0
+        for kind, url, content in contents_:
+            digest = fingerprint(content)
+            document = self.documents.get(url)
+            if document is None or document.digest != digest:
+                document = SearchDocument.from_content(content, kind, url, digest)
+                tokenized += 1
+            documents[url] = document
+
+        self.documents = documents
+        return tokenized
+
+    def shard_name(self, term_: str) -> str:
+        return term_[: self.prefix]
+
+    def shards(self) -> dict[str, dict[str, list]]:
+        """Postings per shard: {prefix: {term: [[document id, weight], ...]}}"""
+        shards = defaultdict(lambda: defaultdict(list))
+        for document in self.documents.values():
+            for term, weight in document.terms.items():
+                shards[self.shard_name(term)][term].append([document.id, weight])
+
+        return {
+            name: {
+                term: sorted(postings, key=lambda posting: (-posting[1], posting[0]))
+                for term, postings in sorted(terms.items())
+            }
+            for name, terms in sorted(shards.items())
+        }
+
+    def catalog(self, shards_: list[str]) -> dict:
+        """Document table and shard list, the only file every search loads"""
+        return {
+            "prefix": self.prefix,
+            "shards": shards_,
+            # queries are tokenized like documents, see tokenize
+            "stop_words": sorted(STOP_WORDS),
+            "documents": {
+                document.id: [document.kind, document.title, document.description]
+                for document in sorted(
+                    self.documents.values(), key=lambda document: document.id
+                )
+            },
+        }
+
+    def save(self) -> None:
+        self.json_file.parent.mkdir(parents=True, exist_ok=True)
+        with codecs.open(self.json_file, "w", encoding="utf-8") as f:
+            json.dump([asdict(document) for document in self.documents.values()], f)
+
+    @classmethod
+    def from_json(cls, json_file_: Path) -> Self:
+        assert isinstance(json_file_, Path)
+        if not json_file_.exists():
+            return cls(json_file_=json_file_, documents_=[])
+
+        with codecs.open(json_file_, "r", encoding="utf-8") as f:
+            return cls(json_file_=json_file_, documents_=json.load(f))
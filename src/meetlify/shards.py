@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\shards.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Self
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .constants import CACHE_FOLDER
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+SHARDS_FOLDER = f"{CACHE_FOLDER}/shards"
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Shard Data Class to select the detail pages rendered by one build node.
+
+    Detail pages are assigned by a stable hash of their slug, so every node
+    of a sharded build agrees on the partition without any coordination.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self):
+        assert 1 <= self.index <= self.count, f"invalid shard {self.index}/{self.count}"
+
+    @property
+    def name(self) -> str:
+        return f"{self.index}-of-{self.count}"
+
+    @property
+    def folder(self) -> str:
+        return f"{SHARDS_FOLDER}/{self.name}"
+
+    @property
+    def output_folder(self) -> str:
+        return f"{self.folder}/output"
+
+    @property
+    def manifest_file(self) -> str:
+        return f"{self.folder}/manifest.json"
+
+    def owns(self, slug_: str) -> bool:
+        digest = hashlib.sha1(slug_.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+    @classmethod
+    def from_string(cls, shard_: str) -> Self:
+        """Parse shard given as ``i/n`` e.g. ``2/4``"""
+        match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", shard_)
+        if not match:
+            raise ValueError(f"invalid shard '{shard_}', expected i/n e.g. 2/4")
+        return cls(index=int(match.group(1)), count=int(match.group(2)))
+
+    @classmethod
+    def discover(cls, dest_: Path) -> list[Self]:
+        """All shards of the one sharded build found in the project, in order"""
+        shards = []
+        for folder in sorted(Path(dest_, SHARDS_FOLDER).glob("*-of-*")):
+            match = re.fullmatch(r"(\d+)-of-(\d+)", folder.name)
+            if match and Path(folder, "manifest.json").exists():
+                shards.append(cls(index=int(match.group(1)), count=int(match.group(2))))
+
+        counts = {shard.count for shard in shards}
+        if len(counts) != 1:
+            found = ", ".join(shard.name for shard in shards) or "none"
+            raise ValueError(f"expected shards of one build, found {found}")
+
+        count = counts.pop()
+        missing = sorted(set(range(1, count + 1)) - {shard.index for shard in shards})
+        if missing:
+            names = ", ".join(f"{index}-of-{count}" for index in missing)
+            raise ValueError(f"missing shards {names}")
+
+        return sorted(shards, key=lambda shard: shard.index)
@@ -37,12 +37,14 @@ SOFTWARE.
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Self
+from urllib.parse import urljoin
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # INTERNAL IMPORTS
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from .constants import STATUS
+from .reproducible import build_time
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -55,11 +57,11 @@ class Sitemap:
     slug: str
     last_modified: datetime
     urls: list
-    images: list
-    news: list
+    images: dict  # url slug -> absolute image urls
+    news: list  # url slugs to tag as news articles
     videos: list
     status: STATUS
-    robots_txt: bool # Add to robots.txt
+    robots_txt: bool  # Add to robots.txt
 
     @classmethod
     def from_dict(cls, object_: dict) -> Self:
@@ -76,28 +78,52 @@ class Sitemap:
         )
 
 
+def image_urls(item_, page_url_: str, images_url_: str) -> list[str]:
+    """Feature image and images of the content (collected while parsing)"""
+    urls = [f"{images_url_}/{item_.feature_image}"] if item_.feature_image else []
+    urls.extend(
+        urljoin(page_url_, src) for src in item_.images if not src.startswith("data:")
+    )
+    return list(dict.fromkeys(urls))
+
+
 class Sitemaps:
-    def __init__(self, *, sitemap_items_: list[dict]) -> None:
-        self.all_sitemaps = [
-            Sitemap.from_dict(
-                {
-                    "name": sitemap_item.get("name"),
-                    "slug": f"/{sitemap_item.get('name')}/",
-                    "last_modified": (
-                        sitemap_item.get("items")[0].last_modified
-                        if len(sitemap_item.get("items")) > 0
-                        else datetime.now()
-                    ),
-                    "urls": sitemap_item.get("items"),
-                    "images": [],
-                    "news": [],
-                    "videos": [],
-                    "status": STATUS.PUBLISHED.value,
-                    "robots_txt": sitemap_item.get("robots_txt")
-                }
+    def __init__(
+        self,
+        *,
+        sitemap_items_: list[dict],
+        URL_: str = "",
+        images_folder_: str = "images",
+    ) -> None:
+        self.all_sitemaps = []
+        for sitemap_item in sitemap_items_:
+            slug = sitemap_item.get("slug") or f"/{sitemap_item.get('name')}/"
+            self.all_sitemaps.append(
+                Sitemap.from_dict(
+                    {
+                        "name": sitemap_item.get("name"),
+                        "slug": slug,
+                        "last_modified": (
+                            sitemap_item.get("items")[0].last_modified
+                            if len(sitemap_item.get("items")) > 0
+                            else build_time()
+                        ),
+                        "urls": sitemap_item.get("items"),
+                        "images": {
+                            item.slug: image_urls(
+                                item,
+                                f"{URL_}{slug}{item.slug}/",
+                                f"{URL_}/{images_folder_}",
+                            )
+                            for item in sitemap_item.get("items")
+                        },
+                        "news": [item.slug for item in sitemap_item.get("news", [])],
+                        "videos": [],
+                        "status": STATUS.PUBLISHED.value,
+                        "robots_txt": sitemap_item.get("robots_txt"),
+                    }
+                )
             )
-            for sitemap_item in sitemap_items_
-        ]
 
     def __getitem__(self, status_: list[STATUS] | STATUS) -> list[Sitemap]:
         if isinstance(status_, STATUS):
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\slugs.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .constants import STATUS
+from .store import ContentStore
+from .utils import markdown_files
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# only these records are rendered to output/<folder>/<slug>/index.html
+RENDERED = [status.value for status in (STATUS.PUBLISHED, STATUS.DONE)]
+
+
+@dataclass
+class SlugCollision:
+    """Slug Collision Data Class to hold files rendered to the same output"""
+
+    kind: str
+    slug: str
+    sources: list[str]
+
+    def __str__(self) -> str:
+        return f"{self.kind}/{self.slug}: {', '.join(self.sources)}"
+
+
+class SlugRegistry:
+    """Site wide index of published records by collection and slug.
+
+    Built while the collections are loaded. Files whose records end up with
+    the same slug would overwrite each other's output, they are reported
+    as collisions and only the first file (by name) is indexed and rendered.
+    """
+
+    def __init__(self, *, url_: str, folders_: dict[str, str]) -> None:
+        self.url = url_
+        self.folders = folders_  # collection -> output folder
+        self.index = {}  # (collection, slug) -> record
+        self.sources = {}  # (collection, slug) -> markdown file
+        self.collisions: dict[tuple, SlugCollision] = {}
+
+    def register(
+        self,
+        kind_: str,
+        path_: Path,
+        records_: list,
+        store_: ContentStore | None = None,
+    ) -> list:
+        """Index records loaded from (sorted) markdown files in ``path_``.
+
+        Returns the records to keep, records colliding with an indexed one are
+        dropped (and excluded from the queries of ``store_``).
+        """
+        sources = [md_file.as_posix() for md_file in markdown_files(path_)]
+        assert len(sources) == len(records_), f"unexpected files in {path_}"
+
+        records, dropped = [], []
+        for source, record in zip(sources, records_):
+            key = (kind_, record.slug)
+            if record.status in RENDERED and key in self.index:
+                self.collisions.setdefault(
+                    key, SlugCollision(kind_, record.slug, [self.sources[key]])
+                ).sources.append(source)
+                dropped.append(source)
+                continue
+
+            if record.status in RENDERED:
+                self.index[key] = record
+                self.sources[key] = source
+            records.append(record)
+
+        for (kind, _), collision in self.collisions.items():
+            if kind == kind_:
+                logging.warning(
+                    "... slug collision %s (only the first file is rendered)",
+                    collision,
+                )
+
+        if store_ is not None:
+            store_.exclude(kind_, dropped)
+        return records
+
+    def get(self, kind_: str, slug_: str):
+        return self.index.get((kind_, slug_))
+
+    def url_for(self, kind_: str, slug_: str) -> str:
+        """Url of a published record, e.g. ``url_for("meetups", "0003")``"""
+        if (kind_, slug_) not in self.index:
+            raise KeyError(f"no published {kind_} with slug '{slug_}'")
+        return f"{self.url}/{self.folders[kind_]}/{slug_}/"
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\snippets.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import re
+import hashlib
+import logging
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from markdown.extensions import Extension
+from markdown.preprocessors import Preprocessor
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# {{< name >}} includes snippets/name.md, {{< name "arg" >}} snippets/name/arg.md
+SHORTCODE_RE = re.compile(
+    r'\{\{<\s*(?P<name>[\w-]+)(?:\s+"(?P<arg>[\w./-]*)")?\s*>\}\}'
+)
+
+
+def shortcode_key(match_: re.Match) -> str:
+    name, arg = match_.group("name"), match_.group("arg")
+    return f"{name}/{arg}" if arg else name
+
+
+class SnippetLibrary:
+    """Markdown snippets included into content files with shortcodes.
+
+    Every site has its own library. Every snippet is converted once and
+    memoized by its content digest. The snippets used by a content file and
+    their digests (see ``uses``) are stored with its record, so that only
+    files using a changed snippet are parsed again.
+
+    Libraries of the same folder compare equal, so converted markdown is
+    memoized by the folder and not by the site (see convert_markdown).
+    """
+
+    def __init__(self, *, folder_: Path) -> None:
+        assert isinstance(folder_, Path)
+        self.folder = folder_
+        self.digests = {}  # (path, mtime_ns, size) -> sha1 of snippet file
+        self.html = {}  # sha1 of snippet file -> converted html
+        self.converted = 0
+        self.lock = Lock()
+
+    def __eq__(self, other_) -> bool:
+        return isinstance(other_, SnippetLibrary) and self.folder == other_.folder
+
+    def __hash__(self) -> int:
+        return hash(self.folder)
+
+    def path(self, key_: str) -> Path | None:
+        """Snippet file of a key, None if it lies outside of the snippets folder"""
+        if ".." in Path(key_).parts:
+            return None
+        return Path(self.folder, f"{key_}.md")
+
+    def used(self, text_: str) -> list[str]:
+        """Snippets used by a markdown text"""
+        if "{{<" not in text_:
+            return []
+        return sorted({shortcode_key(match) for match in SHORTCODE_RE.finditer(text_)})
+
+    def digest(self, key_: str) -> str:
+        """Digest of a snippet file, empty if the snippet does not exist"""
+        path = self.path(key_)
+        if path is None:
+            return ""
+        try:
+            stat = path.stat()
+        except OSError:
+            return ""
+
+        cache_key = (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+        if cache_key not in self.digests:
+            self.digests[cache_key] = hashlib.sha1(path.read_bytes()).hexdigest()
+        return self.digests[cache_key]
+
+    def expand(self, key_: str, convert_: Callable[[str], str]) -> str | None:
+        """Converted html of a snippet, None if the snippet does not exist"""
+        digest = self.digest(key_)
+        if not digest:
+            return None
+
+        with self.lock:
+            if digest not in self.html:
+                self.html[digest] = convert_(
+                    self.path(key_).read_text(encoding="utf-8")
+                )
+                self.converted += 1
+            return self.html[digest]
+
+    def uses(self, text_: str) -> dict[str, str]:
+        """Snippets used by a markdown text and their digests"""
+        return {key: self.digest(key) for key in self.used(text_)}
+
+    def changed(self, uses_: dict[str, str]) -> bool:
+        """True if any of the used snippets changed (or was added or removed)"""
+        return any(self.digest(key) != digest for key, digest in uses_.items())
+
+
+class ShortcodePreprocessor(Preprocessor):
+    """Replace shortcodes by the (memoized) html of their snippets"""
+
+    def __init__(
+        self, md, library_: SnippetLibrary, convert_: Callable[[str], str]
+    ) -> None:
+        super().__init__(md)
+        self.library = library_
+        self.convert = convert_
+
+    def run(self, lines):
+        def replace(match):
+            html = self.library.expand(shortcode_key(match), self.convert)
+            if html is None:
+                logging.warning("... unknown snippet %s", shortcode_key(match))
+                return match.group(0)
+
+            # within a line of text a single paragraph is included inline
+            text, start, end = match.string, match.start(), match.end()
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", end)
+            line_end = len(text) if line_end == -1 else line_end
+            inline = text[line_start:start].strip() or text[end:line_end].strip()
+            if inline and html.startswith("<p>") and html.count("<p>") == 1:
+                html = html.removeprefix("<p>").removesuffix("</p>")
+            return self.md.htmlStash.store(html)
+
+        return SHORTCODE_RE.sub(replace, "\n".join(lines)).split("\n")
+
+
+class ShortcodeExtension(Extension):
+    def __init__(
+        self, library_: SnippetLibrary, convert_: Callable[[str], str], **kwargs
+    ) -> None:
+        self.library = library_
+        self.convert = convert_
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md):
+        # after code blocks were highlighted, so shortcodes in code are kept
+        md.preprocessors.register(
+            ShortcodePreprocessor(md, self.library, self.convert), "shortcodes", 24
+        )
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\store.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import sqlite3
+import logging
+import threading
+from dataclasses import asdict, fields
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .constants import STATUS
+from .reproducible import last_modified
+from .utils import MarkdownConvertor, markdown_convertor, markdown_files
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    slug TEXT,
+    status TEXT,
+    title TEXT,
+    date TEXT,
+    last_modified TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (kind, source)
+);
+CREATE TABLE IF NOT EXISTS content_categories (
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS content_snippets (
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS content_status ON content (kind, status, date);
+CREATE INDEX IF NOT EXISTS content_slug ON content (kind, slug);
+CREATE INDEX IF NOT EXISTS content_date ON content (kind, date);
+CREATE INDEX IF NOT EXISTS content_categories_category
+    ON content_categories (kind, category);
+CREATE INDEX IF NOT EXISTS content_categories_source
+    ON content_categories (kind, source);
+CREATE INDEX IF NOT EXISTS content_snippets_source
+    ON content_snippets (kind, source);
+"""
+
+
+def locked(method_):
+    """Run a method of the store while holding its lock"""
+
+    @wraps(method_)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method_(self, *args, **kwargs)
+
+    return wrapper
+
+
+def record_date(record_) -> datetime | None:
+    """Date a record is sorted by, event date for meetups else create date"""
+    return getattr(record_, "event_datetime", None) or getattr(
+        record_, "create_date", None
+    )
+
+
+def to_json(record_) -> str:
+    return json.dumps(
+        asdict(record_),
+        default=lambda value: (
+            value.isoformat() if isinstance(value, datetime) else str(value)
+        ),
+    )
+
+
+def is_current(class_, json_: str) -> bool:
+    return {field.name for field in fields(class_)} <= json.loads(json_).keys()
+
+
+def from_json(class_, json_: str):
+    values = json.loads(json_)
+    for field in fields(class_):
+        if field.type is datetime and values.get(field.name):
+            values[field.name] = datetime.fromisoformat(values[field.name])
+    return class_(**values)
+
+
+class ContentStore:
+    """Parsed content of all collections in a local SQLite database.
+
+    Markdown files are only parsed again if their size or modification time
+    changed, all other records are loaded from the database. Status, slug,
+    date and category lookups are answered by indexed queries.
+
+    The connection is shared by all threads (e.g. content loaded in an
+    executor and pages rendered by writer threads), so every access to it
+    holds the lock of the store.
+
+    With ``dry_run_`` nothing is committed, changes are only visible to this
+    store and rolled back by ``close``.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_file_: Path,
+        changed_: set[Path] | None = None,
+        convertor_: MarkdownConvertor = markdown_convertor,
+        dry_run_: bool = False,
+    ) -> None:
+        assert isinstance(db_file_, Path)
+
+        self.db_file = db_file_
+        self.dry_run = dry_run_
+        # files known to be changed (e.g. from git), all others are trusted as is
+        self.changed = (
+            None if changed_ is None else {path.as_posix() for path in changed_}
+        )
+        self.lock = threading.RLock()
+        if dry_run_ and not db_file_.exists():
+            db_file_ = ":memory:"  # nothing to load, nothing to create
+        else:
+            db_file_.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(db_file_, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.convertor = convertor_  # markdown settings of the site
+        self.reset_on_change("markdown", convertor_.version)
+        self.records = {}  # (kind, source) -> record, shared by all queries
+        self.parsed = {}  # kind -> (parsed, total) files of last load
+        self.slug_changes = []  # (kind, old slug, new slug) of re-parsed files
+        self.excluded = set()  # (kind, source) never returned, see exclude
+
+    @locked
+    def load(
+        self, kind_: str, path_: Path, class_, dates_: dict[str, datetime] | None = None
+    ) -> list:
+        """Synchronize markdown files in ``path_`` and return their records.
+
+        ``dates_`` maps file paths to last modified dates, e.g. from git.
+        """
+        stored = {
+            source: (mtime_ns, size, slug, record)
+            for source, mtime_ns, size, slug, record in self.connection.execute(
+                "SELECT source, mtime_ns, size, slug, record FROM content"
+                " WHERE kind = ?",
+                (kind_,),
+            )
+        }
+
+        # snippets included by files, their records are stale if one changed
+        uses = {}
+        for source, snippet, digest in self.connection.execute(
+            "SELECT source, snippet, digest FROM content_snippets WHERE kind = ?",
+            (kind_,),
+        ):
+            uses.setdefault(source, {})[snippet] = digest
+
+        records, parsed = [], 0
+        for md_file in markdown_files(path_):
+            source, stat = md_file.as_posix(), md_file.stat()
+            mtime_ns, size, slug, record = stored.pop(source, (None,) * 4)
+
+            # records stored by older versions lack newer fields, parse again
+            if record is not None and not is_current(class_, record):
+                mtime_ns = size = record = None
+            elif record is not None and self.convertor.snippets_changed(
+                uses.get(source, {})
+            ):
+                mtime_ns = size = record = None
+
+            if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+                record = from_json(class_, record)
+            elif (
+                record is not None
+                and self.changed is not None
+                and source not in self.changed
+                and size == stat.st_size
+            ):
+                # fresh checkout with new mtimes but unchanged content
+                record = from_json(class_, record)
+                self.connection.execute(
+                    "UPDATE content SET mtime_ns = ? WHERE kind = ? AND source = ?",
+                    (stat.st_mtime_ns, kind_, source),
+                )
+            else:
+                record = class_.from_markdown(md_file, self.convertor, dates_)
+                used = self.convertor.snippet_uses(md_file)
+                self.save(kind_, source, stat, record, used)
+                parsed += 1
+                if slug is not None and slug != record.slug:
+                    self.slug_changes.append((kind_, slug, record.slug))
+
+            # dates of this build, stored records may carry those of another
+            record.last_modified = last_modified(md_file, dates_)
+
+            self.records[(kind_, source)] = record
+            records.append(record)
+
+        for source in stored:
+            self.delete(kind_, source)
+
+        self.commit()
+        self.parsed[kind_] = (parsed, len(records))
+        logging.info(
+            "... parsed %d of %d %s (content store)", parsed, len(records), kind_
+        )
+        return records
+
+    @locked
+    def reset_on_change(self, name_: str, value_: str) -> None:
+        """Parse all files again if a setting of the markdown conversion changed"""
+        row = self.connection.execute(
+            "SELECT value FROM settings WHERE name = ?", (name_,)
+        ).fetchone()
+        if row is not None and row[0] == value_:
+            return
+
+        if row is not None:
+            self.connection.execute("DELETE FROM content")
+            self.connection.execute("DELETE FROM content_categories")
+            self.connection.execute("DELETE FROM content_snippets")
+        self.connection.execute(
+            "INSERT OR REPLACE INTO settings VALUES (?, ?)", (name_, value_)
+        )
+        self.commit()
+
+    def commit(self) -> None:
+        if not self.dry_run:
+            self.connection.commit()
+
+    @locked
+    def save(
+        self, kind_: str, source_: str, stat_, record_, uses_: dict[str, str]
+    ) -> None:
+        date = record_date(record_)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO content VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                kind_,
+                source_,
+                stat_.st_mtime_ns,
+                stat_.st_size,
+                record_.slug,
+                record_.status,
+                record_.title,
+                date.isoformat() if date else None,
+                record_.last_modified.isoformat(),
+                to_json(record_),
+            ),
+        )
+        self.connection.execute(
+            "DELETE FROM content_categories WHERE kind = ? AND source = ?",
+            (kind_, source_),
+        )
+        self.connection.execute(
+            "DELETE FROM content_snippets WHERE kind = ? AND source = ?",
+            (kind_, source_),
+        )
+        self.connection.executemany(
+            "INSERT INTO content_snippets VALUES (?, ?, ?, ?)",
+            [(kind_, source_, snippet, digest) for snippet, digest in uses_.items()],
+        )
+        self.connection.executemany(
+            "INSERT INTO content_categories VALUES (?, ?, ?)",
+            [
+                (kind_, source_, category)
+                for category in getattr(record_, "categories", None) or []
+            ],
+        )
+
+    @locked
+    def delete(self, kind_: str, source_: str) -> None:
+        for table in ("content", "content_categories", "content_snippets"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE kind = ? AND source = ?", (kind_, source_)
+            )
+        self.records.pop((kind_, source_), None)
+
+    def exclude(self, kind_: str, sources_: list[str]) -> None:
+        """Leave records out of all queries, e.g. those of slug collisions"""
+        self.excluded.update((kind_, source) for source in sources_)
+
+    @locked
+    def sources(
+        self,
+        kind_: str,
+        *,
+        status_: list[STATUS] | None = None,
+        slug_: str | None = None,
+        category_: str | None = None,
+        since_: datetime | None = None,
+        until_: datetime | None = None,
+        reverse_: bool = True,
+    ) -> list[str]:
+        """Sources of records matching all given filters, ordered by date"""
+        query = "SELECT content.source FROM content"
+        conditions, parameters = ["content.kind = ?"], [kind_]
+
+        if category_ is not None:
+            query += (
+                " JOIN content_categories ON content_categories.kind = content.kind"
+                " AND content_categories.source = content.source"
+            )
+            conditions.append("content_categories.category = ?")
+            parameters.append(category_)
+        if status_ is not None:
+            conditions.append(f"content.status IN ({', '.join('?' * len(status_))})")
+            parameters += [status.value for status in status_]
+        if slug_ is not None:
+            conditions.append("content.slug = ?")
+            parameters.append(slug_)
+        if since_ is not None:
+            conditions.append("content.date >= ?")
+            parameters.append(since_.isoformat())
+        if until_ is not None:
+            conditions.append("content.date < ?")
+            parameters.append(until_.isoformat())
+
+        order = "DESC" if reverse_ else "ASC"
+        query += f" WHERE {' AND '.join(conditions)}"
+        query += f" ORDER BY content.date {order}, content.source {order}"
+
+        return [
+            source
+            for (source,) in self.connection.execute(query, parameters)
+            if (kind_, source) not in self.excluded
+        ]
+
+    @locked
+    def query(self, kind_: str, class_, **filters_) -> list:
+        """Records matching filters, see ``sources`` for available filters"""
+        records = []
+        for source in self.sources(kind_, **filters_):
+            if (kind_, source) not in self.records:
+                (json_,) = self.connection.execute(
+                    "SELECT record FROM content WHERE kind = ? AND source = ?",
+                    (kind_, source),
+                ).fetchone()
+                self.records[(kind_, source)] = from_json(class_, json_)
+            records.append(self.records[(kind_, source)])
+        return records
+
+    def by_categories(self, kind_: str, class_, **filters_) -> dict[str, list]:
+        """Records matching filters grouped by their categories"""
+        categories = {}
+        for record in self.query(kind_, class_, **filters_):
+            for category in record.categories:
+                categories.setdefault(category, []).append(record)
+        return categories
+
+    @locked
+    def close(self) -> None:
+        self.connection.rollback()  # uncommitted changes of a dry run
+        self.connection.close()
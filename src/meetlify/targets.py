@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\targets.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+import os
+import shutil
+import tarfile
+import zipfile
+from pathlib import Path
+from threading import Lock
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .reproducible import build_time
+from .utils import sync_tree
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class OutputTarget:
+    """Where rendered outputs go, paths are relative to the output root.
+
+    Only persistent targets keep outputs between builds, so only they are
+    built incrementally against the manifest of the previous build.
+    """
+
+    persistent = False
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+
+    def write(self, output_: str, data_: bytes) -> None:
+        raise NotImplementedError
+
+    def exists(self, output_: str) -> bool:
+        return False
+
+    def remove(self, output_: str) -> None:
+        pass
+
+    def remove_folder(self, folder_: str) -> None:
+        pass
+
+    def sync(self, src_: Path, folder_: str) -> int:
+        """Copy all files below src_ into folder_, returns number of copies"""
+        copied = 0
+        for source in sorted(src_.rglob("*")):
+            if source.is_file():
+                output = Path(folder_, source.relative_to(src_)).as_posix()
+                self.write(output, source.read_bytes())
+                copied += 1
+        return copied
+
+    def close(self) -> None:
+        pass
+
+
+class DirectoryTarget(OutputTarget):
+    """Outputs written to a folder, the output folder of the project"""
+
+    persistent = True
+
+    def __init__(self, *, root_: Path, fsync_: bool = False) -> None:
+        assert isinstance(root_, Path)
+        super().__init__()
+        self.root = root_
+        self.fsync = fsync_
+        self.folders = set()  # folders known to exist
+
+    def write(self, output_: str, data_: bytes) -> None:
+        path = Path(self.root, output_)
+        if path.parent not in self.folders:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self.lock:
+                self.folders.add(path.parent)
+
+        try:
+            file = open(path, "wb")
+        except FileNotFoundError:
+            # folder was removed after it was created, e.g. by pruning
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file = open(path, "wb")
+
+        with file:
+            file.write(data_)
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+    def exists(self, output_: str) -> bool:
+        return Path(self.root, output_).exists()
+
+    def remove(self, output_: str) -> None:
+        """Remove output_ and its empty folders"""
+        path = Path(self.root, output_)
+        path.unlink(missing_ok=True)
+        for folder in path.parents:
+            if folder == self.root or not folder.exists() or any(folder.iterdir()):
+                break
+            folder.rmdir()
+
+    def remove_folder(self, folder_: str) -> None:
+        shutil.rmtree(Path(self.root, folder_), ignore_errors=True)
+
+    def sync(self, src_: Path, folder_: str) -> int:
+        # only copies files which are missing or differ
+        return sync_tree(src_, Path(self.root, folder_))
+
+
+class MemoryTarget(OutputTarget):
+    """Outputs kept in memory, e.g. for tests and a development server"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.files = {}  # output -> bytes
+
+    def write(self, output_: str, data_: bytes) -> None:
+        with self.lock:
+            self.files[output_] = data_
+
+    def read(self, output_: str) -> str:
+        return self.files[output_].decode("utf-8")
+
+    def exists(self, output_: str) -> bool:
+        return output_ in self.files
+
+    def remove(self, output_: str) -> None:
+        with self.lock:
+            self.files.pop(output_, None)
+
+    def remove_folder(self, folder_: str) -> None:
+        with self.lock:
+            for output in [o for o in self.files if o.startswith(f"{folder_}/")]:
+                del self.files[output]
+
+
+class ZipTarget(OutputTarget):
+    """Outputs streamed into a zip archive, without an intermediate folder"""
+
+    def __init__(self, *, archive_: Path) -> None:
+        super().__init__()
+        self.archive = zipfile.ZipFile(archive_, "w", zipfile.ZIP_DEFLATED)
+        # entry dates follow SOURCE_DATE_EPOCH for reproducible archives
+        self.date_time = max(build_time(utc_=True).timetuple()[:6], (1980, 1, 1))
+
+    def write(self, output_: str, data_: bytes) -> None:
+        entry = zipfile.ZipInfo(output_, date_time=self.date_time)
+        entry.compress_type = zipfile.ZIP_DEFLATED
+        entry.external_attr = 0o644 << 16
+        with self.lock:
+            self.archive.writestr(entry, data_)
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class TarTarget(OutputTarget):
+    """Outputs streamed into a gzip compressed tar archive"""
+
+    def __init__(self, *, archive_: Path) -> None:
+        super().__init__()
+        self.archive = tarfile.open(archive_, "w:gz")
+        self.mtime = int(build_time(utc_=True).timestamp())
+
+    def write(self, output_: str, data_: bytes) -> None:
+        entry = tarfile.TarInfo(output_)
+        entry.size, entry.mtime, entry.mode = len(data_), self.mtime, 0o644
+        with self.lock:
+            self.archive.addfile(entry, io.BytesIO(data_))
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+def archive_target(archive_: Path) -> OutputTarget:
+    """Zip or tar.gz target, chosen by the file name of archive_"""
+    if archive_.name.endswith(".zip"):
+        return ZipTarget(archive_=archive_)
+    if archive_.name.endswith((".tar.gz", ".tgz")):
+        return TarTarget(archive_=archive_)
+    raise ValueError(f"unknown archive type '{archive_.name}' (zip, tar.gz, tgz)")
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\templates.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import logging
+import statistics
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import Environment, TemplateSyntaxError, meta, nodes
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .manifest import Manifest, fingerprint
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# render time grows with collection size if both correlate at least this much
+SCALING_CORRELATION = 0.8
+
+
+def collection_size(value_) -> int:
+    """Number of items a template iterates for a context value"""
+    if isinstance(value_, (list, tuple, set, dict)):
+        return len(value_)
+    if isinstance(getattr(value_, "items", None), list):
+        return len(value_.items)  # e.g. one page of a paginated collection
+    return 0
+
+
+@dataclass
+class TemplateStats:
+    """Template Stats Data Class to hold render statistics of one template"""
+
+    name: str
+    count: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    samples: list[tuple[int, float]] = field(default_factory=list, repr=False)
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.count if self.count else 0.0
+
+    @property
+    def scales(self) -> bool:
+        """True if render time grows with the size of rendered collections"""
+        sizes = [size for size, _ in self.samples]
+        if len(set(sizes)) < 3:
+            return False
+        try:
+            correlation = statistics.correlation(
+                sizes, [seconds for _, seconds in self.samples]
+            )
+        except statistics.StatisticsError:
+            return False
+        return SCALING_CORRELATION <= correlation
+
+
+class TemplateAnalyzer:
+    """Extends, include, import and partial graph of all theme templates.
+
+    Renders templates for the build and records per template render count,
+    time and output size. Digests of a template and everything it uses decide
+    which outputs are invalidated when a template changes.
+    """
+
+    def __init__(self, renderer_: Environment) -> None:
+        self.renderer = renderer_
+        self.stats = {}  # template -> TemplateStats
+        self.lock = Lock()
+        self.dynamic = set()  # templates with references unknown until rendered
+        self.graph = {
+            name: self.references(name) for name in sorted(renderer_.list_templates())
+        }
+        self.digests = {}
+
+    def references(self, name_: str) -> set[str]:
+        """Templates directly extended, included, imported or partial() by name_"""
+        source, _, _ = self.renderer.loader.get_source(self.renderer, name_)
+        try:
+            ast = self.renderer.parse(source, name_)
+        except TemplateSyntaxError:
+            logging.warning("... template %s can not be parsed", name_)
+            self.dynamic.add(name_)
+            return set()
+
+        references = list(meta.find_referenced_templates(ast))
+        for call in ast.find_all(nodes.Call):
+            if isinstance(call.node, nodes.Name) and call.node.name == "partial":
+                argument = call.args[0] if call.args else None
+                references.append(
+                    argument.value if isinstance(argument, nodes.Const) else None
+                )
+
+        if None in references:
+            self.dynamic.add(name_)
+        return {reference for reference in references if reference is not None}
+
+    def dependencies(self, name_: str) -> set[str]:
+        """name_ and all templates it uses, directly or indirectly"""
+        found, todo = set(), [name_]
+        while todo:
+            name = todo.pop()
+            if name in found:
+                continue
+            if name in self.dynamic:
+                return set(self.graph)
+            found.add(name)
+            todo.extend(self.graph.get(name, ()))
+        return found
+
+    def dependents(self, name_: str) -> set[str]:
+        """Templates whose output changes if name_ changes"""
+        return {name for name in self.graph if name_ in self.dependencies(name)}
+
+    def digest(self, name_: str) -> str:
+        """Digest of the sources of name_ and all templates it uses"""
+        if name_ not in self.digests:
+            self.digests[name_] = fingerprint(
+                *(
+                    (name, self.renderer.loader.get_source(self.renderer, name)[0])
+                    for name in sorted(self.dependencies(name_) & self.graph.keys())
+                )
+            )
+        return self.digests[name_]
+
+    def invalidated(self, manifest_: Manifest, name_: str) -> list[str]:
+        """Outputs of the last build which have to be rendered if name_ changes"""
+        dependents = self.dependents(name_)
+        return sorted(
+            output
+            for output, entry in manifest_.entries.items()
+            if entry.inputs and entry.inputs.get("template") in dependents
+        )
+
+    def render(self, name_: str, **context_) -> str:
+        started = perf_counter()
+        html = self.renderer.get_template(name_).render(**context_)
+        seconds = perf_counter() - started
+
+        size = sum(collection_size(value) for value in context_.values())
+        with self.lock:
+            stats = self.stats.setdefault(name_, TemplateStats(name=name_))
+            stats.count += 1
+            stats.seconds += seconds
+            stats.bytes += len(html.encode("utf-8"))
+            stats.samples.append((size, seconds))
+        return html
+
+    def __str__(self) -> str:
+        rows = [
+            f"{'template':<24}{'renders':>8}{'seconds':>10}{'mean ms':>10}"
+            f"{'kbytes':>10}  uses"
+        ]
+        for stats in sorted(self.stats.values(), key=lambda s: -s.seconds):
+            uses = ", ".join(sorted(self.dependencies(stats.name) - {stats.name}))
+            rows.append(
+                (
+                    f"{stats.name:<24}{stats.count:>8}{stats.seconds:>10.3f}"
+                    f"{stats.mean * 1000:>10.2f}{stats.bytes / 1024:>10.1f}  {uses}"
+                    + ("  (grows with collection size)" if stats.scales else "")
+                ).rstrip()
+            )
+        return "\n".join(rows)
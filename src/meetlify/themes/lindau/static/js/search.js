@@ -0,0 +1,105 @@
+// Client side search for Meetlify websites
+// Loads search/index.json once and only the shards (by term prefix) a query needs.
+
+(function () {
+    const input = document.getElementById("search-input");
+    const results = document.getElementById("search-results");
+    if (!input || !results) {
+        return;
+    }
+
+    const base = input.dataset.base || "";
+    const shards = new Map();
+    let catalog = null;
+    let timer = null;
+
+    let stopWords = new Set();
+
+    // same words as tokenize() in search.py, stop words come with the catalog
+    const tokenize = (text) =>
+        (text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || []).filter(
+            (word) => word.length > 1 && !/^\d+$/.test(word) && !stopWords.has(word)
+        );
+
+    const loadCatalog = async () => {
+        if (!catalog) {
+            catalog = await fetch(`${base}/search/index.json`).then((r) => r.json());
+            stopWords = new Set(catalog.stop_words || []);
+        }
+        return catalog;
+    };
+
+    const loadShard = async (name) => {
+        if (!catalog.shards.includes(name)) {
+            return {};
+        }
+        if (!shards.has(name)) {
+            shards.set(
+                name,
+                fetch(`${base}/search/${encodeURIComponent(name)}.json`).then((r) => r.json())
+            );
+        }
+        return shards.get(name);
+    };
+
+    const search = async (query) => {
+        await loadCatalog();
+        const terms = tokenize(query);
+        if (!terms.length) {
+            return [];
+        }
+
+        let scores = null;
+
+        for (const term of terms) {
+            const shard = await loadShard(term.slice(0, catalog.prefix));
+            const matches = new Map();
+
+            // every term starting with the query term lives in the same shard
+            for (const [indexed, postings] of Object.entries(shard)) {
+                if (indexed.startsWith(term)) {
+                    for (const [id, weight] of postings) {
+                        matches.set(id, (matches.get(id) || 0) + weight);
+                    }
+                }
+            }
+
+            if (scores === null) {
+                scores = matches;
+            } else {
+                for (const id of [...scores.keys()]) {
+                    matches.has(id) ? scores.set(id, scores.get(id) + matches.get(id)) : scores.delete(id);
+                }
+            }
+        }
+
+        return [...scores.entries()].sort((a, b) => b[1] - a[1]).slice(0, 20);
+    };
+
+    const render = (hits) => {
+        results.replaceChildren(
+            ...hits.map(([id]) => {
+                const [kind, title, description] = catalog.documents[id];
+                const item = document.createElement("a");
+                item.className = "list-group-item list-group-item-action";
+                item.href = `${base}${id}`;
+
+                const heading = document.createElement("div");
+                heading.className = "fw-bold";
+                heading.textContent = title;
+
+                const text = document.createElement("small");
+                text.className = "text-muted";
+                text.textContent = `${kind} · ${description || ""}`;
+
+                item.append(heading, text);
+                return item;
+            })
+        );
+    };
+
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(async () => render(await search(input.value)), 150);
+    });
+})();
@@ -36,6 +36,8 @@ SOFTWARE.
 
 import codecs
 import shutil
+import hashlib
+from functools import lru_cache, partial
 from pathlib import Path
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -43,6 +45,16 @@ from pathlib import Path
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import markdown
+from markdown.extensions import Extension
+from slugify import slugify as python_slugify
+from markdown.treeprocessors import Treeprocessor
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .highlight import CodeHighlighter, HighlightExtension
+from .snippets import SnippetLibrary, ShortcodeExtension
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++
 # IMPLEMENATIONS
@@ -64,16 +76,161 @@ def initialize(dest_: Path) -> None:
     )
 
 
-def markdown_convertor(md_file_: Path) -> tuple:
-    assert isinstance(md_file_, Path)
-    assert md_file_.exists()
+class ImageCollector(Treeprocessor):
+    """Collect sources of all images of a document while it is converted"""
+
+    def run(self, root):
+        self.md.images = [
+            image.get("src") for image in root.iter("img") if image.get("src")
+        ]
+
+
+class ImagesExtension(Extension):
+    def extendMarkdown(self, md):
+        # lowest priority, runs after inline patterns created the img elements
+        md.treeprocessors.register(ImageCollector(md), "images", 0)
+
 
-    md_convertor = markdown.Markdown(extensions=["meta", "attr_list", "toc"])
-    with codecs.open(md_file_, "r", encoding="utf-8") as f:
-        data = f.read()
-        content = md_convertor.convert(data)
-        return (
-            {k: "".join(v) for k, v in md_convertor.Meta.items()},
-            md_convertor.toc,
-            content,
+@lru_cache(maxsize=4096)
+def convert_markdown(
+    text_: str,
+    highlighter_: CodeHighlighter | None = None,
+    snippets_: SnippetLibrary | None = None,
+    uses_: str = "",
+) -> tuple:
+    """Convert markdown text to meta data, toc, html and image sources.
+
+    Memoized, so identical files are converted only once per process, e.g.
+    shared pages of several sites or unchanged files in repeated builds.
+    Fenced code blocks are highlighted by ``highlighter_`` (memoized by its
+    settings), shortcodes are expanded from ``snippets_`` (memoized by its
+    folder and ``uses_``, the digests of the used snippets).
+    """
+    extensions = ["meta", "attr_list", "toc", ImagesExtension()]
+    if highlighter_ is not None and highlighter_.style:
+        extensions.append(HighlightExtension(highlighter_))
+    if snippets_ is not None and uses_:
+        extensions.append(
+            ShortcodeExtension(
+                snippets_, partial(convert_snippet, highlighter_=highlighter_)
+            )
         )
+    md_convertor = markdown.Markdown(extensions=extensions)
+    content = md_convertor.convert(text_)
+    return (
+        tuple((k, "".join(v)) for k, v in md_convertor.Meta.items()),
+        md_convertor.toc,
+        content,
+        tuple(md_convertor.images),
+    )
+
+
+@lru_cache(maxsize=4096)
+def slugify(text_: str) -> str:
+    """Memoized slug of a title, the same titles are slugified in every build"""
+    return python_slugify(text_)
+
+
+def markdown_files(path_: Path) -> list[Path]:
+    """Markdown files of a collection folder, sorted by name"""
+    return [
+        md_file
+        for md_file in sorted(path_.iterdir())
+        if md_file.is_file() and md_file.suffix == ".md"
+    ]
+
+
+def convert_snippet(text_: str, highlighter_: CodeHighlighter | None = None) -> str:
+    """Html of a snippet, shortcodes within snippets are not expanded"""
+    return convert_markdown(text_, highlighter_)[2]
+
+
+class MarkdownConvertor:
+    """Converts the markdown files of a site with the site's own settings"""
+
+    def __init__(
+        self,
+        *,
+        highlighter_: CodeHighlighter | None = None,
+        snippets_: SnippetLibrary | None = None,
+    ) -> None:
+        self.highlighter = highlighter_
+        self.snippets = snippets_
+
+    @property
+    def version(self) -> str:
+        """Settings of the conversion, parsed content depends on them"""
+        return self.highlighter.version if self.highlighter else ""
+
+    def __call__(self, md_file_: Path) -> tuple:
+        assert isinstance(md_file_, Path)
+        assert md_file_.exists()
+
+        with codecs.open(md_file_, "r", encoding="utf-8") as f:
+            text = f.read()
+            uses = self.snippets.uses(text) if self.snippets else {}
+            meta, toc, content, images = convert_markdown(
+                text,
+                self.highlighter,
+                self.snippets,
+                ";".join(f"{key}={digest}" for key, digest in uses.items()),
+            )
+            return dict(meta), toc, content, list(images)
+
+    def snippet_uses(self, md_file_: Path) -> dict[str, str]:
+        """Snippets used by a markdown file and their digests"""
+        if self.snippets is None:
+            return {}
+        return self.snippets.uses(md_file_.read_text(encoding="utf-8"))
+
+    def snippets_changed(self, uses_: dict[str, str]) -> bool:
+        """True if any snippet used by a file (see ``snippet_uses``) changed"""
+        if self.snippets is None:
+            return bool(uses_)
+        return self.snippets.changed(uses_)
+
+
+# plain conversion without highlighting, default of all collections
+markdown_convertor = MarkdownConvertor()
+
+
+# (path, mtime_ns, size) -> sha1 of file, shared by all builds in this process
+ASSET_HASHES = {}
+
+
+def file_digest(path_: Path, stat_=None, hashes_: dict = ASSET_HASHES) -> str:
+    stat = stat_ or path_.stat()
+    key = (path_.as_posix(), stat.st_mtime_ns, stat.st_size)
+    if key not in hashes_:
+        with open(path_, "rb") as f:
+            hashes_[key] = hashlib.file_digest(f, "sha1").hexdigest()
+    return hashes_[key]
+
+
+def sync_tree(src_: Path, dst_: Path, hashes_: dict = ASSET_HASHES) -> int:
+    """Copy files from src_ to dst_ which are missing or differ in content.
+
+    Files with same size and modification time are skipped without reading
+    them, others are compared by (cached) hash. Returns number of copied files.
+    """
+    copied = 0
+    for source in sorted(src_.rglob("*")):
+        if not source.is_file():
+            continue
+
+        target = Path(dst_, source.relative_to(src_))
+        source_stat = source.stat()
+        if target.exists():
+            target_stat = target.stat()
+            if target_stat.st_size == source_stat.st_size and (
+                target_stat.st_mtime_ns == source_stat.st_mtime_ns
+                or file_digest(target, target_stat, hashes_)
+                == file_digest(source, source_stat, hashes_)
+            ):
+                continue
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        copied += 1
+
+    return copied
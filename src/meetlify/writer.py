@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    src\meetlify\writer.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import atexit
+import logging
+from queue import Queue
+from threading import Lock, Thread
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from .targets import OutputTarget
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+class OutputWriter:
+    """Write-behind pipeline for rendered outputs.
+
+    Renderers push ``(output, bytes)`` into a bounded queue and continue
+    rendering, while writer threads hand them to the output target (see
+    targets.py). A full queue blocks renderers, so memory stays bounded.
+    Errors of writer threads are raised by ``flush`` and ``close``.
+    """
+
+    def __init__(
+        self, *, target_: OutputTarget, workers_: int = 4, queue_size_: int = 64
+    ) -> None:
+        assert isinstance(target_, OutputTarget)
+        assert 0 < workers_
+
+        self.target = target_
+        self.workers = workers_
+        self.queue = Queue(maxsize=queue_size_)
+        self.lock = Lock()
+        self.threads = []
+        self.errors = []  # (output, exception) of failed writes
+        self.written = 0
+        self.bytes = 0
+
+    def start(self) -> None:
+        self.threads = [
+            Thread(target=self.work, name=f"meetlify-writer-{number}", daemon=True)
+            for number in range(self.workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+        # daemon threads must not drop queued outputs when the process exits
+        atexit.register(self.close)
+
+    def write(self, output_: str, data_: str | bytes) -> None:
+        """Queue ``data_`` to be written to ``output_`` relative to the root"""
+        if not self.threads:
+            self.start()
+        if isinstance(data_, str):
+            data_ = data_.encode("utf-8")
+        self.queue.put((output_, data_))
+
+    def work(self) -> None:
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                self.save(*item)
+            except Exception as error:
+                with self.lock:
+                    self.errors.append((item[0], error))
+            finally:
+                self.queue.task_done()
+
+    def save(self, output_: str, data_: bytes) -> None:
+        self.target.write(output_, data_)
+        with self.lock:
+            self.written += 1
+            self.bytes += len(data_)
+
+    def flush(self) -> None:
+        """Wait until all queued outputs are written"""
+        if self.threads:
+            self.queue.join()
+        self.raise_errors()
+
+    def close(self) -> None:
+        """Write all queued outputs and stop the writer threads"""
+        if not self.threads:
+            return
+
+        atexit.unregister(self.close)
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+        logging.info(
+            "... wrote %d files (%.1f kB) with %d writer threads",
+            self.written,
+            self.bytes / 1024,
+            self.workers,
+        )
+        self.written = self.bytes = 0
+        self.raise_errors()
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            output, error = self.errors[0]
+            self.errors = []
+            raise OSError(f"writing output/{output} failed: {error}") from error
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\conftest.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import shutil
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+THEMES = Path(__file__).resolve().parent.parent / "src" / "meetlify" / "themes"
+
+
+def create_site(dest_: Path, posts_: int = 3) -> Path:
+    """Minimal project with the lindau theme and a few posts"""
+    folders = ["meetups", "pages", "posts", "categories", "images"]
+    Path(dest_, "configs.json").write_text(
+        json.dumps(
+            {
+                "name": "PyBodensee",
+                "URL": "https://pybodensee.com",
+                "theme": "lindau",
+                "folders": {
+                    "output": "output",
+                    "themes": "themes",
+                    "content": "content",
+                    **{folder: folder for folder in folders},
+                },
+                "menu": {"header": {"Posts": "posts"}, "footer": {}},
+                "about_us": [],
+                "banners": [],
+                "feeds": True,
+                "robots": True,
+            }
+        )
+    )
+    Path(dest_, "robots.json").write_text('{"sitemaps": []}')
+    Path(dest_, "redirects.json").write_text("[]")
+    shutil.copytree(THEMES, Path(dest_, "themes"))
+    for folder in folders:
+        Path(dest_, "content", folder).mkdir(parents=True)
+    Path(dest_, "output").mkdir()
+
+    # the lindau home page shows the next upcoming meetup
+    Path(dest_, "content", "meetups", "0001.md").write_text(
+        "title: Meetup 1\ndescription: Meetup 1\norganizer: Max\n"
+        "event_datetime: 2099-01-01::18:30\ncategories: python\n"
+        "feature_image: a.png\naddress: Lindau\nstatus: published\n\nMeetup 1\n"
+    )
+    for index in range(1, posts_ + 1):
+        Path(dest_, "content", "posts", f"{index:04d}.md").write_text(
+            f"title: Post {index}\nauthor: Max\ndescription: Post {index}\n"
+            f"create_date: 2024-01-{index:02d}::10:00\nfeature_image: a.png\n"
+            f"categories: python\nbanner: none\nstatus: published\n\nPost {index}\n"
+        )
+    return dest_
+
+
+def create_post(path_: Path, index_: int, status_: str = "published") -> None:
+    """Post ``index_`` of a posts folder, alternating the data and web categories"""
+    Path(path_, f"{index_:04d}.md").write_text(f"""title: Post {index_}
+author: Max
+description: Post {index_}
+create_date: 2024-01-{index_:02d}::10:00
+feature_image: image.png
+categories: {"data" if index_ % 2 else "web"}, python
+banner: none
+status: {status_}
+
+Content of post {index_}
+""")
+
+
+@pytest.fixture
+def make_site():
+    """Factory of minimal projects, e.g. ``make_site(tmp_path, posts_=20)``"""
+    return create_site
+
+
+@pytest.fixture
+def write_post():
+    """Writer of single posts, e.g. ``write_post(folder, 6, status_="draft")``"""
+    return create_post
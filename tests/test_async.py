@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_async.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import asyncio
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.targets import MemoryTarget
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_async_build_streams_events(tmp_path, make_site):
+    target = MemoryTarget()
+
+    async def build():
+        site = await Meetlify.load_async(make_site(tmp_path), target_=target)
+        return [event async for event in site.events_async(jobs_=2)]
+
+    events = asyncio.run(build())
+
+    assert events[0] == {
+        "event": "phase",
+        "dest": str(tmp_path),
+        "phase": "render_home",
+        "state": "started",
+    }
+    assert events[-1]["event"] == "build" and events[-1]["state"] == "finished"
+    assert "posts/post-2/index.html" in target.files
+
+
+def test_cancelled_build_leaves_consistent_outputs(tmp_path, make_site):
+    async def build():
+        site = await Meetlify.load_async(make_site(tmp_path, posts_=20))
+
+        def pause(event_):
+            # hold the build after post pages until it is cancelled
+            if event_.get("phase") == "render_post_pages" and "seconds" in event_:
+                site.cancelled.wait(5)
+
+        site.listeners.append(pause)
+        task = asyncio.create_task(site.make_async())
+        while "render_post_pages" not in site.timings and not task.done():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return site
+
+    site = asyncio.run(build())
+
+    manifest = json.loads(Path(tmp_path, ".meetlify", "manifest.json").read_text())
+    assert "posts/post-20/index.html" in manifest
+    assert all(Path(tmp_path, "output", output).exists() for output in manifest)
+    assert "copy_assests" not in site.timings
+
+
+def test_store_loaded_and_rendered_on_different_threads(tmp_path, make_site):
+    target = MemoryTarget()
+
+    async def build():
+        site = await Meetlify.load_async(
+            make_site(tmp_path), target_=target, store_=True
+        )
+        await site.make_async(jobs_=2)
+        return site
+
+    site = asyncio.run(build())
+
+    assert site.store is not None
+    assert "posts/post-2/index.html" in target.files
+    assert site.store.sources("posts") == [
+        Path(tmp_path, "content", "posts", f"{index:04d}.md").as_posix()
+        for index in (3, 2, 1)
+    ]
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_batch.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import DictLoader, Environment
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.batch import SharedBytecodeCache
+from src.meetlify.utils import sync_tree
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_shared_bytecode_cache_across_environments():
+    cache = SharedBytecodeCache()
+    for site in ("lindau", "konstanz"):
+        renderer = Environment(
+            loader=DictLoader({"base.html": "Hello {{ site }}"}), bytecode_cache=cache
+        )
+        assert renderer.get_template("base.html").render(site=site) == f"Hello {site}"
+
+    assert len(cache.buckets) == 1
+
+
+def test_sync_tree_copies_only_changed_files(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "css").mkdir(parents=True)
+    (src / "css" / "main.css").write_text("body {}")
+    (src / "logo.svg").write_text("<svg/>")
+
+    assert sync_tree(src, dst, {}) == 2
+    assert sync_tree(src, dst, {}) == 0
+
+    # same size and content but touched, is compared by hash and skipped
+    os.utime(src / "logo.svg", ns=(0, 0))
+    assert sync_tree(src, dst, {}) == 0
+
+    (src / "logo.svg").write_text("<svg></svg>")
+    assert sync_tree(src, dst, {}) == 1
+    assert (dst / "logo.svg").read_text() == "<svg></svg>"
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_calendars.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.calendars import CalendarEvent, ics_escape, ics_line
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def make_meetup(slug_: str, title_: str = "Meetup"):
+    return SimpleNamespace(
+        slug=slug_,
+        title=title_,
+        description="Talks, drinks; and more",
+        address="Lindau",
+        event_datetime=datetime(2099, 1, 1, 18, 30),
+        last_modified=datetime(2024, 1, 1),
+        categories=["python"],
+    )
+
+
+def test_lines_are_folded_at_75_octets():
+    lines = ics_line("DESCRIPTION", "x" * 200).split("\r\n")
+    assert [len(line.encode("utf-8")) for line in lines] == [75, 75, 64, 0]
+    assert "".join(line.removeprefix(" ") for line in lines) == "DESCRIPTION:" + (
+        "x" * 200
+    )
+
+    # multi-byte characters are never split between two lines
+    lines = ics_line("SUMMARY", "ä" * 100).rstrip("\r\n").split("\r\n")
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    assert [line.removeprefix(" ") for line in lines][1:] == ["ä" * 37, "ä" * 30]
+    assert "".join(line.removeprefix(" ") for line in lines) == "SUMMARY:" + "ä" * 100
+
+
+def test_text_values_are_escaped():
+    assert ics_escape("a,b;c\\d\ne\r\nf") == "a\\,b\\;c\\\\d\\ne\\nf"
+    assert ics_escape(None) == ""
+
+
+def test_uids_are_stable():
+    meetup = make_meetup("0003")
+    event = CalendarEvent.from_meetup(meetup, "https://pybodensee.com", "meetups")
+    again = CalendarEvent.from_meetup(
+        make_meetup("0003", "Renamed"), "https://pybodensee.com", "meetups"
+    )
+
+    assert event.uid == again.uid == "meetups-0003@pybodensee.com"
+    assert CalendarEvent.from_meetup(meetup, "", "meetups").uid == (
+        "meetups-0003@meetlify"
+    )
+
+    with io.StringIO(newline="") as file:
+        event.write_ics(file)
+        assert "DESCRIPTION:Talks\\, drinks\\; and more\r\n" in file.getvalue()
+
+
+def test_meetups_calendar_lists_upcoming_published_meetups(tmp_path, make_site):
+    make_site(tmp_path)
+    for index, (date, status) in enumerate(
+        [("2020-01-01", "published"), ("2099-02-01", "draft")], start=2
+    ):
+        Path(tmp_path, "content", "meetups", f"{index:04d}.md").write_text(
+            f"title: Meetup {index}\ndescription: Meetup {index}\norganizer: Max\n"
+            f"event_datetime: {date}::18:30\ncategories: python\n"
+            f"feature_image: a.png\naddress: Lindau\nstatus: {status}\n\nMeetup\n"
+        )
+
+    calendars = {
+        calendar.slug: calendar for calendar in Meetlify(dest_=tmp_path).calendars
+    }
+
+    assert [event.uid for event in calendars["meetups.ics"].events] == [
+        "meetups-meetup-1@pybodensee.com"
+    ]
+    assert "meetups/meetup-2/event.ics" in calendars
+    assert "meetups/meetup-3/event.ics" not in calendars
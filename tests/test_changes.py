@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_changes.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import subprocess
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.changes import ChangeSet
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def git(dest_, *args_):
+    subprocess.run(
+        ["git", "-C", str(dest_), "-c", "user.name=a", "-c", "user.email=a@b", *args_],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_change_set_from_git(tmp_path):
+    posts = tmp_path / "content" / "posts"
+    posts.mkdir(parents=True)
+    (posts / "0001.md").write_text("title: Post number 1\n\nHello Lindau " * 20)
+    (posts / "0002.md").write_text("title: Post number 2\n\nHello")
+    (tmp_path / "configs.json").write_text("{}")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "init")
+
+    git(tmp_path, "mv", "content/posts/0001.md", "content/posts/0001-renamed.md")
+    (posts / "0002.md").unlink()
+    (posts / "0003.md").write_text("title: Post number 3\n\nHello")
+
+    changes = ChangeSet.from_git(tmp_path, "HEAD", ["content", "configs.json"])
+
+    assert sorted((change.status, change.path) for change in changes) == [
+        ("A", "content/posts/0003.md"),
+        ("D", "content/posts/0002.md"),
+        ("R", "content/posts/0001-renamed.md"),
+    ]
+    assert changes.touches("content/posts")
+    assert not changes.touches("configs.json", "content/meetups")
+    assert changes.old_slug("content/posts/0002.md") == "post-number-2"
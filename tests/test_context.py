@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_context.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import DictLoader, Environment
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.configs import Banner, Menu
+from src.meetlify.context import SiteContext
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_partials_are_rendered_once_per_build():
+    renderer = Environment(
+        loader=DictLoader(
+            {
+                "header.html": "{% for key in meta.header %}[{{ key }}]{% endfor %}",
+                "page.html": "{{ partial('header.html') }}{{ title }}",
+            }
+        )
+    )
+    menu = Menu(header={"Home": "", "Posts": "posts"}, footer={})
+    site = SiteContext(meta=menu, menu=menu)
+    site.register(renderer)
+
+    assert renderer.get_template("page.html").render(title="a") == "[Home][Posts]a"
+
+    # later menu changes do not reach the cached partial
+    menu.header["About"] = "about"
+    assert renderer.get_template("page.html").render(title="b") == "[Home][Posts]b"
+    assert list(site.partials) == ["header.html"]
+
+
+def test_banners_are_looked_up_by_name():
+    banner = Banner(name="draft", type_="warning", message="Work in progress")
+    site = SiteContext(
+        meta=None, menu=Menu(header={}, footer={}), banners={"draft": banner}
+    )
+
+    assert site.banner("draft") is banner
+    assert site.banner("missing").name is None
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_daemon.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import os
+from functools import partial
+from pathlib import Path
+from threading import Thread
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+from click.testing import CliRunner
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify import cli
+from src.meetlify.batch import SiteReport
+from src.meetlify.daemon import BuildDaemon, BuildLock, serve, status, trigger
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def fake_build(dest_, jobs_):
+    assert Path(dest_, ".meetlify", "build.lock").exists()
+    return SiteReport(dest=str(dest_), seconds=0.1, timings={"render_home": 0.1})
+
+
+def test_triggers_are_debounced_and_coalesced(tmp_path):
+    builder = BuildDaemon(dest_=tmp_path, debounce_=0.2, build_=fake_build)
+    builder.start()
+    for number in range(3):
+        builder.trigger(f"commit {number}")
+    assert builder.wait(5)
+
+    builder.trigger("commit 3")
+    assert builder.wait(5)
+    builder.stop()
+
+    assert [record.reasons for record in builder.records] == [
+        ["commit 0", "commit 1", "commit 2"],
+        ["commit 3"],
+    ]
+    assert not Path(tmp_path, ".meetlify", "build.lock").exists()
+
+
+def test_http_endpoints(tmp_path):
+    builder = BuildDaemon(dest_=tmp_path, debounce_=0, build_=fake_build)
+    server = serve(builder, port_=0)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    Thread(target=server.serve_forever, daemon=True).start()
+    builder.start()
+
+    try:
+        assert trigger(url, "cms") == {"queued": True, "pending": 1}
+        assert builder.wait(5)
+        report = status(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+        builder.stop()
+
+    assert report["state"] == "idle"
+    assert report["builds"][0]["reasons"] == ["cms"]
+    assert report["builds"][0]["report"]["timings"] == {"render_home": 0.1}
+
+
+def test_stale_build_locks_are_taken_over(tmp_path):
+    lock_file = Path(tmp_path, ".meetlify", "build.lock")
+    lock_file.parent.mkdir()
+    lock_file.write_text("999999999")  # no such process
+
+    with BuildLock(tmp_path, timeout_=0):
+        assert lock_file.exists()
+    assert not lock_file.exists()
+
+
+def test_build_locks_always_name_their_owner(tmp_path):
+    lock_file = Path(tmp_path, ".meetlify", "build.lock")
+
+    with BuildLock(tmp_path) as lock:
+        assert lock.owner() == os.getpid()
+        with pytest.raises(TimeoutError):
+            BuildLock(tmp_path, timeout_=0).__enter__()
+    assert list(lock_file.parent.iterdir()) == []
+
+
+def test_build_locks_of_other_users_are_kept(tmp_path, monkeypatch):
+    lock_file = Path(tmp_path, ".meetlify", "build.lock")
+    lock_file.parent.mkdir()
+    lock_file.write_text("1")
+
+    def kill(pid_, signal_):
+        raise PermissionError(pid_)
+
+    monkeypatch.setattr(os, "kill", kill)
+    with pytest.raises(TimeoutError):
+        BuildLock(tmp_path, timeout_=0).__enter__()
+    assert lock_file.read_text() == "1"
+
+
+def test_fresh_build_locks_are_never_taken_over(tmp_path):
+    lock = BuildLock(tmp_path)
+    lock.lock_file.parent.mkdir()
+    # linked by a running build after this one found the lock to be stale
+    lock.lock_file.write_text(str(os.getpid()))
+
+    lock.take_over(Path(tmp_path, ".meetlify", "build.lock.1.1"))
+
+    assert lock.owner() == os.getpid()
+    assert list(lock.lock_file.parent.iterdir()) == [lock.lock_file]
+
+
+def test_build_locks_are_only_released_by_their_owner(tmp_path):
+    lock_file = Path(tmp_path, ".meetlify", "build.lock")
+
+    with BuildLock(tmp_path):
+        lock_file.write_text("1")  # taken over by another build
+    assert lock_file.read_text() == "1"
+
+
+def test_cli_builds_wait_for_the_build_lock(tmp_path, monkeypatch, make_site):
+    make_site(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli, "BuildLock", partial(BuildLock, timeout_=0))
+
+    with BuildLock(tmp_path):
+        for command in (["make"], ["merge"], ["make-all", str(tmp_path)]):
+            result = CliRunner().invoke(cli.main, command)
+            assert isinstance(result.exception, TimeoutError), command
+
+    result = CliRunner().invoke(cli.main, ["make"])
+    assert result.exit_code == 0, result.output
+    assert not Path(tmp_path, ".meetlify", "build.lock").exists()
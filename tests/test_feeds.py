@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_feeds.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+import json
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from xml.dom import minidom
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.feeds import Feeds
+from src.meetlify.manifest import Manifest, fingerprint
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def make_post(index_: int):
+    return SimpleNamespace(
+        title=f"Post <{index_}>",
+        author="Max",
+        description="Post & description",
+        create_date=datetime(2024, 1, index_, 10, 0),
+        last_modified=datetime(2024, 2, index_, tzinfo=timezone.utc),
+        slug=f"post-{index_}",
+        categories=["python"],
+        content="<p>content</p>",
+    )
+
+
+def make_feeds(limit_: int = 2) -> Feeds:
+    return Feeds(
+        feed_items_=[
+            {
+                "name": "posts",
+                "slug": "posts",
+                "folder": "posts",
+                "title": "Posts",
+                "author": "Max",
+                "items": [make_post(index) for index in (3, 2, 1)],
+            }
+        ],
+        limit_=limit_,
+        URL_="https://example.com",
+    )
+
+
+def test_feeds_limit_and_stable_ids():
+    feed = next(iter(make_feeds()))
+
+    assert [item.id for item in feed.items] == [
+        "https://example.com/posts/post-3/",
+        "https://example.com/posts/post-2/",
+    ]
+    assert feed.updated == datetime(2024, 2, 3, tzinfo=timezone.utc)
+    assert fingerprint(feed) == fingerprint(next(iter(make_feeds())))
+
+
+def test_feeds_atom_and_json_are_valid():
+    feed = next(iter(make_feeds()))
+
+    atom, json_feed = io.StringIO(), io.StringIO()
+    feed.write_atom(atom)
+    feed.write_json(json_feed)
+
+    entries = minidom.parseString(atom.getvalue()).getElementsByTagName("entry")
+    assert len(entries) == 2
+    assert json.loads(json_feed.getvalue())["items"][0]["title"] == "Post <3>"
+
+
+def test_manifest_is_fresh(tmp_path):
+    manifest = Manifest.from_json(tmp_path / "cache" / "manifest.json")
+    (tmp_path / "feed.xml").write_text("")
+
+    assert not manifest.is_fresh("feed.xml", "abc", tmp_path)
+    manifest.record("feed.xml", "abc")
+    manifest.save()
+
+    manifest = Manifest.from_json(tmp_path / "cache" / "manifest.json")
+    assert manifest.is_fresh("feed.xml", "abc", tmp_path)
+    assert not manifest.is_fresh("feed.xml", "xyz", tmp_path)
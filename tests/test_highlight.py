@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_highlight.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import asyncio
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.highlight import CodeHighlighter
+from src.meetlify.utils import convert_markdown
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+pytest.importorskip("pygments")
+
+MARKDOWN = """title: Tutorial
+
+```python
+print("hello")
+```
+
+```
+plain <text>
+```
+"""
+
+
+def test_fenced_code_is_highlighted():
+    highlighter = CodeHighlighter(style_="default")
+    meta, _, content, _ = convert_markdown(MARKDOWN, highlighter)
+
+    assert dict(meta) == {"title": "Tutorial"}
+    assert '<div class="highlight">' in content
+    assert '<span class="nb">print</span>' in content
+    assert "plain &lt;text&gt;" in content
+
+    # without highlighting code blocks are left to markdown
+    _, _, plain, _ = convert_markdown(MARKDOWN, CodeHighlighter(style_=None))
+    assert "highlight" not in plain
+
+
+def test_blocks_are_cached_across_builds(tmp_path):
+    json_file = tmp_path / "highlight.json"
+    highlighter = CodeHighlighter(style_="default", json_file_=json_file)
+    block = highlighter.highlight("x = 1\n", "python")
+    assert highlighter.highlight("x = 1\n", "python") == block
+    assert highlighter.highlighted == 1
+    highlighter.save()
+
+    next_build = CodeHighlighter(style_="default", json_file_=json_file)
+    assert next_build.highlight("x = 1\n", "python") == block
+    assert next_build.highlighted == 0
+
+    # other styles or languages are highlighted again
+    other_style = CodeHighlighter(style_="monokai", json_file_=json_file)
+    other_style.highlight("x = 1\n", "python")
+    other_style.highlight("x = 1\n", "unknown-language")
+    assert other_style.highlighted == 2
+    assert ".highlight" in other_style.stylesheet()
+
+
+def test_sites_loaded_concurrently_keep_their_style(tmp_path, make_site):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    highlighted = make_site(tmp_path / "a")
+    configs = json.loads((highlighted / "configs.json").read_text())
+    (highlighted / "configs.json").write_text(
+        json.dumps({**configs, "highlight": "monokai"})
+    )
+    with open(highlighted / "content" / "posts" / "0001.md", "a") as f:
+        f.write("\n```python\nprint(1)\n```\n")
+    plain = make_site(tmp_path / "b")
+
+    async def load():
+        return await asyncio.gather(
+            Meetlify.load_async(highlighted), Meetlify.load_async(plain)
+        )
+
+    site, other = asyncio.run(load())
+    site.make()
+    other.make()
+
+    post = highlighted / "output" / "posts" / "post-1" / "index.html"
+    assert '<span class="nb">print</span>' in post.read_text()
+    assert (highlighted / "output" / "static" / "css" / "highlight.css").stat().st_size
+    assert not (plain / "output" / "static" / "css" / "highlight.css").exists()
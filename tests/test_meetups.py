@@ -31,5 +31,64 @@ SOFTWARE.
 """
 
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from datetime import datetime
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.meetups import Meetups
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def write_meetups(path_, dates_: list[str], status_: str = "published") -> None:
+    for index, event_datetime in enumerate(dates_):
+        (path_ / f"{status_}-{index:04d}.md").write_text(
+            f"""title: {status_} meetup {index}
+description: Meetup {index}
+organizer: Max Mustermann
+event_datetime: {event_datetime}
+categories: python
+feature_image: image.png
+address: Lindau
+status: {status_}
+
+Details
+"""
+        )
+
+
 def test_init():
     pass
+
+
+def test_time_index(tmp_path):
+    write_meetups(
+        tmp_path,
+        [
+            "2023-12-01::18:00",
+            "2024-01-10::18:00",
+            "2024-03-05::18:00",
+            "2025-02-01::18:00",
+        ],
+    )
+    write_meetups(tmp_path, ["2024-02-01::18:00"], status_="draft")
+    meetups = Meetups(path_=tmp_path)
+    now = datetime(2024, 2, 1)
+
+    assert [m.event_datetime.month for m in meetups.upcoming(now)] == [3, 2]
+    assert [m.event_datetime.year for m in meetups.past(now)] == [2024, 2023]
+    assert [m.title for m in meetups.next(1, now)] == ["published meetup 2"]
+    assert meetups.years() == [2025, 2024, 2023]
+    assert meetups.months(2024) == [3, 1]
+    assert len(meetups.by_month(2024, 2)) == 0
+    assert len(meetups.between(datetime(2024, 1, 1), datetime(2025, 3, 1))) == 3
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_memory.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+from dataclasses import dataclass
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.memory import MemoryProfiler, deep_size
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@dataclass
+class Record:
+    title: str
+    body: str
+
+
+def test_deep_size_follows_references():
+    shared = "x" * 10_000
+    records = [Record(title=f"post {number}", body=shared) for number in range(10)]
+
+    # the shared body is counted once, and not at all when excluded
+    assert deep_size(records) > 10_000
+    assert deep_size(records) < 20_000
+    assert deep_size(records, exclude_=(shared,)) < 10_000
+
+
+def test_phases_are_measured_at_finished_events(tmp_path):
+    profiler = MemoryProfiler(top_=5)
+    profiler.start()
+    try:
+        profiler.measure("load")
+        profiler.measure_collections(posts=[Record("a", "b")])
+
+        retained = [bytearray(1024) for _ in range(256)]
+        profiler({"event": "phase", "phase": "render_posts", "state": "started"})
+        profiler({"event": "phase", "phase": "render_posts", "state": "finished"})
+    finally:
+        profiler.stop()
+
+    assert [reading.phase for reading in profiler.phases] == ["load", "render_posts"]
+    render_posts = profiler.phases[1]
+    assert render_posts.top[0]["size"] >= 256 * 1024
+    assert "test_memory.py" in render_posts.top[0]["site"]
+    assert len(retained) == 256
+
+    profiler.save(tmp_path / "memory.json", {"render_posts": 0.5})
+    report = json.loads((tmp_path / "memory.json").read_text())
+    assert report["timings"] == {"render_posts": 0.5}
+    assert report["collections"]["posts"] > 0
+    assert "render_posts" in str(profiler)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_plan.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from click.testing import CliRunner
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.cli import main
+from src.meetlify.manifest import ManifestEntry
+from src.meetlify.plan import Plan
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_plan_explains_changes():
+    previous = ManifestEntry(digest="1", inputs={"theme": "a", "post": "b"})
+
+    plan = Plan()
+    plan.add("posts/a/index.html", {"theme": "a", "post": "b"}, previous, True, True)
+    plan.add("posts/b/index.html", {"theme": "a", "post": "c"}, previous, False, True)
+    plan.add("posts/c/index.html", {"theme": "a", "post": "b"}, None, False, False)
+    plan.add("posts/d/index.html", {"theme": "a", "post": "b"}, previous, False, False)
+    plan.remove("posts/e/index.html", "no longer produced")
+
+    assert plan.unchanged == 1
+    assert [(item.action, item.reason) for item in plan] == [
+        ("update", "post changed"),
+        ("create", "new output"),
+        ("create", "output file missing"),
+        ("remove", "no longer produced"),
+    ]
+    assert plan.to_dict()["summary"]["create"] == 2
+
+
+def snapshot(dest_: Path) -> dict[str, bytes]:
+    """Contents of the build caches and of redirects.json"""
+    files = [Path(dest_, "redirects.json"), *Path(dest_, ".meetlify").rglob("*")]
+    return {
+        path.relative_to(dest_).as_posix(): path.read_bytes()
+        for path in files
+        if path.is_file()
+    }
+
+
+def test_plan_has_no_side_effects(tmp_path, monkeypatch, make_site):
+    make_site(tmp_path)
+    Meetlify(dest_=tmp_path, store_=True, dates_="content").make()
+
+    # a changed slug (redirect) and changed content (store, dates, caches)
+    post = Path(tmp_path, "content", "posts", "0002.md")
+    post.write_text(post.read_text().replace("title: Post 2", "title: Post Two"))
+    Path(tmp_path, "content", "posts", "0004.md").write_text(
+        "title: Post 4\nauthor: Max\ndescription: Post 4\n"
+        "create_date: 2024-01-04::10:00\nfeature_image: a.png\n"
+        "categories: python\nbanner: none\nstatus: published\n\nPost 4\n"
+    )
+    before = snapshot(tmp_path)
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(
+        main, ["make", "--plan", "--store", "--dates", "content"]
+    )
+
+    assert result.exit_code == 2, result.output
+    assert "posts/post-two/index.html" in result.output
+    assert snapshot(tmp_path) == before
+
+
+def test_plan_of_a_clean_highlighted_site_is_empty(tmp_path, make_site):
+    make_site(tmp_path)
+    configs = json.loads(Path(tmp_path, "configs.json").read_text())
+    Path(tmp_path, "configs.json").write_text(
+        json.dumps({**configs, "highlight": "default"})
+    )
+    Meetlify(dest_=tmp_path).make()
+
+    plan = Meetlify(dest_=tmp_path, plan_=True).make_plan()
+
+    assert list(plan) == []
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_progress.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import io
+import json
+import logging
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.progress import OUTPUTS_LOGGER, EventStream, Progress
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_outputs_are_counted_per_phase(caplog):
+    events = []
+    progress = Progress(emit_=lambda event, **data: events.append(data), interval_=60)
+
+    with caplog.at_level(logging.INFO):
+        progress.start("render_posts")
+        progress.expect(3)
+        progress.advance("posts/a/index.html")
+        progress.advance("posts/b/index.html", "unchanged")
+        progress.advance("posts/c/index.html")
+        progress.finish()
+
+    # one line per phase, no line per output
+    assert len(caplog.records) == 1
+    assert "render_posts: 3 outputs" in caplog.text
+    assert "(wrote 2, unchanged 1)" in caplog.text
+    assert events[-1]["counts"] == {"wrote": 2, "unchanged": 1}
+    assert (events[-1]["done"], events[-1]["total"], events[-1]["final"]) == (
+        3,
+        3,
+        True,
+    )
+
+    # phases without outputs are not reported
+    progress.start("render_search")
+    progress.finish()
+    assert len(events) == 1
+
+
+def test_verbose_logs_every_output(caplog):
+    progress = Progress(emit_=lambda event, **data: None)
+    with caplog.at_level(logging.DEBUG, logger=OUTPUTS_LOGGER.name):
+        progress.advance("index.html")
+    assert "wrote output/index.html" in caplog.text
+
+
+def test_event_stream_writes_json_lines():
+    file = io.StringIO()
+    stream = EventStream(file)
+    stream({"event": "phase", "phase": "render_home", "state": "started"})
+    stream({"event": "build", "state": "finished"})
+
+    lines = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["phase", "build"]
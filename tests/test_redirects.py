@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_redirects.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.redirects import Redirects
+from src.meetlify.targets import MemoryTarget
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def redirects(*rules_):
+    return Redirects(
+        redirect_items_=[
+            {"from": from_, "to": to, "force": True, "status_code": status_code}
+            for from_, to, status_code in rules_
+        ]
+    )
+
+
+def test_redirect_chains_are_collapsed():
+    compiled = redirects(
+        ("/a/", "/b/", 301),
+        ("/b/", "/c/", 301),
+        ("/c/", "/d/", 302),
+        ("/a/", "/b/", 301),
+    ).compile()
+
+    assert [(r.from_, r.to, r.status_code) for r in compiled] == [
+        ("/a/", "/d/", 302),
+        ("/b/", "/d/", 302),
+        ("/c/", "/d/", 302),
+    ]
+
+
+def test_redirect_loops_and_conflicts_are_rejected():
+    with pytest.raises(ValueError, match="redirect loop: /a/ -> /b/ -> /a/"):
+        redirects(("/a/", "/b/", 301), ("/b/", "/a/", 301)).compile()
+
+    with pytest.raises(ValueError, match="conflicting redirects for /a/"):
+        redirects(("/a/", "/b/", 301), ("/a/", "/c/", 301))
+
+
+def test_redirect_formats():
+    rules = redirects(("/old-post/", "/posts/new/", 301))
+
+    assert rules.to_netlify() == "/old-post/\t/posts/new/\t301"
+    assert '"/old-post/" "/posts/new/";' in rules.to_nginx()
+    assert "RewriteRule ^/?old\\-post/$ /posts/new/ [R=301,L]" in rules.to_apache()
+
+
+def test_slug_redirects_are_saved_by_the_build(tmp_path, make_site):
+    make_site(tmp_path)
+    Meetlify(dest_=tmp_path, store_=True, target_=MemoryTarget()).make()
+
+    post = Path(tmp_path, "content", "posts", "0002.md")
+    post.write_text(post.read_text().replace("title: Post 2", "title: Post Two"))
+    site = Meetlify(dest_=tmp_path, store_=True, target_=MemoryTarget())
+
+    # loading only collects the redirect, the build saves it
+    assert "/posts/post-2/" in site.redirects
+    assert json.loads(Path(tmp_path, "redirects.json").read_text()) == []
+
+    site.make()
+    assert json.loads(Path(tmp_path, "redirects.json").read_text()) == [
+        {
+            "from": "/posts/post-2/",
+            "to": "/posts/post-two/",
+            "force": True,
+            "status_code": 301,
+        }
+    ]
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_related.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from types import SimpleNamespace
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify import related
+from src.meetlify.related import RelatedIndex, minhash
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+PANDAS = "<p>Pandas dataframes, series and indexes for data analysis</p>"
+DJANGO = "<p>Django views, models, templates and the admin</p>"
+ASYNC = "<p>Asyncio event loops, coroutines, tasks and futures</p>"
+TYPING = "<p>Type hints, protocols, generics and mypy checks</p>"
+
+
+def make_content(slug_: str, content_: str, categories_: tuple = ("python",)):
+    return SimpleNamespace(
+        slug=slug_,
+        title=slug_,
+        description="",
+        content=content_,
+        categories=categories_,
+    )
+
+
+def test_signatures_are_stable_between_builds(tmp_path):
+    # fixed seed and crc32 instead of hash(), which is salted per process
+    assert minhash(["pandas", "dataframes", "#python"])[:3] == [
+        49542618857316400,
+        321106653089134275,
+        970618340822374083,
+    ]
+
+    content = make_content("a", PANDAS)
+    index = RelatedIndex(json_file_=tmp_path / "related.json", signatures_={})
+    other = RelatedIndex(json_file_=tmp_path / "related.json", signatures_={})
+    assert index.signature("posts/a", content) == other.signature("posts/a", content)
+
+
+def test_similar_content_becomes_candidate_through_bands(tmp_path):
+    index = RelatedIndex(json_file_=tmp_path / "related.json", signatures_={})
+    contents = [
+        make_content("a", PANDAS),
+        make_content("b", DJANGO),
+        make_content("c", PANDAS.replace("analysis", "science")),
+    ]
+
+    result = index.related("posts", contents, count_=1)
+
+    # not the listing neighbour b, but the similar c from a shared bucket
+    assert [content.slug for content in result["a"]] == ["c"]
+    assert [content.slug for content in result["c"]] == ["a"]
+
+
+def test_category_overlap_ranks_equal_texts(tmp_path):
+    index = RelatedIndex(json_file_=tmp_path / "related.json", signatures_={})
+    contents = [
+        make_content("a", PANDAS, ["python", "data"]),
+        make_content("b", PANDAS, ["web"]),
+        make_content("c", PANDAS, ["data"]),
+    ]
+
+    result = index.related("posts", contents, count_=2)
+
+    assert [content.slug for content in result["a"]] == ["c", "b"]
+
+
+def test_unrelated_content_is_filled_up_with_neighbours(tmp_path):
+    index = RelatedIndex(json_file_=tmp_path / "related.json", signatures_={})
+    contents = [
+        make_content("a", PANDAS, []),
+        make_content("b", DJANGO, []),
+        make_content("c", ASYNC, []),
+        make_content("d", TYPING, []),
+    ]
+
+    result = index.related("posts", contents, count_=2)
+
+    # following items in listing order first, then the preceding ones
+    assert [content.slug for content in result["b"]] == ["c", "d"]
+    assert [content.slug for content in result["d"]] == ["c", "b"]
+
+
+def test_cached_signatures_are_reused(tmp_path, monkeypatch):
+    contents = [make_content("a", PANDAS), make_content("b", DJANGO)]
+    index = RelatedIndex.from_json(tmp_path / "related.json")
+    index.related("posts", contents)
+    index.save()
+
+    hashed = []
+    monkeypatch.setattr(
+        related, "minhash", lambda features_: hashed.append(features_) or [0] * 64
+    )
+
+    # only the changed document is hashed again, removed ones are dropped
+    index = RelatedIndex.from_json(tmp_path / "related.json")
+    index.related("posts", [make_content("a", PANDAS), make_content("c", ASYNC)])
+    assert len(hashed) == 1
+    assert set(index.signatures) == {"posts/a", "posts/c"}
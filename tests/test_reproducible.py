@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_reproducible.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from datetime import datetime, timezone
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.reproducible import build_time, content_dates
+from src.meetlify.robots import Robots
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_build_time_from_source_date_epoch(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    assert build_time() == datetime(2023, 11, 14, 22, 13, 20)
+    assert build_time(utc_=True).tzinfo == timezone.utc
+
+
+def test_content_dates_change_with_content_only(tmp_path, monkeypatch):
+    posts = tmp_path / "content" / "posts"
+    posts.mkdir(parents=True)
+    (posts / "0001.md").write_text("title: Post 1")
+    dates_file = tmp_path / ".meetlify" / "dates.json"
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    first = content_dates(tmp_path, "content", dates_file)
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1800000000")
+    assert content_dates(tmp_path, "content", dates_file) == first
+
+    (posts / "0001.md").write_text("title: Post one")
+    changed = content_dates(tmp_path, "content", dates_file)
+    assert changed[(posts / "0001.md").as_posix()].year == 2027
+
+
+@pytest.mark.parametrize("store", [False, True])
+def test_dates_are_kept_per_site(tmp_path, monkeypatch, make_site, store):
+    make_site(tmp_path)
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    dated = Meetlify(dest_=tmp_path, store_=store, dates_="content")
+    plain = Meetlify(dest_=tmp_path, store_=store, dates_="mtime")
+
+    assert {post.last_modified.year for post in dated.posts.content} == {2023}
+    assert {post.last_modified.year for post in plain.posts.content} != {2023}
+
+
+def test_robots_sitemaps_are_unique_and_ordered():
+    robots = Robots(robots_items_={"*": {"allow": ["/"], "disallow": []}})
+    robots.sitemaps = ["/sitemap-b.xml", "/sitemap-a.xml", "/sitemap-b.xml"]
+
+    assert str(robots).endswith("Sitemap: /sitemap-b.xml\nSitemap: /sitemap-a.xml")
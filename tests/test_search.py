@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_search.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+import re
+from types import SimpleNamespace
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.search import SearchIndex, tokenize
+from src.meetlify.targets import MemoryTarget
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def make_document(title_: str, content_: str):
+    return SimpleNamespace(title=title_, description="", content=content_)
+
+
+def test_tokenize_strips_html_and_stop_words():
+    assert tokenize("<h2 id='x'>The Pandas</h2><p>and NumPy 2024</p>") == [
+        "pandas",
+        "numpy",
+    ]
+
+
+def test_search_index_is_incremental(tmp_path):
+    index = SearchIndex.from_json(tmp_path / "search.json")
+    documents = [
+        ("posts", "/posts/a/", make_document("Pandas", "<p>dataframes</p>")),
+        ("posts", "/posts/b/", make_document("Django", "<p>views</p>")),
+    ]
+
+    assert index.update(documents) == 2
+    index.save()
+
+    index = SearchIndex.from_json(tmp_path / "search.json")
+    documents[1] = ("posts", "/posts/b/", make_document("Django", "<p>models</p>"))
+    assert index.update(documents) == 1
+
+    shards = index.shards()
+    assert shards["pa"]["pandas"] == [["/posts/a/", 5]]
+    assert "vi" not in shards and shards["mo"]["models"] == [["/posts/b/", 1]]
+    assert set(index.catalog(list(shards))["documents"]) == {"/posts/a/", "/posts/b/"}
+
+
+def search_like_js(target_: MemoryTarget, query_: str) -> list[str]:
+    """Query the generated index like static/js/search.js does"""
+    catalog = json.loads(target_.read("search/index.json"))
+    terms = [
+        word
+        for word in re.findall(r"[^\W]+", query_.lower())
+        if len(word) > 1 and not word.isdigit() and word not in catalog["stop_words"]
+    ]
+
+    scores = None
+    for term in terms:
+        name = term[: catalog["prefix"]]
+        shard = (
+            json.loads(target_.read(f"search/{name}.json"))
+            if name in catalog["shards"]
+            else {}
+        )
+        matches = {}
+        for indexed, postings in shard.items():
+            if indexed.startswith(term):
+                for id_, weight in postings:
+                    matches[id_] = matches.get(id_, 0) + weight
+        scores = (
+            matches
+            if scores is None
+            else {id_: scores[id_] + matches[id_] for id_ in scores if id_ in matches}
+        )
+    return sorted(scores or {}, key=lambda id_: (-scores[id_], id_))
+
+
+def test_queries_with_stop_words_find_documents(tmp_path, make_site):
+    target = MemoryTarget()
+    Meetlify(dest_=make_site(tmp_path), target_=target).make()
+
+    assert search_like_js(target, "the post") == [
+        "/posts/post-1/",
+        "/posts/post-2/",
+        "/posts/post-3/",
+    ]
+    assert search_like_js(target, "a meetup in") == ["/meetups/meetup-1/"]
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_shards.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.shards import Shard
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_shards_partition_slugs():
+    shards = [Shard.from_string(f"{index}/4") for index in range(1, 5)]
+    slugs = [f"meetup-{number}-in-lindau" for number in range(100)]
+
+    for slug in slugs:
+        assert sum(shard.owns(slug) for shard in shards) == 1
+    assert all(any(shard.owns(slug) for slug in slugs) for shard in shards)
+
+
+def test_shard_from_string():
+    assert Shard.from_string("2/4").folder == ".meetlify/shards/2-of-4"
+
+    with pytest.raises(ValueError):
+        Shard.from_string("2-4")
+    with pytest.raises(AssertionError):
+        Shard.from_string("5/4")
+
+
+def test_discover_requires_all_shards(tmp_path):
+    for shard in (Shard(1, 3), Shard(3, 3)):
+        (tmp_path / shard.folder).mkdir(parents=True)
+        (tmp_path / shard.manifest_file).write_text("{}")
+
+    with pytest.raises(ValueError, match="missing shards 2-of-3"):
+        Shard.discover(tmp_path)
+
+    (tmp_path / Shard(2, 3).folder).mkdir(parents=True)
+    (tmp_path / Shard(2, 3).manifest_file).write_text("{}")
+    assert [shard.index for shard in Shard.discover(tmp_path)] == [1, 2, 3]
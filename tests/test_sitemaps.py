@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_sitemaps.py
+    
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of 
+this software and associated documentation files (the "Software"), to deal in 
+the Software without restriction, including without limitation the rights to 
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies 
+of the Software, and to permit persons to whom the Software is furnished to do 
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all 
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.api import Meetlify
+from src.meetlify.sitemaps import Sitemaps
+from src.meetlify.targets import MemoryTarget
+from src.meetlify.utils import convert_markdown
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_images_are_collected_while_parsing():
+    *_, images = convert_markdown(
+        "title: Meetup\n\n![venue](/images/venue.png) and ![map](map.png)"
+    )
+
+    assert images == ("/images/venue.png", "map.png")
+
+
+def test_sitemap_images_and_news():
+    post = SimpleNamespace(
+        slug="hello",
+        feature_image="feature.png",
+        images=["/images/venue.png", "map.png", "/images/venue.png"],
+        last_modified=None,
+    )
+    sitemaps = Sitemaps(
+        sitemap_items_=[{"name": "posts", "items": [post], "news": [post]}],
+        URL_="https://pybodensee.com",
+    )
+
+    sitemap = sitemaps.all_sitemaps[0]
+    assert sitemap.images["hello"] == [
+        "https://pybodensee.com/images/feature.png",
+        "https://pybodensee.com/images/venue.png",
+        "https://pybodensee.com/posts/hello/map.png",
+    ]
+    assert sitemap.news == ["hello"]
+
+
+@pytest.mark.parametrize("news_days", [None, 1, 36500])
+def test_news_sitemap_only_with_recent_posts(tmp_path, news_days, make_site):
+    configs = json.loads(make_site(tmp_path).joinpath("configs.json").read_text())
+    if news_days is not None:
+        configs["news_days"] = news_days
+    Path(tmp_path, "configs.json").write_text(json.dumps(configs))
+
+    target = MemoryTarget()
+    Meetlify(dest_=tmp_path, target_=target).make()
+    robots = target.read("robots.txt")
+
+    # posts of the site are from january 2024
+    if news_days != 36500:
+        assert "sitemap-news.xml" not in target.files
+        assert "sitemap-news.xml" not in robots
+        return
+
+    assert "https://pybodensee.com/sitemap-news.xml" in robots
+    news = target.read("sitemap-news.xml")
+    assert "<news:publication_date>2024-01-02</news:publication_date>" in news
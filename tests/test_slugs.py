@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_slugs.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.constants import STATUS
+from src.meetlify.posts import Posts
+from src.meetlify.slugs import SlugRegistry
+from src.meetlify.store import ContentStore
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@pytest.mark.parametrize("store", [False, True])
+def test_slug_registry(tmp_path, store, write_post):
+    posts_folder = tmp_path / "posts"
+    posts_folder.mkdir()
+    for index in range(1, 5):
+        write_post(posts_folder, index)
+    write_post(posts_folder, 5, status_="draft")
+
+    # same title as post 2, but written to another file
+    (posts_folder / "0006.md").write_text(
+        (posts_folder / "0002.md").read_text().replace("Content of", "Copy of")
+    )
+
+    slugs = SlugRegistry(url_="https://example.com", folders_={"posts": "blog"})
+    posts = Posts(
+        path_=posts_folder,
+        store_=ContentStore(db_file_=tmp_path / "content.db") if store else None,
+        slugs_=slugs,
+    )
+
+    assert slugs.url_for("posts", "post-3") == "https://example.com/blog/post-3/"
+    assert "Content of" in slugs.get("posts", "post-2").content
+    assert [str(collision) for collision in slugs.collisions.values()] == [
+        f"posts/post-2: {posts_folder.as_posix()}/0002.md, "
+        f"{posts_folder.as_posix()}/0006.md"
+    ]
+
+    # only the first file of a collision is rendered
+    published = posts[STATUS.PUBLISHED, STATUS.DONE]
+    assert sorted(post.slug for post in published) == [
+        "post-1",
+        "post-2",
+        "post-3",
+        "post-4",
+    ]
+    assert "Content of" in next(p for p in published if p.slug == "post-2").content
+
+    # drafts are not rendered and can not be linked
+    with pytest.raises(KeyError):
+        slugs.url_for("posts", "post-5")
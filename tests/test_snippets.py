@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_snippets.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.posts import Posts
+from src.meetlify.snippets import SnippetLibrary
+from src.meetlify.store import ContentStore
+from src.meetlify.utils import MarkdownConvertor
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+@pytest.fixture
+def snippets(tmp_path):
+    folder = tmp_path / "snippets"
+    (folder / "venue").mkdir(parents=True)
+    (folder / "venue" / "lindau-hub.md").write_text("**Lindau Hub**, Main street 1\n")
+    (folder / "cta.md").write_text("Join *us*!\n")
+    return SnippetLibrary(folder_=folder)
+
+
+def test_shortcodes_are_expanded_once(tmp_path, snippets, write_post):
+    (tmp_path / "posts").mkdir()
+    for index in range(1, 4):
+        write_post(tmp_path / "posts", index)
+        with open(tmp_path / "posts" / f"{index:04d}.md", "a") as f:
+            f.write('\n{{< venue "lindau-hub" >}}\n\nPlease {{< cta >}}\n')
+
+    posts = Posts(
+        path_=tmp_path / "posts", convertor_=MarkdownConvertor(snippets_=snippets)
+    )
+
+    assert (
+        "<p><strong>Lindau Hub</strong>, Main street 1</p>" in posts.content[0].content
+    )
+    assert "<p>Please Join <em>us</em>!</p>" in posts.content[0].content
+    assert snippets.converted == 2
+
+
+def test_changed_snippets_invalidate_stored_records(tmp_path, snippets, write_post):
+    (tmp_path / "posts").mkdir()
+    for index in range(1, 4):
+        write_post(tmp_path / "posts", index)
+    with open(tmp_path / "posts" / "0002.md", "a") as f:
+        f.write('\n{{< venue "lindau-hub" >}}\n')
+
+    convertor = MarkdownConvertor(snippets_=snippets)
+    store = ContentStore(db_file_=tmp_path / "content.db", convertor_=convertor)
+    Posts(path_=tmp_path / "posts", store_=store)
+    assert store.parsed["posts"] == (3, 3)
+
+    (snippets.folder / "venue" / "lindau-hub.md").write_text("**Lindau Hub** (moved)\n")
+    posts = Posts(path_=tmp_path / "posts", store_=store)
+
+    # only the post using the snippet is parsed again
+    assert store.parsed["posts"] == (1, 3)
+    assert (
+        "(moved)"
+        in next(post for post in posts.content if post.slug == "post-2").content
+    )
+    store.close()
+
+
+def test_sites_use_their_own_snippets(tmp_path, write_post):
+    for site, venue in (("a", "Lindau Hub"), ("b", "Konstanz Lab")):
+        (tmp_path / site / "snippets").mkdir(parents=True)
+        (tmp_path / site / "snippets" / "venue.md").write_text(f"{venue}\n")
+        (tmp_path / site / "posts").mkdir()
+        write_post(tmp_path / site / "posts", 1)
+        with open(tmp_path / site / "posts" / "0001.md", "a") as f:
+            f.write("\n{{< venue >}}\n")
+
+    posts = {
+        site: Posts(
+            path_=tmp_path / site / "posts",
+            convertor_=MarkdownConvertor(
+                snippets_=SnippetLibrary(folder_=tmp_path / site / "snippets")
+            ),
+        )
+        for site in ("a", "b")
+    }
+
+    assert "Lindau Hub" in posts["a"].content[0].content
+    assert "Konstanz Lab" in posts["b"].content[0].content
+
+
+def test_snippets_stay_in_their_folder(tmp_path, snippets, write_post):
+    (tmp_path / "secret.md").write_text("password\n")
+    (tmp_path / "posts").mkdir()
+    write_post(tmp_path / "posts", 1)
+    with open(tmp_path / "posts" / "0001.md", "a") as f:
+        f.write('\n{{< venue "../../secret" >}}\n')
+
+    posts = Posts(
+        path_=tmp_path / "posts", convertor_=MarkdownConvertor(snippets_=snippets)
+    )
+
+    assert "password" not in posts.content[0].content
+    assert snippets.path("venue/../../secret") is None
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_store.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from datetime import datetime
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.constants import STATUS
+from src.meetlify.posts import Post, Posts
+from src.meetlify.store import ContentStore
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_store_backed_posts(tmp_path, write_post):
+    (tmp_path / "posts").mkdir()
+    for index in range(1, 6):
+        write_post(tmp_path / "posts", index)
+    write_post(tmp_path / "posts", 6, status_="draft")
+
+    store = ContentStore(db_file_=tmp_path / "content.db")
+    posts = Posts(path_=tmp_path / "posts", store_=store)
+
+    assert [post.title for post in posts[STATUS.PUBLISHED]][0:2] == ["Post 5", "Post 4"]
+    assert [post.slug for post in posts.by_categories()["data"]] == [
+        "post-5",
+        "post-3",
+        "post-1",
+    ]
+    store.close()
+
+    # reopened store parses nothing and answers indexed queries
+    store = ContentStore(db_file_=tmp_path / "content.db")
+    assert len(Posts(path_=tmp_path / "posts", store_=store)[STATUS.DRAFT]) == 1
+    assert store.sources("posts", slug_="post-2") == [
+        (tmp_path / "posts" / "0002.md").as_posix()
+    ]
+    recent = store.query(
+        "posts", Post, category_="web", since_=datetime(2024, 1, 3), reverse_=False
+    )
+    assert [post.slug for post in recent] == ["post-4", "post-6"]
+    assert isinstance(recent[0].create_date, datetime)
+    store.close()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_targets.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import tarfile
+import zipfile
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.targets import MemoryTarget, TarTarget, ZipTarget, archive_target
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_memory_target(tmp_path):
+    Path(tmp_path, "css").mkdir()
+    Path(tmp_path, "css", "styles.css").write_text("body {}")
+
+    target = MemoryTarget()
+    target.write("posts/a/index.html", b"a")
+    target.write("posts/b/index.html", b"b")
+    assert target.sync(tmp_path, "static") == 1
+
+    target.remove_folder("posts/a")
+    target.remove("missing.html")
+    assert sorted(target.files) == ["posts/b/index.html", "static/css/styles.css"]
+    assert target.read("static/css/styles.css") == "body {}"
+    assert not target.persistent
+
+
+def test_archive_targets(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    for name in ("site.zip", "site.tar.gz"):
+        target = archive_target(Path(tmp_path, name))
+        target.write("index.html", b"home")
+        target.write("posts/a/index.html", b"post")
+        target.close()
+
+    assert isinstance(archive_target(Path(tmp_path, "x.tgz")), TarTarget)
+    with zipfile.ZipFile(Path(tmp_path, "site.zip")) as archive:
+        assert archive.read("posts/a/index.html") == b"post"
+        assert archive.getinfo("index.html").date_time == (2023, 11, 14, 22, 13, 20)
+    with tarfile.open(Path(tmp_path, "site.tar.gz")) as archive:
+        assert archive.extractfile("index.html").read() == b"home"
+        assert archive.getmember("index.html").mtime == 1700000000
+
+    with pytest.raises(ValueError, match="unknown archive type"):
+        archive_target(Path(tmp_path, "site.rar"))
+    assert ZipTarget.persistent is False
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_templates.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from jinja2 import DictLoader, Environment
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.manifest import Manifest
+from src.meetlify.templates import TemplateAnalyzer, TemplateStats
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def analyzer(**templates_):
+    return TemplateAnalyzer(Environment(loader=DictLoader(templates_)))
+
+
+def test_template_graph_and_invalidated_outputs(tmp_path):
+    templates = analyzer(
+        **{
+            "base.html": "{{ partial('includes/header.html') }}{% block main %}{% endblock %}",
+            "includes/header.html": "header",
+            "includes/macros.html": "{% macro card() %}card{% endmacro %}",
+            "post.html": "{% extends 'base.html' %}{% import 'includes/macros.html' as m %}",
+            "page.html": "{% extends 'base.html' %}",
+            "feed.xml": "{% include name %}",
+        }
+    )
+
+    assert templates.graph["post.html"] == {"base.html", "includes/macros.html"}
+    assert templates.dynamic == {"feed.xml"}
+    assert templates.dependencies("page.html") == {
+        "page.html",
+        "base.html",
+        "includes/header.html",
+    }
+    assert templates.dependents("includes/macros.html") == {
+        "includes/macros.html",
+        "post.html",
+        "feed.xml",
+    }
+    assert templates.digest("page.html") != templates.digest("post.html")
+
+    manifest = Manifest(
+        json_file_=tmp_path / "manifest.json",
+        entries_={
+            "posts/a/index.html": {"digest": "1", "inputs": {"template": "post.html"}},
+            "about/index.html": {"digest": "2", "inputs": {"template": "page.html"}},
+        },
+    )
+    assert templates.invalidated(manifest, "includes/macros.html") == [
+        "posts/a/index.html"
+    ]
+    assert len(templates.invalidated(manifest, "includes/header.html")) == 2
+
+
+def test_render_statistics():
+    templates = analyzer(**{"list.html": "{% for i in items %}{{ i }}{% endfor %}"})
+    for count in (1, 2, 3):
+        templates.render("list.html", items=list(range(count)))
+
+    stats = templates.stats["list.html"]
+    assert (stats.count, stats.bytes) == (3, 6)
+    assert [size for size, _ in stats.samples] == [1, 2, 3]
+
+    growing = TemplateStats(name="a", samples=[(1, 0.1), (10, 1.0), (100, 9.0)])
+    constant = TemplateStats(name="b", samples=[(1, 0.1), (10, 0.1), (100, 0.1)])
+    assert growing.scales and not constant.scales
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Meetlify: Static Site Generator for Meetup Websites
+A Python Package for Generating Static Website for Meetups.
+https://github.com/pybodensee/meetlify
+
+    tests\test_writer.py
+
+    Copyright (C) 2024-2024 Faisal Shahzad <info@serpwings.com>
+
+<LICENSE_BLOCK>
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+</LICENSE_BLOCK>
+"""
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# STANDARD LIBARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import shutil
+from pathlib import Path
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# 3rd PARTY LIBRARY IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# INTERNAL IMPORTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from src.meetlify.targets import DirectoryTarget
+from src.meetlify.writer import OutputWriter
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPLEMENATIONS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def test_outputs_are_written_behind(tmp_path):
+    writer = OutputWriter(
+        target_=DirectoryTarget(root_=tmp_path, fsync_=True), workers_=2, queue_size_=1
+    )
+    for number in range(20):
+        writer.write(f"posts/post-{number}/index.html", f"post {number}")
+    writer.write("feed.json", b"{}")
+    writer.flush()
+
+    assert Path(tmp_path, "posts/post-7/index.html").read_text() == "post 7"
+    assert (writer.written, writer.bytes) == (21, 132)
+
+    # folders removed after they were created are created again
+    shutil.rmtree(Path(tmp_path, "posts"))
+    writer.write("posts/post-1/index.html", "again")
+    writer.close()
+
+    assert Path(tmp_path, "posts/post-1/index.html").read_text() == "again"
+    assert writer.threads == []
+
+
+def test_write_errors_are_raised(tmp_path):
+    Path(tmp_path, "index.html").mkdir()
+    writer = OutputWriter(target_=DirectoryTarget(root_=tmp_path))
+    writer.write("index.html", "home")
+
+    with pytest.raises(OSError, match="writing output/index.html failed"):
+        writer.close()